@@ -0,0 +1,65 @@
+import os
+import json
+
+import pytest
+
+from .harness import BenchmarkRun, compare_runs
+
+
+def get_sizes(name, default):
+    return [int(size) for size in os.environ.get(name, default).split(',')]
+
+
+@pytest.fixture
+def data_fixture():
+    from tests.fixtures import Fixtures
+    return Fixtures()
+
+
+def pytest_configure(config):
+    config.benchmark_run = BenchmarkRun()
+
+
+@pytest.fixture(scope='session')
+def benchmark_run(request):
+    return request.config.benchmark_run
+
+
+@pytest.fixture
+def benchmark_sizes():
+    """
+    The sizes of the benchmarked tables can be changed with the BENCHMARK_FIELDS,
+    BENCHMARK_ROWS and BENCHMARK_REPEAT environment variables.
+    """
+
+    return {
+        'field_counts': get_sizes('BENCHMARK_FIELDS', '10,100,500'),
+        'row_counts': get_sizes('BENCHMARK_ROWS', '10000'),
+        'repeat': int(os.environ.get('BENCHMARK_REPEAT', '10'))
+    }
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Writes the results to the file in the BENCHMARK_OUTPUT environment variable. If
+    BENCHMARK_BASELINE points to the results of an earlier run, the session fails when
+    a result is more than BENCHMARK_TOLERANCE slower.
+    """
+
+    run = session.config.benchmark_run
+    if not run.results:
+        return
+
+    run.write(os.environ.get('BENCHMARK_OUTPUT', 'benchmark-results.json'))
+
+    baseline_path = os.environ.get('BENCHMARK_BASELINE')
+    if baseline_path:
+        with open(baseline_path) as file:
+            baseline = json.load(file)
+        tolerance = float(os.environ.get('BENCHMARK_TOLERANCE', '0.2'))
+        regressions = compare_runs(baseline, run.to_dict(), tolerance)
+        for baseline_result, result in regressions:
+            print(f'Regression in {result["name"]} {result["params"]}: '
+                  f'{baseline_result["median"]:.4f}s -> {result["median"]:.4f}s')
+        if regressions:
+            session.exitstatus = 1
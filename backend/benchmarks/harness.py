@@ -0,0 +1,160 @@
+import sys
+import json
+import time
+import platform
+import statistics
+import subprocess
+from datetime import datetime, timezone
+
+import django
+from django.db import connection, connections
+from django.test.utils import CaptureQueriesContext
+
+
+class BenchmarkRun:
+    """
+    Collects the results of the benchmarks of one run, so that they can be written to a
+    JSON file and compared with the results of another run.
+
+    Example:
+        run = BenchmarkRun()
+        run.measure('get_model', table.get_model, repeat=10, fields=100, rows=10000)
+        run.write('results.json')
+    """
+
+    def __init__(self):
+        self.results = []
+        self.meta = get_environment()
+
+    def measure(self, name, func, repeat=10, setup=None, using=None, **params):
+        """
+        Calls the function `repeat` times and records the timings and the amount of
+        SQL queries of one call.
+
+        :param name: The name of the measured path.
+        :type name: str
+        :param func: The function that must be measured.
+        :type func: function
+        :param repeat: The amount of times the function is called.
+        :type repeat: int
+        :param setup: If provided, it is called before every call of the function
+                      without being measured. Its return value is passed to the
+                      function.
+        :type setup: function or None
+        :param using: The connection alias of which the queries are counted, by default
+                      the default connection.
+        :type using: str or None
+        :param params: The parameters of the benchmark, for example the amount of
+                       fields and rows, that identify the result.
+        :type params: dict
+        :return: The recorded result.
+        :rtype: dict
+        """
+
+        timings = []
+        queries = 0
+        captured_connection = connections[using] if using else connection
+
+        for index in range(repeat):
+            args = (setup(),) if setup else ()
+            with CaptureQueriesContext(captured_connection) as captured:
+                start = time.perf_counter()
+                func(*args)
+                timings.append(time.perf_counter() - start)
+            queries = len(captured)
+
+        result = {
+            'name': name,
+            'params': params,
+            'repeat': repeat,
+            'queries': queries,
+            'min': min(timings),
+            'median': statistics.median(timings),
+            'mean': statistics.mean(timings),
+            'max': max(timings)
+        }
+        self.record(result)
+        return result
+
+    def record(self, result):
+        """
+        Adds a result that has been measured in another way, it must at least contain
+        the name, params and median keys.
+
+        :param result: The result.
+        :type result: dict
+        """
+
+        self.results.append(result)
+        params = ', '.join(f'{key}={value}' for key, value in result['params'].items())
+        print(f'{result["name"]} ({params}): {result["median"] * 1000:.2f} ms',
+              file=sys.stderr)
+
+    def to_dict(self):
+        return {'meta': self.meta, 'results': self.results}
+
+    def write(self, path):
+        with open(path, 'w') as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+
+def get_result_key(result):
+    return result['name'], tuple(sorted(result['params'].items()))
+
+
+def compare_runs(baseline, current, tolerance=0.2):
+    """
+    Compares the results of two runs and returns the results of which the median is
+    more than `tolerance` slower than the same result of the baseline.
+
+    :param baseline: The results of the baseline run as written to JSON.
+    :type baseline: dict
+    :param current: The results of the current run as written to JSON.
+    :type current: dict
+    :param tolerance: The fraction the median may be slower than the baseline.
+    :type tolerance: float
+    :return: A list containing a tuple with the result of the baseline and the current
+             result for every regression.
+    :rtype: list
+    """
+
+    baseline_results = {
+        get_result_key(result): result
+        for result in baseline['results']
+    }
+
+    regressions = []
+    for result in current['results']:
+        baseline_result = baseline_results.get(get_result_key(result))
+        if (
+            baseline_result and
+            result['median'] > baseline_result['median'] * (1 + tolerance)
+        ):
+            regressions.append((baseline_result, result))
+
+    return regressions
+
+
+def get_environment():
+    """Describes the environment of the run so that runs can be compared honestly."""
+
+    try:
+        commit = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'started': datetime.now(timezone.utc).isoformat(),
+        'commit': commit,
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'machine': platform.machine()
+    }
+
+
+def get_postgresql_version(using='default'):
+    with connections[using].cursor() as cursor:
+        cursor.execute('SHOW server_version')
+        return cursor.fetchone()[0]
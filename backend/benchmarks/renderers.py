@@ -0,0 +1,60 @@
+from rest_framework.renderers import JSONRenderer
+
+from baserow.api.v0.renderers import FastJSONRenderer
+from baserow.contrib.database.api.v0.rows.serializers import (
+    get_row_serializer_class, RowSerializer
+)
+
+from .tables import create_benchmark_table
+
+
+RENDERERS = (
+    ('json_renderer', JSONRenderer),
+    ('fast_json_renderer', FastJSONRenderer)
+)
+"""The name of the result and the renderer class that are compared."""
+
+
+def run_renderer_benchmarks(run, fixtures, field_counts, row_count=1000, repeat=10):
+    """
+    Measures how long it takes to render a response containing `row_count`
+    serialized rows with the JSONRenderer of Django REST framework and with the
+    FastJSONRenderer, for tables with the provided amounts of fields. It fails if the
+    renderers don't produce exactly the same bytes.
+
+    :param run: The run in which the results are recorded.
+    :type run: BenchmarkRun
+    :param fixtures: The fixtures of the tests that are used to create the tables.
+    :type fixtures: Fixtures
+    :param field_counts: The amounts of fields of the tables.
+    :type field_counts: list
+    :param row_count: The amount of rows in the rendered response.
+    :type row_count: int
+    :param repeat: The amount of times every renderer is measured.
+    :type repeat: int
+    """
+
+    user = fixtures.create_user()
+
+    for field_count in field_counts:
+        table = create_benchmark_table(fixtures, field_count, row_count, user)
+        model = table.get_model()
+        serializer_class = get_row_serializer_class(model, RowSerializer)
+        queryset = model.objects.all().order_by('id')
+        data = {
+            'count': row_count,
+            'next': None,
+            'previous': None,
+            'results': serializer_class(queryset, many=True).data
+        }
+        params = {'fields': field_count, 'rows': row_count}
+
+        rendered = {}
+        for name, renderer_class in RENDERERS:
+            renderer = renderer_class()
+            run.measure(name, lambda: renderer.render(data), repeat, **params)
+            rendered[name] = renderer.render(data)
+
+        assert rendered['json_renderer'] == rendered['fast_json_renderer'], (
+            f'The renderers produce different output for {field_count} fields.'
+        )
@@ -0,0 +1,109 @@
+from django.shortcuts import reverse
+
+from rest_framework.test import APIClient
+
+from baserow.contrib.database.api.v0.rows.serializers import (
+    get_row_serializer_class, RowSerializer
+)
+from baserow.contrib.database.fields.models import (
+    NUMBER_TYPE_DECIMAL, TextField, BooleanField
+)
+from baserow.contrib.database.rows.handler import RowHandler
+
+from .harness import get_postgresql_version
+from .tables import create_benchmark_table
+
+
+GRID_PAGE_SIZE = 100
+
+
+def get_row_values(table):
+    """Returns valid values for all the fields of the table with the field id as key."""
+
+    values = {}
+
+    for field in table.field_set.all():
+        field = field.specific
+        if isinstance(field, TextField):
+            values[field.id] = 'Benchmark'
+        elif isinstance(field, BooleanField):
+            values[field.id] = True
+        elif field.number_type == NUMBER_TYPE_DECIMAL:
+            values[field.id] = '10.50'
+        else:
+            values[field.id] = 10
+
+    return values
+
+
+def run_row_benchmarks(run, fixtures, field_counts, row_counts, repeat=10):
+    """
+    Measures the hot paths of the rows and the grid view for tables with every
+    combination of the provided amount of fields and rows.
+
+    :param run: The run in which the results are recorded.
+    :type run: BenchmarkRun
+    :param fixtures: The fixtures of the tests that are used to create the tables.
+    :type fixtures: Fixtures
+    :param field_counts: The amounts of fields of the tables.
+    :type field_counts: list
+    :param row_counts: The amounts of rows of the tables.
+    :type row_counts: list
+    :param repeat: The amount of times every path is measured.
+    :type repeat: int
+    """
+
+    run.meta.setdefault('postgresql', get_postgresql_version())
+    user, token = fixtures.create_user_and_token()
+    handler = RowHandler()
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'JWT {token}')
+
+    for field_count in field_counts:
+        for row_count in row_counts:
+            table = create_benchmark_table(fixtures, field_count, row_count, user)
+            grid = fixtures.create_grid_view(table=table)
+            params = {'fields': field_count, 'rows': row_count}
+            values = get_row_values(table)
+            primary_field = table.field_set.get(primary=True)
+            update_values = {primary_field.id: values[primary_field.id]}
+
+            run.measure('get_model', table.get_model, repeat, **params)
+
+            model = table.get_model()
+            run.measure(
+                'get_row_serializer_class',
+                lambda: get_row_serializer_class(model, RowSerializer),
+                repeat, **params
+            )
+            run.measure(
+                'create_row',
+                lambda: handler.create_row(user, table, values),
+                repeat, using=table.shard, **params
+            )
+            run.measure(
+                'update_row',
+                lambda: handler.update_row(user, table, 1, update_values),
+                repeat, using=table.shard, **params
+            )
+            run.measure(
+                'delete_row',
+                lambda row: handler.delete_row(user, table, row.id),
+                repeat, setup=lambda: model.objects.create(), using=table.shard,
+                **params
+            )
+
+            url = reverse('api_v0:database:views:grid:list',
+                          kwargs={'view_id': grid.id})
+            pages = {
+                'grid_view_shallow_page': (0, 'rows'),
+                'grid_view_deep_page': (max(row_count - GRID_PAGE_SIZE, 0), 'rows'),
+                'grid_view_columns_page': (0, 'columns')
+            }
+            for name, (offset, layout) in pages.items():
+                def get_page():
+                    response = client.get(url, {'limit': GRID_PAGE_SIZE,
+                                                'offset': offset, 'layout': layout})
+                    assert response.status_code == 200, response.content
+
+                run.measure(name, get_page, repeat, using=table.shard, **params)
@@ -0,0 +1,115 @@
+"""
+Runs the benchmarks without pytest against a test database that is created on the
+configured PostgreSQL server and destroyed afterwards.
+
+Example:
+    cd backend
+    python -m benchmarks.run rows --fields 10,100 --rows 10000,1000000 \\
+        --output results.json --baseline previous.json
+"""
+
+import os
+import sys
+import json
+import argparse
+
+import django
+
+
+SUITES = ('rows', 'schema', 'renderers')
+
+
+def parse_sizes(value):
+    return [int(size) for size in value.split(',')]
+
+
+def parse_args(argv=None):
+    """
+    Parses the command line arguments. If no suites are provided all of them are run.
+
+    :param argv: The arguments, defaults to the arguments of the command.
+    :type argv: list or None
+    :return: The parsed arguments.
+    :rtype: Namespace
+    """
+
+    parser = argparse.ArgumentParser(description='Runs the Baserow benchmarks.')
+    parser.add_argument('suites', nargs='*', metavar='suite',
+                        help=f'The benchmark suites that must be run, one of '
+                             f'{", ".join(SUITES)}. All of them by default.')
+    parser.add_argument('--fields', type=parse_sizes, default=[10, 100, 500],
+                        help='Comma separated amounts of fields of the tables.')
+    parser.add_argument('--rows', type=parse_sizes, default=[10000],
+                        help='Comma separated amounts of rows of the tables.')
+    parser.add_argument('--repeat', type=int, default=10,
+                        help='The amount of times every path is measured.')
+    parser.add_argument('--output', default='benchmark-results.json',
+                        help='The JSON file to which the results are written.')
+    parser.add_argument('--baseline',
+                        help='The JSON file of an earlier run, the command fails if '
+                             'a result is slower than in that run.')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='The fraction a result may be slower than the baseline.')
+    args = parser.parse_args(argv)
+
+    # The suites are validated here because argparse checks the whole default list
+    # against the choices if no suites are provided.
+    for suite in args.suites:
+        if suite not in SUITES:
+            parser.error(f'invalid suite: {suite} (choose from {", ".join(SUITES)})')
+
+    args.suites = args.suites or list(SUITES)
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'baserow.config.settings.test')
+    django.setup()
+
+    from django.test.utils import (
+        setup_test_environment, teardown_test_environment, setup_databases,
+        teardown_databases
+    )
+
+    from tests.fixtures import Fixtures
+
+    from .harness import BenchmarkRun, compare_runs
+    from .rows import run_row_benchmarks
+    from .schema import run_schema_benchmarks
+    from .renderers import run_renderer_benchmarks
+
+    setup_test_environment()
+    databases = setup_databases(verbosity=1, interactive=False)
+    run = BenchmarkRun()
+
+    try:
+        fixtures = Fixtures()
+        if 'rows' in args.suites:
+            run_row_benchmarks(run, fixtures, args.fields, args.rows, args.repeat)
+        if 'schema' in args.suites:
+            run_schema_benchmarks(run, fixtures, args.fields, args.rows, args.repeat)
+        if 'renderers' in args.suites:
+            run_renderer_benchmarks(run, fixtures, args.fields, repeat=args.repeat)
+    finally:
+        teardown_databases(databases, verbosity=1)
+        teardown_test_environment()
+
+    run.write(args.output)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions = compare_runs(baseline, run.to_dict(), args.tolerance)
+        for baseline_result, result in regressions:
+            print(f'Regression in {result["name"]} {result["params"]}: '
+                  f'{baseline_result["median"]:.4f}s -> {result["median"]:.4f}s')
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,285 @@
+import time
+import threading
+import statistics
+
+import psycopg2
+
+from django.db import connections
+
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.table.handler import TableHandler
+
+from .harness import get_postgresql_version
+from .tables import create_benchmark_table
+
+
+class LockProbe(threading.Thread):
+    """
+    Repeatedly selects from a table on a separate connection, like the other users of
+    the table would, and records how long each select had to wait. A select has to
+    wait while a schema operation holds a lock that conflicts with reading the
+    table, so the longest wait is the time the table was blocked for readers.
+    """
+
+    def __init__(self, connection, db_table, interval=0.001):
+        super().__init__(daemon=True)
+        self.connection_params = connection.get_connection_params()
+        self.query = f'SELECT 1 FROM {connection.ops.quote_name(db_table)} LIMIT 0'
+        self.interval = interval
+        self.longest_wait = 0
+        self.started = threading.Event()
+        self.stopped = threading.Event()
+
+    def run(self):
+        connection = psycopg2.connect(**self.connection_params)
+        connection.autocommit = True
+
+        try:
+            with connection.cursor() as cursor:
+                while not self.stopped.is_set():
+                    start = time.perf_counter()
+                    try:
+                        cursor.execute(self.query)
+                    except psycopg2.Error:
+                        # The table does not exist (anymore).
+                        pass
+                    self.longest_wait = max(self.longest_wait,
+                                            time.perf_counter() - start)
+                    self.started.set()
+                    time.sleep(self.interval)
+        finally:
+            self.started.set()
+            connection.close()
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+class SchemaObserver:
+    """
+    Observes a schema operation on a table. It measures the wall time, the lock hold
+    time as experienced by a concurrent reader of the table and whether the table
+    has been rewritten. A table has been rewritten if PostgreSQL has given it a new
+    data file. If no table is provided only the wall time is measured.
+    """
+
+    def __init__(self, table=None):
+        self.connection = connections[table.shard if table else 'default']
+        self.db_table = table.get_database_table_name() if table else None
+        self.probe = None
+
+    def get_relfilenode(self):
+        if not self.db_table:
+            return None
+
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT relfilenode FROM pg_class WHERE oid = to_regclass(%s)',
+                [self.connection.ops.quote_name(self.db_table)]
+            )
+            row = cursor.fetchone()
+            return row[0] if row else None
+
+    def __enter__(self):
+        self.relfilenode_before = self.get_relfilenode()
+        if self.db_table:
+            self.probe = LockProbe(self.connection, self.db_table)
+            self.probe.start()
+            self.probe.started.wait()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.end = time.perf_counter()
+        if self.probe:
+            self.probe.stop()
+        self.relfilenode_after = self.get_relfilenode()
+
+    @property
+    def wall_time(self):
+        return self.end - self.start
+
+    @property
+    def lock_hold_time(self):
+        return self.probe.longest_wait if self.probe else 0
+
+    @property
+    def rewritten(self):
+        return (
+            self.relfilenode_before is not None and
+            self.relfilenode_after is not None and
+            self.relfilenode_before != self.relfilenode_after
+        )
+
+
+def measure_schema_operation(run, name, setup, func, repeat, **params):
+    """
+    Measures a schema operation `repeat` times and records the wall time, lock hold
+    time and the amount of times the table was rewritten.
+
+    :param run: The run in which the result is recorded.
+    :type run: BenchmarkRun
+    :param name: The name of the operation.
+    :type name: str
+    :param setup: Function that prepares one measurement without being measured. It
+                  must return the table that is changed by the operation and the
+                  argument that is passed to the operation.
+    :type setup: function
+    :param func: The operation that must be measured.
+    :type func: function
+    :param repeat: The amount of times the operation is measured.
+    :type repeat: int
+    :param params: The parameters that identify the result.
+    :type params: dict
+    :return: The recorded result.
+    :rtype: dict
+    """
+
+    wall_times = []
+    lock_hold_times = []
+    rewrites = 0
+
+    for index in range(repeat):
+        table, argument = setup()
+        with SchemaObserver(table) as observer:
+            func(argument)
+        wall_times.append(observer.wall_time)
+        lock_hold_times.append(observer.lock_hold_time)
+        rewrites += observer.rewritten
+
+    result = {
+        'name': name,
+        'params': params,
+        'repeat': repeat,
+        'min': min(wall_times),
+        'median': statistics.median(wall_times),
+        'mean': statistics.mean(wall_times),
+        'max': max(wall_times),
+        'lock_hold_median': statistics.median(lock_hold_times),
+        'lock_hold_max': max(lock_hold_times),
+        'rewrites': rewrites
+    }
+    run.record(result)
+    return result
+
+
+def fill_text_values(table, field):
+    """Fills the column of the text field with numbers as text for every row."""
+
+    connection = connections[table.shard]
+    quote_name = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'UPDATE {quote_name(table.get_database_table_name())} '
+            f'SET {quote_name(field.db_column)} = (id % 100000)::text'
+        )
+
+
+def run_schema_benchmarks(run, fixtures, field_counts, row_counts, repeat=10):
+    """
+    Measures the schema operations of the field and table handlers on tables with
+    every combination of the provided amount of fields and rows. The operations must
+    not run inside a transaction, otherwise the locks are held until it commits.
+
+    :param run: The run in which the results are recorded.
+    :type run: BenchmarkRun
+    :param fixtures: The fixtures of the tests that are used to create the tables.
+    :type fixtures: Fixtures
+    :param field_counts: The amounts of fields of the tables.
+    :type field_counts: list
+    :param row_counts: The amounts of rows of the tables.
+    :type row_counts: list
+    :param repeat: The amount of times every operation is measured.
+    :type repeat: int
+    """
+
+    run.meta.setdefault('postgresql', get_postgresql_version())
+    user = fixtures.create_user()
+    database = fixtures.create_database_application(user=user)
+    field_handler = FieldHandler()
+    table_handler = TableHandler()
+
+    measure_schema_operation(
+        run, 'create_table',
+        lambda: (None, None),
+        lambda argument: table_handler.create_table(user, database, name='Table'),
+        repeat
+    )
+
+    for field_count in field_counts:
+        for row_count in row_counts:
+            params = {'fields': field_count, 'rows': row_count}
+            table = create_benchmark_table(fixtures, field_count, row_count, user)
+
+            def create_text_field():
+                return fixtures.create_text_field(table=table, name='Text')
+
+            def create_filled_text_field():
+                field = create_text_field()
+                fill_text_values(table, field)
+                return field
+
+            measure_schema_operation(
+                run, 'create_field',
+                lambda: (table, None),
+                lambda argument: field_handler.create_field(
+                    user, table, 'text', name='Created', text_default='Default'
+                ),
+                repeat, **params
+            )
+            measure_schema_operation(
+                run, 'update_field_name',
+                lambda: (table, create_text_field()),
+                lambda field: field_handler.update_field(user, field, name='Renamed'),
+                repeat, **params
+            )
+            measure_schema_operation(
+                run, 'update_field_default',
+                lambda: (table, create_text_field()),
+                lambda field: field_handler.update_field(user, field,
+                                                         text_default='Changed'),
+                repeat, **params
+            )
+            measure_schema_operation(
+                run, 'update_field_text_to_number',
+                lambda: (table, create_filled_text_field()),
+                lambda field: field_handler.update_field(user, field, 'number'),
+                repeat, **params
+            )
+            measure_schema_operation(
+                run, 'update_field_number_to_text',
+                lambda: (table, fixtures.create_number_field(table=table)),
+                lambda field: field_handler.update_field(user, field, 'text'),
+                repeat, **params
+            )
+            measure_schema_operation(
+                run, 'delete_field',
+                lambda: (table, create_text_field()),
+                lambda field: field_handler.delete_field(user, field),
+                repeat, **params
+            )
+
+            def setup_table():
+                table = create_benchmark_table(fixtures, field_count, row_count, user)
+                return table, table
+
+            measure_schema_operation(
+                run, 'delete_table',
+                setup_table,
+                lambda table: table_handler.delete_table(user, table),
+                repeat, **params
+            )
+
+            def setup_pending_drop():
+                table = create_benchmark_table(fixtures, field_count, row_count, user)
+                table_handler.delete_table(user, table)
+                return table, None
+
+            # The database table is dropped in the background after it is deleted.
+            measure_schema_operation(
+                run, 'drop_pending_tables',
+                setup_pending_drop,
+                lambda argument: table_handler.drop_pending_tables(),
+                repeat, **params
+            )
@@ -0,0 +1,109 @@
+from django.db import connections
+
+from baserow.contrib.database.fields.models import NUMBER_TYPE_DECIMAL
+
+
+FIELD_FACTORIES = (
+    ('create_text_field', {}),
+    ('create_number_field', {}),
+    ('create_boolean_field', {}),
+    ('create_number_field', {'number_type': NUMBER_TYPE_DECIMAL,
+                             'number_decimal_places': 2})
+)
+"""The fixture methods and kwargs that are used in turn to create the fields."""
+
+
+def get_value_expression(field):
+    """
+    Returns the SQL expression that generates the value of the field for the row with
+    number `i` in a generate_series. The percent signs are escaped because the
+    expression is used in a query with parameters.
+    """
+
+    field_type = field.specific_class.__name__
+
+    if field_type == 'TextField':
+        return "'Value ' || i"
+    elif field_type == 'BooleanField':
+        return 'i %% 2 = 0'
+    elif field.specific.number_type == NUMBER_TYPE_DECIMAL:
+        return '(i %% 100000) / 100.0'
+    else:
+        return 'i %% 100000'
+
+
+def create_benchmark_table(fixtures, field_count, row_count, user=None):
+    """
+    Creates a table with the provided amount of fields, of all the field types in
+    turn, and fills it with rows using the existing fixtures.
+
+    :param fixtures: The fixtures of the tests.
+    :type fixtures: Fixtures
+    :param field_count: The amount of fields of the table.
+    :type field_count: int
+    :param row_count: The amount of rows of the table.
+    :type row_count: int
+    :param user: The user that has access to the table. A new user is created if not
+                 provided.
+    :type user: User or None
+    :return: The created table.
+    :rtype: Table
+    """
+
+    if not user:
+        user = fixtures.create_user()
+
+    table = fixtures.create_database_table(
+        user=user, name=f'Benchmark {field_count} fields {row_count} rows'
+    )
+
+    for index in range(field_count):
+        method, kwargs = FIELD_FACTORIES[index % len(FIELD_FACTORIES)]
+        getattr(fixtures, method)(table=table, order=index, name=f'Field {index}',
+                                  primary=index == 0, **kwargs)
+
+    fill_table(table, row_count)
+    return table
+
+
+def fill_table(table, row_count, batch_size=100000):
+    """
+    Inserts rows into the table with generated values. The values are generated by
+    PostgreSQL so that millions of rows can be inserted in reasonable time.
+
+    :param table: The table that must be filled.
+    :type table: Table
+    :param row_count: The amount of rows that must be inserted.
+    :type row_count: int
+    :param batch_size: The amount of rows inserted per query.
+    :type batch_size: int
+    """
+
+    fields = [field.specific for field in table.field_set.all()]
+    connection = connections[table.shard]
+    quote_name = connection.ops.quote_name
+    columns = ', '.join(quote_name(field.db_column) for field in fields)
+    expressions = ', '.join(get_value_expression(field) for field in fields)
+    table_name = quote_name(table.get_database_table_name())
+
+    with connection.cursor() as cursor:
+        for start in range(1, row_count + 1, batch_size):
+            end = min(start + batch_size - 1, row_count)
+            if fields:
+                cursor.execute(
+                    f'INSERT INTO {table_name} ({columns}) '
+                    f'SELECT {expressions} FROM generate_series(%s, %s) i',
+                    [start, end]
+                )
+            else:
+                cursor.execute(
+                    f'INSERT INTO {table_name} (id) '
+                    f'SELECT i FROM generate_series(%s, %s) i',
+                    [start, end]
+                )
+        cursor.execute(
+            f"SELECT setval(pg_get_serial_sequence(%s, 'id'), "
+            f"COALESCE(MAX(id), 1)) FROM {table_name}",
+            [table.get_database_table_name()]
+        )
+        cursor.execute(f'ANALYZE {table_name}')
@@ -0,0 +1,10 @@
+import pytest
+
+from .renderers import run_renderer_benchmarks
+
+
+@pytest.mark.django_db
+def test_renderer_benchmarks(data_fixture, benchmark_run, benchmark_sizes):
+    run_renderer_benchmarks(benchmark_run, data_fixture,
+                            benchmark_sizes['field_counts'],
+                            repeat=benchmark_sizes['repeat'])
@@ -0,0 +1,8 @@
+import pytest
+
+from .rows import run_row_benchmarks
+
+
+@pytest.mark.django_db
+def test_row_benchmarks(data_fixture, benchmark_run, benchmark_sizes):
+    run_row_benchmarks(benchmark_run, data_fixture, **benchmark_sizes)
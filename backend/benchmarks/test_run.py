@@ -0,0 +1,30 @@
+import pytest
+
+from .run import main, parse_args, SUITES
+
+
+def test_parse_args():
+    args = parse_args([])
+    assert args.suites == list(SUITES)
+    assert args.fields == [10, 100, 500]
+    assert args.rows == [10000]
+
+    args = parse_args(['rows', 'renderers', '--fields', '10,20', '--rows', '5'])
+    assert args.suites == ['rows', 'renderers']
+    assert args.fields == [10, 20]
+    assert args.rows == [5]
+
+    with pytest.raises(SystemExit):
+        parse_args(['unknown'])
+
+
+def test_main_parses_args():
+    # The arguments are parsed before anything is set up, so invalid arguments and
+    # the help stop the command right away.
+    with pytest.raises(SystemExit) as e:
+        main(['--help'])
+    assert e.value.code == 0
+
+    with pytest.raises(SystemExit) as e:
+        main(['unknown'])
+    assert e.value.code == 2
@@ -0,0 +1,10 @@
+import pytest
+
+from .schema import run_schema_benchmarks
+
+
+# The schema operations must commit like they do in production, otherwise the locks
+# would be held until the end of the test.
+@pytest.mark.django_db(transaction=True)
+def test_schema_benchmarks(data_fixture, benchmark_run, benchmark_sizes):
+    run_schema_benchmarks(benchmark_run, data_fixture, **benchmark_sizes)
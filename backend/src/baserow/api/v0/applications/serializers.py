@@ -23,7 +23,7 @@ class ApplicationSerializer(serializers.ModelSerializer):
     def get_type(self, instance):
         # It could be that the application related to the instance is already in the
         # context else we can call the specific_class property to find it.
-        application = self.context.get('application')
+        application = self.context.get('instance_type')
         if not application:
             application = application_type_registry.get_by_model(
                 instance.specific_class)
@@ -58,9 +58,6 @@ def get_application_serializer(instance, **kwargs):
     :rtype: ApplicationSerializer
     """
     application = application_type_registry.get_by_model(instance.specific_class)
-    serializer_class = application.instance_serializer_class
-
-    if not serializer_class:
-        serializer_class = ApplicationSerializer
-
-    return serializer_class(instance, context={'application': application}, **kwargs)
+    serializer_class = application.get_serializer_class(ApplicationSerializer)
+    return serializer_class(instance, context={'instance_type': application},
+                            **kwargs)
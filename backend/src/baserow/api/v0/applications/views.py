@@ -5,14 +5,16 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
-from baserow.api.v0.decorators import validate_body, map_exceptions
+from baserow.api.v0.decorators import validate_body, map_exceptions, query_budget
 from baserow.api.v0.errors import ERROR_USER_NOT_IN_GROUP
 from baserow.core.models import Group, Application
 from baserow.core.handler import CoreHandler
 from baserow.core.exceptions import UserNotInGroupError
+from baserow.core.registries import application_type_registry
 
 from .serializers import (
-    ApplicationCreateSerializer, ApplicationUpdateSerializer, get_application_serializer
+    ApplicationCreateSerializer, ApplicationUpdateSerializer,
+    ApplicationSerializer, get_application_serializer
 )
 
 
@@ -32,6 +34,7 @@ class ApplicationsView(APIView):
 
         return group
 
+    @query_budget(8)
     @map_exceptions({
         UserNotInGroupError: ERROR_USER_NOT_IN_GROUP
     })
@@ -50,12 +53,17 @@ class ApplicationsView(APIView):
         else:
             applications = applications.filter(group__users__in=[request.user])
 
-        data = [
-            get_application_serializer(application).data
-            for application in applications
-        ]
+        def enhance_queryset(model_class, queryset):
+            application = application_type_registry.get_by_model(model_class)
+            return application.enhance_queryset(queryset.select_related('group'))
+
+        data = application_type_registry.serialize_many(
+            applications, ApplicationSerializer,
+            per_content_type_queryset_hook=enhance_queryset
+        )
         return Response(data)
 
+    @query_budget(10)
     @transaction.atomic
     @validate_body(ApplicationCreateSerializer)
     @map_exceptions({
@@ -75,6 +83,7 @@ class ApplicationView(APIView):
     permission_classes = (IsAuthenticated,)
     core_handler = CoreHandler()
 
+    @query_budget(4)
     @map_exceptions({
         UserNotInGroupError: ERROR_USER_NOT_IN_GROUP
     })
@@ -91,6 +100,7 @@ class ApplicationView(APIView):
 
         return Response(get_application_serializer(application).data)
 
+    @query_budget(5)
     @transaction.atomic
     @validate_body(ApplicationUpdateSerializer)
     @map_exceptions({
@@ -108,6 +118,7 @@ class ApplicationView(APIView):
 
         return Response(get_application_serializer(application).data)
 
+    @query_budget(10)
     @transaction.atomic
     @map_exceptions({
         UserNotInGroupError: ERROR_USER_NOT_IN_GROUP
@@ -1,7 +1,6 @@
-from rest_framework import status
-from rest_framework.exceptions import APIException
-
-from .utils import get_request, validate_data, validate_data_custom_fields
+from .utils import (
+    get_request, validate_data, validate_data_custom_fields, map_api_exceptions
+)
 from .exceptions import RequestBodyValidationException
 
 
@@ -34,29 +33,8 @@ def map_exceptions(exceptions):
 
     def map_exceptions_decorator(func):
         def func_wrapper(*args, **kwargs):
-            try:
+            with map_api_exceptions(exceptions):
                 return func(*args, **kwargs)
-            except tuple(exceptions.keys()) as e:
-                value = exceptions.get(e.__class__)
-                status_code = status.HTTP_400_BAD_REQUEST
-                detail = ''
-
-                if isinstance(value, str):
-                    error = value
-                if isinstance(value, tuple):
-                    error = value[0]
-                    if len(value) > 1 and value[1] is not None:
-                        status_code = value[1]
-                    if len(value) > 2 and value[2] is not None:
-                        detail = value[2]
-
-                exc = APIException({
-                    'error': error,
-                    'detail': detail
-                })
-                exc.status_code = status_code
-
-                raise exc
         return func_wrapper
     return map_exceptions_decorator
 
@@ -153,3 +131,28 @@ def validate_body_custom_fields(registry, base_serializer_class=None,
             return func(*args, **kwargs)
         return func_wrapper
     return validate_decorator
+
+
+def query_budget(budget):
+    """
+    This decorator declares the maximum amount of SQL queries that the view method may
+    execute. The budget is enforced by the QueryBudgetMiddleware when the
+    QUERY_BUDGET_ENABLED setting is True. It must be the outermost decorator of the
+    method because the other decorators don't preserve the attribute.
+
+    Example:
+        @query_budget(lambda request: 5 + int(request.GET.get('size', 100)))
+        @map_exceptions({SomeException: 'ERROR_1'})
+        def get(self, request):
+            ...
+
+    :param budget: The maximum amount of queries or a function that is called with the
+                   request and returns it, which makes it possible to for example
+                   depend on the requested page size.
+    :type budget: int or function
+    """
+
+    def query_budget_decorator(func):
+        func.query_budget = budget
+        return func
+    return query_budget_decorator
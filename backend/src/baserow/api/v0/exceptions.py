@@ -8,3 +8,10 @@ class RequestBodyValidationException(APIException):
             'detail': detail
         }, code=code)
         self.status_code = 400
+
+
+class QueryBudgetExceeded(AssertionError):
+    """
+    Raised when a view executed more SQL queries than declared by its query budget
+    and the QUERY_BUDGET_ACTION setting is 'raise'.
+    """
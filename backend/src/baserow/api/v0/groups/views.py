@@ -5,7 +5,7 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
-from baserow.api.v0.decorators import validate_body, map_exceptions
+from baserow.api.v0.decorators import validate_body, map_exceptions, query_budget
 from baserow.api.v0.errors import ERROR_USER_NOT_IN_GROUP
 from baserow.core.models import Group, GroupUser
 from baserow.core.handler import CoreHandler
@@ -18,6 +18,7 @@ class GroupsView(APIView):
     permission_classes = (IsAuthenticated,)
     core_handler = CoreHandler()
 
+    @query_budget(2)
     def get(self, request):
         """Responds with a list of serialized groups where the user is part of."""
 
@@ -25,6 +26,7 @@ class GroupsView(APIView):
         serializer = GroupUserSerializer(groups, many=True)
         return Response(serializer.data)
 
+    @query_budget(4)
     @transaction.atomic
     @validate_body(GroupSerializer)
     def post(self, request, data):
@@ -51,6 +53,7 @@ class GroupView(APIView):
 
         return group_user
 
+    @query_budget(4)
     @transaction.atomic
     @validate_body(GroupSerializer)
     @map_exceptions({
@@ -65,6 +68,7 @@ class GroupView(APIView):
 
         return Response(GroupUserSerializer(group_user).data)
 
+    @query_budget(8)
     @transaction.atomic
     @map_exceptions({
         UserNotInGroupError: ERROR_USER_NOT_IN_GROUP
@@ -81,6 +85,7 @@ class GroupOrderView(APIView):
     permission_classes = (IsAuthenticated,)
     core_handler = CoreHandler()
 
+    @query_budget(4)
     @validate_body(OrderGroupsSerializer)
     def post(self, request, data):
         """Updates to order of some groups for a user."""
@@ -0,0 +1,3 @@
+ERROR_JOB_DOES_NOT_EXIST = ('ERROR_JOB_DOES_NOT_EXIST', 404,
+                            'The requested job does not exist.')
+ERROR_JOB_ALREADY_FINISHED = 'ERROR_JOB_ALREADY_FINISHED'
@@ -0,0 +1,17 @@
+from django.utils.functional import lazy
+
+from rest_framework import serializers
+
+from baserow.core.jobs.models import Job
+from baserow.core.jobs.registries import job_type_registry
+
+
+class JobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Job
+        fields = ('id', 'type', 'state', 'progress_percentage', 'result', 'error',
+                  'created_on', 'started_on', 'finished_on')
+
+
+class CreateJobSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(choices=lazy(job_type_registry.get_types, list)())
@@ -0,0 +1,12 @@
+from django.conf.urls import url
+
+from .views import JobsView, JobView, CancelJobView
+
+
+app_name = 'baserow.api.v0.jobs'
+
+urlpatterns = [
+    url(r'^$', JobsView.as_view(), name='list'),
+    url(r'(?P<job_id>[0-9]+)/$', JobView.as_view(), name='item'),
+    url(r'(?P<job_id>[0-9]+)/cancel/$', CancelJobView.as_view(), name='cancel'),
+]
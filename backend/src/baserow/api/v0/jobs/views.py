@@ -0,0 +1,77 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+
+from baserow.api.v0.decorators import validate_body, map_exceptions, query_budget
+from baserow.api.v0.utils import validate_data, map_api_exceptions
+from baserow.core.jobs.models import Job
+from baserow.core.jobs.handler import JobHandler
+from baserow.core.jobs.registries import job_type_registry
+from baserow.core.jobs.exceptions import JobDoesNotExist, JobAlreadyFinished
+
+from .errors import ERROR_JOB_DOES_NOT_EXIST, ERROR_JOB_ALREADY_FINISHED
+from .serializers import JobSerializer, CreateJobSerializer
+
+
+class JobsView(APIView):
+    permission_classes = (IsAuthenticated,)
+    job_handler = JobHandler()
+
+    @query_budget(2)
+    def get(self, request):
+        """Responds with a list of the jobs that have been created by the user."""
+
+        jobs = Job.objects.filter(user=request.user)
+        serializer = JobSerializer(jobs, many=True)
+        return Response(serializer.data)
+
+    @query_budget(4)
+    @validate_body(CreateJobSerializer)
+    def post(self, request, data):
+        """
+        Creates a new job that is executed in the background. The job is returned
+        immediately so that its progress can be polled via the job item endpoint.
+        """
+
+        job_type = job_type_registry.get(data['type'])
+        values = validate_data(job_type.serializer_class, request.data)
+
+        with map_api_exceptions(job_type.api_exceptions_map):
+            job = self.job_handler.create_job(request.user, job_type.type, **values)
+
+        return Response(JobSerializer(job).data, status=202)
+
+
+class JobView(APIView):
+    permission_classes = (IsAuthenticated,)
+    job_handler = JobHandler()
+
+    @query_budget(2)
+    @map_exceptions({
+        JobDoesNotExist: ERROR_JOB_DOES_NOT_EXIST
+    })
+    def get(self, request, job_id):
+        """Responds with the state and progress of the job."""
+
+        job = self.job_handler.get_job(request.user, job_id)
+        return Response(JobSerializer(job).data)
+
+
+class CancelJobView(APIView):
+    permission_classes = (IsAuthenticated,)
+    job_handler = JobHandler()
+
+    @query_budget(4)
+    @map_exceptions({
+        JobDoesNotExist: ERROR_JOB_DOES_NOT_EXIST,
+        JobAlreadyFinished: ERROR_JOB_ALREADY_FINISHED
+    })
+    def post(self, request, job_id):
+        """
+        Cancels the job. A pending job is cancelled immediately, a running job is
+        cancelled as soon as it reports its progress.
+        """
+
+        job = self.job_handler.get_job(request.user, job_id)
+        job = self.job_handler.cancel_job(request.user, job)
+        return Response(JobSerializer(job).data)
@@ -0,0 +1,92 @@
+import logging
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from .exceptions import QueryBudgetExceeded
+
+
+logger = logging.getLogger(__name__)
+
+IGNORED_STATEMENTS = ('SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO SAVEPOINT')
+"""
+Savepoints are not counted because they depend on whether the view runs inside an
+outer transaction, like it does in the tests.
+"""
+
+
+def get_query_budget(view_func, request):
+    """
+    Returns the query budget that the method of the API view that handles the request
+    declares with the query_budget decorator.
+
+    :param view_func: The resolved view function.
+    :type view_func: function
+    :param request: The request that is handled.
+    :type request: HttpRequest
+    :return: The maximum amount of queries or None if no budget is declared.
+    :rtype: int or None
+    """
+
+    view_class = getattr(view_func, 'cls', None)
+    method = getattr(view_class, request.method.lower(), None)
+    budget = getattr(method, 'query_budget', None)
+
+    if callable(budget):
+        budget = budget(request)
+
+    return budget
+
+
+class QueryBudgetMiddleware:
+    """
+    Counts the SQL queries that the API views execute on all the database connections
+    and compares them with the budget they declare with the query_budget decorator.
+    If a view exceeds its budget an exception is raised or a warning is logged,
+    containing the executed queries. It is only active if the QUERY_BUDGET_ENABLED
+    setting is True.
+    """
+
+    def __init__(self, get_response):
+        if not settings.QUERY_BUDGET_ENABLED:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = []
+
+        def execute_wrapper(execute, sql, params, many, context):
+            if not sql.lstrip().upper().startswith(IGNORED_STATEMENTS):
+                queries.append(sql)
+            return execute(sql, params, many, context)
+
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(execute_wrapper))
+            response = self.get_response(request)
+
+        budget = getattr(request, 'query_budget', None)
+        if budget is not None and len(queries) > budget:
+            self.exceeded(request, budget, queries)
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.query_budget = get_query_budget(view_func, request)
+
+    def exceeded(self, request, budget, queries):
+        view_name = request.resolver_match.view_name
+        message = (
+            f'{request.method} {view_name} executed {len(queries)} queries, the budget '
+            f'is {budget}:\n' + '\n'.join(
+                f'{index}. {sql}' for index, sql in enumerate(queries, 1)
+            )
+        )
+
+        if settings.QUERY_BUDGET_ACTION == 'raise':
+            raise QueryBudgetExceeded(message)
+
+        logger.warning(message)
@@ -0,0 +1,77 @@
+from django.conf import settings
+
+from rest_framework.renderers import JSONRenderer, BrowsableAPIRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+ORJSON_OPTIONS = (
+    (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson else 0
+)
+"""
+The non string keys are converted to strings like the standard library does. The
+dates and times are passed to the default function so that they are formatted in the
+same way as Django REST framework does.
+"""
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Renders the JSON of the JSONRenderer of Django REST framework, but encodes it with
+    orjson, which is many times faster for large responses like pages of rows. The
+    values that orjson doesn't support natively, like decimals, dates and lazy strings,
+    are converted by the encoder of Django REST framework. It falls back to the
+    JSONRenderer if orjson is not installed, if the FAST_JSON_RENDERER setting is
+    disabled, if indented or non compact output is requested or if orjson is not able
+    to encode the data.
+
+    The output of floats is not always identical. Some floats are notated
+    differently, for example 1e16 instead of 1e+16 and 0.00001 instead of 1e-05, which
+    are the same numbers when parsed. NaN and infinite floats are encoded as null,
+    while the JSONRenderer fails on them. Floats can't be detected without walking
+    through the whole payload, which takes longer than rendering it with the
+    JSONRenderer, and the row field types don't produce them, so the renderer is
+    only meant for payloads with rows.
+
+    Example:
+        class RowsView(APIView):
+            renderer_classes = ROW_RENDERER_CLASSES
+    """
+
+    encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return bytes()
+
+        if (
+            not orjson or
+            not settings.FAST_JSON_RENDERER or
+            self.ensure_ascii or
+            not self.compact or
+            self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            rendered = orjson.dumps(data, default=self.encoder.default,
+                                    option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # For example integers that don't fit in 64 bits.
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Like the JSONRenderer, the line and paragraph separators are escaped so that
+        # the output is a strict JavaScript subset.
+        return rendered.replace(
+            b'\xe2\x80\xa8', b'\\u2028'
+        ).replace(
+            b'\xe2\x80\xa9', b'\\u2029'
+        )
+
+
+ROW_RENDERER_CLASSES = (FastJSONRenderer, BrowsableAPIRenderer)
+"""The renderer classes of the endpoints that respond with rows."""
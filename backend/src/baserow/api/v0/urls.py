@@ -5,6 +5,7 @@ from baserow.core.registries import application_type_registry
 from .user import urls as user_urls
 from .groups import urls as group_urls
 from .applications import urls as application_urls
+from .jobs import urls as job_urls
 
 
 app_name = 'baserow.api.v0'
@@ -12,5 +13,6 @@ app_name = 'baserow.api.v0'
 urlpatterns = [
     path('user/', include(user_urls, namespace='user')),
     path('groups/', include(group_urls, namespace='groups')),
-    path('applications/', include(application_urls, namespace='applications'))
+    path('applications/', include(application_urls, namespace='applications')),
+    path('jobs/', include(job_urls, namespace='jobs'))
 ] + application_type_registry.api_urls
@@ -5,7 +5,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework_jwt.settings import api_settings
 
-from baserow.api.v0.decorators import map_exceptions, validate_body
+from baserow.api.v0.decorators import map_exceptions, validate_body, query_budget
 from baserow.user.handler import UserHandler
 from baserow.user.exceptions import UserAlreadyExist
 
@@ -21,6 +21,7 @@ class UserView(APIView):
     permission_classes = (AllowAny,)
     user_handler = UserHandler()
 
+    @query_budget(3)
     @transaction.atomic
     @map_exceptions({
         UserAlreadyExist: ERROR_ALREADY_EXISTS
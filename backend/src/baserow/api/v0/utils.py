@@ -1,7 +1,13 @@
 from collections import defaultdict
+from contextlib import contextmanager
 
+from django.core.exceptions import ValidationError
+from django.utils.cache import get_conditional_response
 from django.utils.encoding import force_text
+from django.utils.http import quote_etag
 
+from rest_framework import status
+from rest_framework.exceptions import APIException
 from rest_framework.serializers import ModelSerializer
 from rest_framework.request import Request
 
@@ -10,6 +16,123 @@ from baserow.core.exceptions import InstanceTypeDoesNotExist
 from .exceptions import RequestBodyValidationException
 
 
+@contextmanager
+def map_api_exceptions(exceptions):
+    """
+    This context manager maps specific exceptions to a standard api response. It works
+    exactly the same as the map_exceptions decorator, but can be used when the mapping
+    is only known at runtime.
+
+    Example:
+      with map_api_exceptions({ SomeException: 'ERROR_1' }):
+          raise SomeException('This is a test')
+
+      HTTP/1.1 400
+      {
+        "error": "ERROR_1",
+        "detail": "This is a test"
+      }
+
+    :param exceptions: A dict containing the exception class as key and the error code
+                       or a tuple containing the error code, status code and detail as
+                       value.
+    :type exceptions: dict
+    """
+
+    try:
+        yield
+    except tuple(exceptions.keys()) as e:
+        value = exceptions.get(e.__class__)
+        status_code = status.HTTP_400_BAD_REQUEST
+        detail = ''
+
+        if isinstance(value, str):
+            error = value
+        if isinstance(value, tuple):
+            error = value[0]
+            if len(value) > 1 and value[1] is not None:
+                status_code = value[1]
+            if len(value) > 2 and value[2] is not None:
+                detail = value[2]
+
+        exc = APIException({
+            'error': error,
+            'detail': detail
+        })
+        exc.status_code = status_code
+
+        raise exc
+
+
+def serialize_validation_errors(errors):
+    """
+    Converts the errors of a serializer to a dict containing the message and code of
+    every error. The errors of nested serializers and fields, like a DictField with
+    a serializer as child, are nested in the same way.
+
+    :param errors: The errors of the serializer.
+    :type errors: dict, list or ErrorDetail
+    :return: The serialized errors.
+    :rtype: dict or list
+    """
+
+    if isinstance(errors, dict):
+        return {
+            key: serialize_validation_errors(value)
+            for key, value in errors.items()
+        }
+
+    if isinstance(errors, list):
+        return [serialize_validation_errors(error) for error in errors]
+
+    return {
+        'error': force_text(errors),
+        'code': errors.code
+    }
+
+
+def get_etag(*parts):
+    """
+    Builds a quoted entity tag from the provided parts, which must together identify
+    the version of the response. For example the table id and its schema version.
+
+    :param parts: The parts that identify the version of the response.
+    :type parts: str or int
+    :return: The quoted entity tag.
+    :rtype: str
+    """
+
+    return quote_etag('-'.join(str(part) for part in parts))
+
+
+def get_not_modified_response(request, etag):
+    """
+    Returns a 304 not modified response if the If-None-Match header of the request
+    matches with the provided entity tag. This must be checked before the response is
+    generated so that the client can use its cached version without the server doing
+    any work.
+
+    Example:
+        etag = get_etag('fields', table.id, table.schema_version)
+        not_modified = get_not_modified_response(request, etag)
+        if not_modified:
+            return not_modified
+
+    :param request: The request that is handled.
+    :type request: Request
+    :param etag: The entity tag of the current version of the response.
+    :type etag: str
+    :return: The not modified response or None if the response must be generated.
+    :rtype: HttpResponseNotModified or None
+    """
+
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        response['ETag'] = etag
+
+    return response
+
+
 def validate_data(serializer_class, data):
     """
     Validates the provided data via the provided serializer class. If the data doesn't
@@ -27,18 +150,46 @@ def validate_data(serializer_class, data):
     serializer = serializer_class(data=data)
     if not serializer.is_valid():
         # Create a serialized detail dict why the validation failed.
+        detail = serialize_validation_errors(serializer.errors)
+        raise RequestBodyValidationException(detail)
+
+    return serializer.data
+
+
+@contextmanager
+def map_validation_errors():
+    """
+    This context manager converts a Django ValidationError containing the errors per
+    field, for example raised by a handler that validates the values itself, to the
+    same api response as the validate_data function.
+
+    Example:
+      with map_validation_errors():
+          raise ValidationError({'name': ValidationError('Required.', 'required')})
+
+      HTTP/1.1 400
+      {
+        "error": "ERROR_REQUEST_BODY_VALIDATION",
+        "detail": {"name": [{"error": "Required.", "code": "required"}]}
+      }
+    """
+
+    try:
+        yield
+    except ValidationError as e:
+        if not hasattr(e, 'error_dict'):
+            raise
+
         detail = defaultdict(list)
-        for key, errors in serializer.errors.items():
+        for key, errors in e.error_dict.items():
             for error in errors:
                 detail[key].append({
-                    'error': force_text(error),
-                    'code': error.code
+                    'error': force_text(' '.join(error.messages)),
+                    'code': error.code or 'invalid'
                 })
 
         raise RequestBodyValidationException(detail)
 
-    return serializer.data
-
 
 def validate_data_custom_fields(type_name, registry, data, base_serializer_class=None,
                                 type_attribute_name='type'):
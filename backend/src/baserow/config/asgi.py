@@ -0,0 +1,19 @@
+"""
+ASGI config for baserow project.
+
+It exposes the ASGI application, which handles the WebSocket connections, as a
+module-level variable named ``application``.
+
+For more information on this file, see
+https://channels.readthedocs.io/en/2.x/deploying.html
+"""
+
+import os
+
+import django
+from channels.routing import get_default_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'baserow.config.settings.base')
+django.setup()
+
+application = get_default_application()
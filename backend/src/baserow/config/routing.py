@@ -0,0 +1,9 @@
+from channels.routing import ProtocolTypeRouter, URLRouter
+
+from baserow.ws.auth import JWTTokenAuthMiddleware
+from baserow.contrib.database.ws.routing import websocket_urlpatterns
+
+
+application = ProtocolTypeRouter({
+    'websocket': JWTTokenAuthMiddleware(URLRouter(websocket_urlpatterns))
+})
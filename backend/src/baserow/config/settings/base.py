@@ -22,6 +22,7 @@ INSTALLED_APPS = [
 
     'rest_framework',
     'corsheaders',
+    'channels',
 
     'baserow.core',
     'baserow.api.v0',
@@ -29,6 +30,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'baserow.core.metrics.MetricsMiddleware',
+    'baserow.api.v0.middleware.QueryBudgetMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -58,23 +61,96 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'baserow.config.wsgi.application'
+ASGI_APPLICATION = 'baserow.config.routing.application'
+
+# The channel layer distributes the real time events to the WebSocket connections. The
+# in memory layer only works if a single process serves all the connections, a layer
+# like channels_redis.core.RedisChannelLayer must be used when there are more.
+CHANNEL_LAYERS = {
+    'default': {
+        'BACKEND': 'channels.layers.InMemoryChannelLayer'
+    }
+}
 
 
 # Database
 # https://docs.djangoproject.com/en/2.2/ref/settings/#databases
 
+# The connections are kept open in a pool per worker process so that a request doesn't
+# have to open a new connection. The POOL key configures the maximum amount of open
+# connections per worker and the amount of seconds a request waits for a connection
+# if they are all in use.
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql_psycopg2',
+        'ENGINE': 'baserow.core.db_backends.postgresql_pool',
         'NAME': 'baserow',
         'USER': 'baserow',
         'PASSWORD': 'baserow',
         'HOST': 'db',
         'PORT': '5432',
+        'POOL': {
+            'MAX_SIZE': 10,
+            'TIMEOUT': 10,
+        },
     }
 }
 
+# The user tables can be distributed over multiple databases. The placement policy
+# decides in which of the USER_TABLE_DATABASES connections a new table is created.
+# Tables created before sharding existed are stored in USER_TABLE_DATABASE.
 USER_TABLE_DATABASE = 'default'
+USER_TABLE_DATABASES = [USER_TABLE_DATABASE]
+USER_TABLE_PLACEMENT_POLICY = 'baserow.contrib.database.db.shards.' \
+                              'DatabaseAffinityPlacementPolicy'
+
+# The storage of new tables. With 'columns' every field is a column of the table, with
+# 'jsonb' the values of all the fields are stored in one JSONB column so that adding
+# and deleting fields doesn't have to change the table schema.
+USER_TABLE_STORAGE = 'columns'
+
+# Read only row requests can be served by replicas of the user table databases. The
+# setting maps a USER_TABLE_DATABASES connection alias to a list of aliases of its
+# replicas, for example {'default': ['replica_1', 'replica_2']}. A replica that lags
+# more than USER_TABLE_REPLICA_MAX_LAG seconds behind is skipped, the lag is measured
+# at most once per USER_TABLE_REPLICA_LAG_CHECK_INTERVAL seconds. After changing rows
+# a user reads from the primary for USER_TABLE_REPLICA_PIN_SECONDS seconds so that
+# their own changes are visible. The pins are stored in the cache, so a cache shared
+# by all the processes must be configured when replicas are used.
+USER_TABLE_DATABASE_REPLICAS = {}
+USER_TABLE_REPLICA_MAX_LAG = 5
+USER_TABLE_REPLICA_LAG_CHECK_INTERVAL = 5
+USER_TABLE_REPLICA_PIN_SECONDS = 10
+
+# The maximum amount of milliseconds that a schema change of a user table waits for
+# the table lock. If it cannot be obtained the change is retried after the backoff
+# in seconds, which is doubled after every attempt.
+TABLE_SCHEMA_LOCK_TIMEOUT = 2000
+TABLE_SCHEMA_LOCK_RETRIES = 5
+TABLE_SCHEMA_LOCK_RETRY_BACKOFF = 0.5
+
+# The request metrics are only recorded and exposed at /metrics if METRICS_ENABLED is
+# True. Because they reveal the traffic per view, the endpoint should be protected
+# with a METRICS_TOKEN that the scraper sends as `Authorization: Bearer <token>`.
+METRICS_ENABLED = False
+METRICS_TOKEN = None
+
+# The worker touches a running job every JOB_HEARTBEAT_INTERVAL seconds. If that
+# hasn't happened for JOB_HEARTBEAT_TIMEOUT seconds, the worker running it is
+# considered dead and the job is marked as failed.
+JOB_HEARTBEAT_INTERVAL = 60
+JOB_HEARTBEAT_TIMEOUT = 1800
+
+# Changing the type of a field and deleting a table are executed as background jobs
+# and the API responds with the id of the job. If disabled, they are executed within
+# the request, which doesn't require a running worker.
+BACKGROUND_JOBS_ENABLED = True
+
+# The API views declare the maximum amount of SQL queries they may execute with the
+# query_budget decorator. If enabled, a view that executes more queries raises an
+# exception or logs a warning with the executed queries, depending on whether
+# QUERY_BUDGET_ACTION is 'raise' or 'warn'.
+QUERY_BUDGET_ENABLED = False
+QUERY_BUDGET_ACTION = 'warn'
 
 # Password validation
 # https://docs.djangoproject.com/en/2.2/ref/settings/#auth-password-validators
@@ -126,6 +202,11 @@ REST_FRAMEWORK = {
     ),
 }
 
+# The endpoints that respond with rows render their JSON with orjson if it is
+# installed, which is a lot faster for large pages of rows. The output is the same as
+# the default renderer of Django REST framework.
+FAST_JSON_RENDERER = True
+
 CORS_ORIGIN_WHITELIST = (
     'http://localhost:3000',
     'http://backend:3000'
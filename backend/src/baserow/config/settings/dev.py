@@ -1,6 +1,8 @@
 from .base import *  # noqa: F403, F401
 
 DEBUG = True
+QUERY_BUDGET_ENABLED = True
+METRICS_ENABLED = True
 
 try:
     from .local import *  # noqa: F403, F401
@@ -1 +1,20 @@
 from .base import *  # noqa: F403, F401
+from .base import DATABASES
+
+# A second database in which user tables can be stored, so that sharding the user
+# tables over multiple databases can be tested.
+DATABASES['user_tables'] = dict(DATABASES['default'], NAME='baserow_user_tables')
+
+# A replica of the default database. During the tests it uses the same database so
+# that the rows written to the primary can be read from it.
+DATABASES['default_replica'] = dict(DATABASES['default'], TEST={'MIRROR': 'default'})
+
+METRICS_ENABLED = True
+
+# The long running operations are executed within the request, the tests that cover
+# the background jobs enable them.
+BACKGROUND_JOBS_ENABLED = False
+
+# The tests fail if a view executes more queries than its query budget.
+QUERY_BUDGET_ENABLED = True
+QUERY_BUDGET_ACTION = 'raise'
@@ -1,7 +1,10 @@
 from django.urls import include
 from django.conf.urls import url
 
+from baserow.core.metrics import metrics_view
+
 
 urlpatterns = [
     url(r'^api/v0/', include('baserow.api.v0.urls', namespace='api_v0')),
+    url(r'^metrics$', metrics_view, name='metrics'),
 ]
@@ -1,2 +1,4 @@
 ERROR_CANNOT_DELETE_PRIMARY_FIELD = 'ERROR_CANNOT_DELETE_PRIMARY_FIELD'
 ERROR_CANNOT_CHANGE_FIELD_TYPE = 'ERROR_CANNOT_CHANGE_FIELD_TYPE'
+ERROR_FIELD_DOES_NOT_EXIST = ('ERROR_FIELD_DOES_NOT_EXIST', 404,
+                              'The requested field does not exist.')
@@ -45,3 +45,8 @@ class UpdateFieldSerializer(serializers.ModelSerializer):
         extra_kwargs = {
             'name': {'required': False}
         }
+
+
+class UpdateFieldJobSerializer(serializers.Serializer):
+    field_id = serializers.IntegerField()
+    values = serializers.DictField()
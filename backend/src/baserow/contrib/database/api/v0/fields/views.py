@@ -1,15 +1,25 @@
+from math import ceil
+
+from django.conf import settings
 from django.shortcuts import get_object_or_404
-from django.db import transaction
+from django.db import transaction, connections
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
-from baserow.api.v0.decorators import validate_body_custom_fields, map_exceptions
-from baserow.api.v0.utils import validate_data_custom_fields, type_from_data_or_registry
+from baserow.api.v0.decorators import (
+    validate_body_custom_fields, map_exceptions, query_budget
+)
+from baserow.api.v0.utils import (
+    validate_data_custom_fields, type_from_data_or_registry, get_etag,
+    get_not_modified_response
+)
 from baserow.api.v0.errors import ERROR_USER_NOT_IN_GROUP
 from baserow.core.exceptions import UserNotInGroupError
+from baserow.core.jobs.handler import JobHandler
 from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.api.v0.tables.errors import ERROR_TABLE_SCHEMA_LOCKED
 from baserow.contrib.database.api.v0.fields.errors import (
     ERROR_CANNOT_DELETE_PRIMARY_FIELD, ERROR_CANNOT_CHANGE_FIELD_TYPE
 )
@@ -17,14 +27,63 @@ from baserow.contrib.database.fields.exceptions import (
     CannotDeletePrimaryField, CannotChangeFieldType
 )
 from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.db.exceptions import TableSchemaLocked
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.fields.registries import (
+    field_type_registry, field_converter_registry
+)
+from baserow.contrib.database.fields.job_types import UpdateFieldJobType
+from baserow.contrib.database.fields.field_converters import (
+    ShadowColumnFieldConverter
+)
 
 from .serializers import (
     FieldSerializer, CreateFieldSerializer, UpdateFieldSerializer
 )
 
 
+def update_field_query_budget(request):
+    """
+    Returns the query budget of updating a field. A field converter converts the
+    values in batches, so the amount of queries depends on the amount of rows in the
+    table. Like the converter, the amount of rows is estimated based on the highest
+    id because counting them would require a scan of the table.
+
+    :param request: The request that updates the field.
+    :type request: HttpRequest
+    :return: The maximum amount of queries.
+    :rtype: int
+    """
+
+    budget = 44
+    table = Table.objects.filter(
+        field__id=request.resolver_match.kwargs['field_id']
+    ).first()
+
+    if not table:
+        return budget
+
+    connection = connections[table.shard]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT MAX(id) FROM '
+            f'{connection.ops.quote_name(table.get_database_table_name())}'
+        )
+        max_id = cursor.fetchone()[0] or 0
+
+    batch_sizes = [
+        converter.batch_size
+        for converter in field_converter_registry.registry.values()
+        if isinstance(converter, ShadowColumnFieldConverter)
+    ]
+
+    # Every batch selects and updates the rows that are converted.
+    if batch_sizes:
+        budget += 2 * ceil(max_id / min(batch_sizes))
+
+    return budget
+
+
 class FieldsView(APIView):
     permission_classes = (IsAuthenticated,)
     field_handler = FieldHandler()
@@ -42,6 +101,7 @@ class FieldsView(APIView):
 
         return table
 
+    @query_budget(8)
     @map_exceptions({
         UserNotInGroupError: ERROR_USER_NOT_IN_GROUP
     })
@@ -52,19 +112,25 @@ class FieldsView(APIView):
         """
 
         table = self.get_table(request.user, table_id)
+
+        # The fields only change if the schema version of the table changes.
+        etag = get_etag('fields', table.id, table.schema_version)
+        not_modified = get_not_modified_response(request, etag)
+        if not_modified:
+            return not_modified
+
         fields = Field.objects.filter(table=table).select_related('content_type')
 
-        data = [
-            field_type_registry.get_serializer(field, FieldSerializer).data
-            for field in fields
-        ]
-        return Response(data)
+        data = field_type_registry.serialize_many(fields, FieldSerializer)
+        return Response(data, headers={'ETag': etag})
 
+    @query_budget(16)
     @transaction.atomic
     @validate_body_custom_fields(
         field_type_registry, base_serializer_class=CreateFieldSerializer)
     @map_exceptions({
-        UserNotInGroupError: ERROR_USER_NOT_IN_GROUP
+        UserNotInGroupError: ERROR_USER_NOT_IN_GROUP,
+        TableSchemaLocked: ERROR_TABLE_SCHEMA_LOCKED
     })
     def post(self, request, data, table_id):
         """Creates a new field for a table."""
@@ -81,7 +147,9 @@ class FieldsView(APIView):
 class FieldView(APIView):
     permission_classes = (IsAuthenticated,)
     field_handler = FieldHandler()
+    job_handler = JobHandler()
 
+    @query_budget(4)
     @map_exceptions({
         UserNotInGroupError: ERROR_USER_NOT_IN_GROUP
     })
@@ -100,16 +168,25 @@ class FieldView(APIView):
         serializer = field_type_registry.get_serializer(field, FieldSerializer)
         return Response(serializer.data)
 
-    @transaction.atomic
+    @query_budget(update_field_query_budget)
     @map_exceptions({
         UserNotInGroupError: ERROR_USER_NOT_IN_GROUP,
-        CannotChangeFieldType: ERROR_CANNOT_CHANGE_FIELD_TYPE
+        CannotChangeFieldType: ERROR_CANNOT_CHANGE_FIELD_TYPE,
+        TableSchemaLocked: ERROR_TABLE_SCHEMA_LOCKED
     })
     def patch(self, request, field_id):
-        """Updates the field if the user belongs to the group."""
+        """
+        Updates the field if the user belongs to the group. Changing the type of the
+        field can take a long time on a big table, so if the background jobs are
+        enabled that is done by a job and the id of the job is returned. Unlike the
+        other views this one doesn't run in a transaction, because a field converter
+        commits the converted values in batches to avoid holding the locks of all the
+        rows until the conversion has finished. The handler changes the field
+        metadata and the table schema in one transaction.
+        """
 
         field = get_object_or_404(
-            Field.objects.select_related('table__database__group').select_for_update(),
+            Field.objects.select_related('table__database__group'),
             pk=field_id
         ).specific
 
@@ -117,15 +194,25 @@ class FieldView(APIView):
         data = validate_data_custom_fields(type_name, field_type_registry, request.data,
                                            base_serializer_class=UpdateFieldSerializer)
 
+        if (
+            settings.BACKGROUND_JOBS_ENABLED and
+            type_name != field_type_registry.get_by_model(field).type
+        ):
+            job = self.job_handler.create_job(request.user, UpdateFieldJobType.type,
+                                              field_id=field.id, values=request.data)
+            return Response({'job_id': job.id}, status=202)
+
         field = self.field_handler.update_field(request.user, field, type_name, **data)
 
         serializer = field_type_registry.get_serializer(field, FieldSerializer)
         return Response(serializer.data)
 
+    @query_budget(17)
     @transaction.atomic
     @map_exceptions({
         UserNotInGroupError: ERROR_USER_NOT_IN_GROUP,
-        CannotDeletePrimaryField: ERROR_CANNOT_DELETE_PRIMARY_FIELD
+        CannotDeletePrimaryField: ERROR_CANNOT_DELETE_PRIMARY_FIELD,
+        TableSchemaLocked: ERROR_TABLE_SCHEMA_LOCKED
     })
     def delete(self, request, field_id):
         """Deletes an existing field if the user belongs to the group."""
@@ -1,2 +1,5 @@
 ERROR_ROW_DOES_NOT_EXIST = ('ERROR_ROW_DOES_NOT_EXIST', 404,
                             'The requested row does not exist.')
+ERROR_ROW_VERSION_CONFLICT = ('ERROR_ROW_VERSION_CONFLICT', 409,
+                              'The row has been changed by someone else in the '
+                              'meantime.')
@@ -5,14 +5,26 @@ from baserow.api.v0.utils import get_serializer_class
 
 class RowSerializer(serializers.ModelSerializer):
     class Meta:
-        fields = ('id',)
+        fields = ('id', 'version')
         extra_kwargs = {
             'id': {
                 'read_only': True
+            },
+            'version': {
+                'read_only': True
             }
         }
 
 
+class RowVersionSerializer(serializers.Serializer):
+    """
+    Validates the version of the row that the changes are based on. If it is provided
+    the row is only updated if nobody else has changed it in the meantime.
+    """
+
+    version = serializers.IntegerField(required=False, min_value=1)
+
+
 def get_row_serializer_class(model, base_class=None):
     """
     Generates a Django rest framework model serializer based on the available fields
@@ -37,3 +49,8 @@ def get_row_serializer_class(model, base_class=None):
         for field in field_objects.values()
     }
     return get_serializer_class(model, field_names, field_overrides, base_class)
+
+
+class ImportRowsJobSerializer(serializers.Serializer):
+    table_id = serializers.IntegerField()
+    rows = serializers.ListField(child=serializers.DictField())
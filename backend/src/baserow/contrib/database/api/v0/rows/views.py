@@ -4,25 +4,34 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
-from baserow.api.v0.utils import validate_data
-from baserow.api.v0.decorators import map_exceptions
+from baserow.api.v0.utils import validate_data, map_validation_errors
+from baserow.api.v0.decorators import map_exceptions, query_budget
+from baserow.api.v0.renderers import ROW_RENDERER_CLASSES
 from baserow.api.v0.errors import ERROR_USER_NOT_IN_GROUP
 from baserow.core.exceptions import UserNotInGroupError
+from baserow.core.metrics import record_timing
 from baserow.contrib.database.api.v0.tables.errors import ERROR_TABLE_DOES_NOT_EXIST
 from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.table.exceptions import TableDoesNotExist
-from baserow.contrib.database.api.v0.rows.errors import ERROR_ROW_DOES_NOT_EXIST
+from baserow.contrib.database.api.v0.rows.errors import (
+    ERROR_ROW_DOES_NOT_EXIST, ERROR_ROW_VERSION_CONFLICT
+)
 from baserow.contrib.database.rows.handler import RowHandler
-from baserow.contrib.database.rows.exceptions import RowDoesNotExist
+from baserow.contrib.database.rows.codec import get_row_codec
+from baserow.contrib.database.rows.exceptions import (
+    RowDoesNotExist, RowVersionConflict
+)
 
-from .serializers import RowSerializer, get_row_serializer_class
+from .serializers import RowVersionSerializer
 
 
 class RowsView(APIView):
     permission_classes = (IsAuthenticated,)
+    renderer_classes = ROW_RENDERER_CLASSES
     row_handler = RowHandler()
     table_handler = TableHandler()
 
+    @query_budget(12)
     @transaction.atomic
     @map_exceptions({
         UserNotInGroupError: ERROR_USER_NOT_IN_GROUP,
@@ -37,31 +46,37 @@ class RowsView(APIView):
         table = self.table_handler.get_table(request.user, table_id)
         model = table.get_model()
 
-        validation_serializer = get_row_serializer_class(model)
-        data = validate_data(validation_serializer, request.data)
+        # The values are validated, coerced and prepared in one pass by the row codec
+        # of the model, which is also used to build the response.
+        with map_validation_errors():
+            row = self.row_handler.create_row(request.user, table, request.data, model)
 
-        row = self.row_handler.create_row(request.user, table, data, model)
-        serializer_class = get_row_serializer_class(model, RowSerializer)
-        serializer = serializer_class(row)
+        with record_timing('row_serialization'):
+            data = get_row_codec(model).encode(row)
 
-        return Response(serializer.data)
+        return Response(data)
 
 
 class RowView(APIView):
     permission_classes = (IsAuthenticated,)
+    renderer_classes = ROW_RENDERER_CLASSES
     row_handler = RowHandler()
     table_handler = TableHandler()
 
+    @query_budget(12)
     @transaction.atomic
     @map_exceptions({
         UserNotInGroupError: ERROR_USER_NOT_IN_GROUP,
         TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST,
-        RowDoesNotExist: ERROR_ROW_DOES_NOT_EXIST
+        RowDoesNotExist: ERROR_ROW_DOES_NOT_EXIST,
+        RowVersionConflict: ERROR_ROW_VERSION_CONFLICT
     })
     def patch(self, request, table_id, row_id):
         """
         Updates the row with the given row_id for the table with the given
         table_id. Also the post data is validated according to the tables field types.
+        If the version of the row is provided, the row is only updated if it has not
+        been changed by someone else in the meantime.
         """
 
         table = self.table_handler.get_table(request.user, table_id)
@@ -73,16 +88,18 @@ class RowView(APIView):
         field_ids = self.row_handler.extract_field_ids_from_dict(request.data)
         model = table.get_model(field_ids=field_ids)
 
-        validation_serializer = get_row_serializer_class(model)
-        data = validate_data(validation_serializer, request.data)
+        version = validate_data(RowVersionSerializer, request.data).get('version')
 
-        row = self.row_handler.update_row(request.user, table, row_id, data, model)
+        with map_validation_errors():
+            row = self.row_handler.update_row(request.user, table, row_id,
+                                              request.data, model, version)
 
-        serializer_class = get_row_serializer_class(model, RowSerializer)
-        serializer = serializer_class(row)
+        with record_timing('row_serialization'):
+            data = get_row_codec(model).encode(row)
 
-        return Response(serializer.data)
+        return Response(data)
 
+    @query_budget(8)
     @transaction.atomic
     @map_exceptions({
         UserNotInGroupError: ERROR_USER_NOT_IN_GROUP,
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from baserow.api.v0.applications.serializers import ApplicationSerializer
+from baserow.contrib.database.models import Database
 from baserow.contrib.database.table.models import Table
 from baserow.contrib.database.api.v0.tables.serializers import TableSerializer
 
@@ -13,8 +14,9 @@ class DatabaseSerializer(ApplicationSerializer):
 
     def get_tables(self, instance):
         """
-        Because the the instance doesn't know at this point it is a Database we have to
-        select the related tables this way.
+        Because the the instance doesn't always know at this point it is a Database we
+        have to select the related tables this way. If it is the specific instance the
+        tables could already have been prefetched.
 
         :param instance: The database application instance.
         :type instance: Application
@@ -22,5 +24,9 @@ class DatabaseSerializer(ApplicationSerializer):
         :rtype: list
         """
 
-        tables = Table.objects.filter(database_id=instance.pk)
+        if isinstance(instance, Database):
+            tables = instance.table_set.all()
+        else:
+            tables = Table.objects.filter(database_id=instance.pk)
+
         return TableSerializer(tables, many=True).data
@@ -1,2 +1,5 @@
 ERROR_TABLE_DOES_NOT_EXIST = ('ERROR_TABLE_DOES_NOT_EXIST', 404,
                               'The requested table does not exist.')
+ERROR_TABLE_SCHEMA_LOCKED = ('ERROR_TABLE_SCHEMA_LOCKED', 409,
+                             'The table is locked by other operations, please try '
+                             'again later.')
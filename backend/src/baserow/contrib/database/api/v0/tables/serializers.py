@@ -18,3 +18,7 @@ class TableCreateUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Table
         fields = ('name',)
+
+
+class DeleteTableJobSerializer(serializers.Serializer):
+    table_id = serializers.IntegerField()
@@ -1,6 +1,6 @@
 from django.conf.urls import url
 
-from .views import TablesView, TableView
+from .views import TablesView, TableView, TableBootstrapView
 
 
 app_name = 'baserow.contrib.database.api.v0.tables'
@@ -8,4 +8,6 @@ app_name = 'baserow.contrib.database.api.v0.tables'
 urlpatterns = [
     url(r'database/(?P<database_id>[0-9]+)/$', TablesView.as_view(), name='list'),
     url(r'(?P<table_id>[0-9]+)/$', TableView.as_view(), name='item'),
+    url(r'(?P<table_id>[0-9]+)/bootstrap/$', TableBootstrapView.as_view(),
+        name='bootstrap'),
 ]
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.db import transaction
 from django.shortcuts import get_object_or_404
 
@@ -5,12 +6,33 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
-from baserow.api.v0.decorators import validate_body, map_exceptions
+from baserow.api.v0.decorators import validate_body, map_exceptions, query_budget
+from baserow.api.v0.renderers import ROW_RENDERER_CLASSES
 from baserow.api.v0.errors import ERROR_USER_NOT_IN_GROUP
+from baserow.core.db import specific_iterator
 from baserow.core.exceptions import UserNotInGroupError
+from baserow.core.jobs.handler import JobHandler
 from baserow.contrib.database.models import Database
 from baserow.contrib.database.table.models import Table
 from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.job_types import DeleteTableJobType
+from baserow.contrib.database.db.exceptions import TableSchemaLocked
+from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.views.exceptions import ViewDoesNotExist
+from baserow.contrib.database.views.models import View, GridView
+from baserow.contrib.database.views.registries import view_type_registry
+from baserow.contrib.database.api.v0.fields.serializers import FieldSerializer
+from baserow.contrib.database.api.v0.views.serializers import ViewSerializer
+from baserow.contrib.database.api.v0.views.grid.errors import ERROR_GRID_DOES_NOT_EXIST
+from baserow.contrib.database.api.v0.views.grid.serializers import (
+    serialize_field_options
+)
+from baserow.contrib.database.api.v0.views.grid.views import (
+    get_include_field_ids, list_grid_view_rows
+)
+
+from .errors import ERROR_TABLE_SCHEMA_LOCKED
 
 from .serializers import TableSerializer, TableCreateUpdateSerializer
 
@@ -31,6 +53,7 @@ class TablesView(APIView):
 
         return database
 
+    @query_budget(4)
     @map_exceptions({
         UserNotInGroupError: ERROR_USER_NOT_IN_GROUP
     })
@@ -42,9 +65,11 @@ class TablesView(APIView):
         serializer = TableSerializer(tables, many=True)
         return Response(serializer.data)
 
+    @query_budget(22)
     @transaction.atomic
     @map_exceptions({
-        UserNotInGroupError: ERROR_USER_NOT_IN_GROUP
+        UserNotInGroupError: ERROR_USER_NOT_IN_GROUP,
+        TableSchemaLocked: ERROR_TABLE_SCHEMA_LOCKED
     })
     @validate_body(TableCreateUpdateSerializer)
     def post(self, request, data, database_id):
@@ -60,6 +85,7 @@ class TablesView(APIView):
 class TableView(APIView):
     permission_classes = (IsAuthenticated,)
     table_handler = TableHandler()
+    job_handler = JobHandler()
 
     @staticmethod
     def get_table(user, table_id):
@@ -73,6 +99,7 @@ class TableView(APIView):
 
         return table
 
+    @query_budget(3)
     @map_exceptions({
         UserNotInGroupError: ERROR_USER_NOT_IN_GROUP
     })
@@ -83,6 +110,7 @@ class TableView(APIView):
         serializer = TableSerializer(table)
         return Response(serializer.data)
 
+    @query_budget(6)
     @transaction.atomic
     @map_exceptions({
         UserNotInGroupError: ERROR_USER_NOT_IN_GROUP
@@ -99,15 +127,108 @@ class TableView(APIView):
         serializer = TableSerializer(table)
         return Response(serializer.data)
 
+    @query_budget(10)
     @transaction.atomic
     @map_exceptions({
-        UserNotInGroupError: ERROR_USER_NOT_IN_GROUP
+        UserNotInGroupError: ERROR_USER_NOT_IN_GROUP,
+        TableSchemaLocked: ERROR_TABLE_SCHEMA_LOCKED
     })
     def delete(self, request, table_id):
-        """Deletes an existing table."""
+        """
+        Deletes an existing table. If the background jobs are enabled the table is
+        deleted by a job and the id of the job is returned.
+        """
 
-        self.table_handler.delete_table(
-            request.user,
-            self.get_table(request.user, table_id)
-        )
+        table = self.get_table(request.user, table_id)
+
+        if settings.BACKGROUND_JOBS_ENABLED:
+            job = self.job_handler.create_job(request.user, DeleteTableJobType.type,
+                                              table_id=table.id)
+            return Response({'job_id': job.id}, status=202)
+
+        self.table_handler.delete_table(request.user, table)
         return Response(status=204)
+
+
+class TableBootstrapView(APIView):
+    permission_classes = (IsAuthenticated,)
+    renderer_classes = ROW_RENDERER_CLASSES
+
+    @query_budget(lambda request: (
+        7 + len(field_type_registry.registry) + len(view_type_registry.registry)
+    ))
+    @map_exceptions({
+        UserNotInGroupError: ERROR_USER_NOT_IN_GROUP,
+        ViewDoesNotExist: ERROR_GRID_DOES_NOT_EXIST
+    })
+    def get(self, request, table_id):
+        """
+        Responds with everything that is needed to open a table in one request, the
+        table, all its fields and views and the first page of rows of a grid view.
+        The grid view can be chosen with the `view_id` get parameter, by default it
+        is the first grid view of the table. The page, the fields and the layout of
+        the rows can be changed with the same get parameters as when listing the rows
+        of a grid view.
+
+        The permissions are checked once and the fields are fetched once for both
+        the response and the table model, so the amount of queries doesn't depend on
+        the amount of fields and views.
+        """
+
+        table = TableView.get_table(request.user, table_id)
+
+        fields = specific_iterator(Field.objects.filter(table=table))
+        views = specific_iterator(View.objects.filter(table=table))
+        for view in views:
+            view.table = table
+
+        grid_view = self.get_grid_view(views, request.GET.get('view_id'))
+        grid = None
+        if grid_view:
+            grid = self.get_grid_data(request, table, fields, grid_view)
+
+        return Response({
+            'table': TableSerializer(table).data,
+            'fields': field_type_registry.serialize_many(fields, FieldSerializer),
+            'views': view_type_registry.serialize_many(views, ViewSerializer),
+            'grid': grid
+        })
+
+    @staticmethod
+    def get_grid_view(views, view_id=None):
+        """
+        Returns the grid view with the provided id or the first grid view if no id
+        is provided.
+
+        :raises ViewDoesNotExist: When the table doesn't have a grid view with the
+                                  provided id.
+        :return: The grid view or None if the table doesn't have one.
+        :rtype: GridView or None
+        """
+
+        grid_views = [view for view in views if isinstance(view, GridView)]
+
+        if view_id is None:
+            return grid_views[0] if grid_views else None
+
+        for grid_view in grid_views:
+            if str(grid_view.id) == view_id:
+                return grid_view
+
+        raise ViewDoesNotExist(f'The grid view with id {view_id} does not exist.')
+
+    def get_grid_data(self, request, table, fields, grid_view):
+        """
+        Serializes the first page of rows of the grid view, containing only the
+        visible fields, and the field options of the grid view.
+        """
+
+        field_options = grid_view.get_field_options(fields)
+        model = grid_view.get_model(get_include_field_ids(request), fields,
+                                    field_options)
+        response, _ = list_grid_view_rows(request, grid_view, model, self)
+
+        grid = response.data
+        grid['view_id'] = grid_view.id
+        grid['field_options'] = serialize_field_options(field_options)
+        return grid
@@ -1,2 +1,4 @@
 ERROR_GRID_DOES_NOT_EXIST = ('ERROR_GRID_DOES_NOT_EXIST', 404,
                              'The requested grid view does not exist.')
+ERROR_UNRELATED_FIELD = ('ERROR_UNRELATED_FIELD', 400,
+                         'The field is not related to the provided grid view.')
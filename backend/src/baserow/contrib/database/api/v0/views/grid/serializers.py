@@ -0,0 +1,63 @@
+from rest_framework import serializers
+
+from baserow.contrib.database.views.models import GridViewFieldOptions
+
+
+MAX_ROWS_BY_IDS = 200
+"""The maximum amount of rows that can be fetched by id in one request."""
+
+
+class GridViewFieldOptionsSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = GridViewFieldOptions
+        fields = ('width', 'hidden', 'order')
+
+
+class UpdateGridViewFieldOptionsSerializer(serializers.Serializer):
+    field_options = serializers.DictField(child=GridViewFieldOptionsSerializer())
+
+    def validate_field_options(self, value):
+        for field_id in value.keys():
+            if not str(field_id).isdigit():
+                raise serializers.ValidationError(
+                    f'{field_id} is not a valid field id.'
+                )
+
+        return value
+
+
+GRID_VIEW_LAYOUT_ROWS = 'rows'
+GRID_VIEW_LAYOUT_COLUMNS = 'columns'
+GRID_VIEW_LAYOUTS = (GRID_VIEW_LAYOUT_ROWS, GRID_VIEW_LAYOUT_COLUMNS)
+
+
+class GridViewQuerySerializer(serializers.Serializer):
+    layout = serializers.ChoiceField(choices=GRID_VIEW_LAYOUTS,
+                                     default=GRID_VIEW_LAYOUT_ROWS)
+
+
+class GridViewRowsQuerySerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1),
+                                min_length=1, max_length=MAX_ROWS_BY_IDS)
+
+
+class GridViewRowIdsQuerySerializer(serializers.Serializer):
+    offset = serializers.IntegerField(min_value=0, default=0)
+    limit = serializers.IntegerField(min_value=1, max_value=10000, default=1000)
+
+
+def serialize_field_options(field_options):
+    """
+    Serializes a list of grid view field options to a dict containing the field id as
+    key and the options as value.
+
+    :param field_options: The field options that must be serialized.
+    :type field_options: list
+    :return: The serialized field options.
+    :rtype: dict
+    """
+
+    return {
+        options.field_id: GridViewFieldOptionsSerializer(options).data
+        for options in field_options
+    }
@@ -1,10 +1,17 @@
 from django.conf.urls import url
 
-from .views import GridViewView
+from .views import (
+    GridViewView, GridViewRowsView, GridViewRowIdsView, GridViewFieldOptionsView
+)
 
 
 app_name = 'baserow.contrib.database.api.v0.views.grid'
 
 urlpatterns = [
     url(r'(?P<view_id>[0-9]+)/$', GridViewView.as_view(), name='list'),
+    url(r'(?P<view_id>[0-9]+)/rows/$', GridViewRowsView.as_view(), name='rows'),
+    url(r'(?P<view_id>[0-9]+)/row-ids/$', GridViewRowIdsView.as_view(),
+        name='row_ids'),
+    url(r'(?P<view_id>[0-9]+)/field-options/$', GridViewFieldOptionsView.as_view(),
+        name='field_options'),
 ]
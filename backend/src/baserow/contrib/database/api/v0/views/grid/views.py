@@ -1,25 +1,115 @@
+from django.db import transaction
+
 from rest_framework.views import APIView
+from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.pagination import LimitOffsetPagination
 
-from baserow.api.v0.decorators import map_exceptions
+from baserow.api.v0.decorators import map_exceptions, validate_body, query_budget
+from baserow.api.v0.renderers import ROW_RENDERER_CLASSES
 from baserow.api.v0.errors import ERROR_USER_NOT_IN_GROUP
 from baserow.api.v0.pagination import PageNumberPagination
+from baserow.api.v0.utils import (
+    validate_data, get_etag, get_not_modified_response
+)
 from baserow.core.exceptions import UserNotInGroupError
+from baserow.core.metrics import record_timing
 from baserow.contrib.database.api.v0.rows.serializers import (
     get_row_serializer_class, RowSerializer
 )
-from baserow.contrib.database.views.exceptions import ViewDoesNotExist
+from baserow.contrib.database.db.replicas import (
+    read_from_replica, is_reading_from_replica
+)
+from baserow.contrib.database.rows.codec import get_row_codec
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.views.exceptions import (
+    ViewDoesNotExist, UnrelatedFieldError
+)
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import GridView
 
-from .errors import ERROR_GRID_DOES_NOT_EXIST
+from .errors import ERROR_GRID_DOES_NOT_EXIST, ERROR_UNRELATED_FIELD
+from .serializers import (
+    UpdateGridViewFieldOptionsSerializer, GridViewQuerySerializer,
+    GridViewRowsQuerySerializer, GridViewRowIdsQuerySerializer,
+    serialize_field_options, GRID_VIEW_LAYOUT_COLUMNS
+)
+
+
+def get_include_field_ids(request):
+    """
+    Returns the field ids of the optional `include_fields` get parameter, containing
+    comma separated field ids like `field_1,field_2`.
+
+    :param request: The request.
+    :type request: Request
+    :return: The field ids or None if the parameter is not provided.
+    :rtype: list or None
+    """
+
+    if 'include_fields' not in request.GET:
+        return None
+
+    return RowHandler().extract_field_ids_from_string(request.GET['include_fields'])
+
+
+def list_grid_view_rows(request, view, model, api_view):
+    """
+    Selects and serializes a page of the rows of a grid view. The rows are paginated
+    by the limit and offset get parameters if the limit is provided, else by the page
+    number. If the `layout` get parameter is `columns` the rows are encoded per column
+    instead of per row. The rows can be read from a replica.
+
+    :param request: The request.
+    :type request: Request
+    :param view: The grid view of which the rows are listed.
+    :type view: GridView
+    :param model: The generated model of the table, containing only the fields that
+                  must be returned.
+    :type model: Model
+    :param api_view: The API view that handles the request.
+    :type api_view: APIView
+    :raises RequestBodyValidationException: When the layout is not valid.
+    :return: The paginated response and whether the rows have been read from a
+             replica.
+    :rtype: tuple
+    """
+
+    query = validate_data(GridViewQuerySerializer, request.GET)
+    queryset = model.objects.all().order_by('id')
+
+    if LimitOffsetPagination.limit_query_param in request.GET:
+        paginator = LimitOffsetPagination()
+    else:
+        paginator = PageNumberPagination()
+
+    # Listing the rows is read only, so they can be read from a replica.
+    with read_from_replica(request.user, view.table):
+        if query['layout'] == GRID_VIEW_LAYOUT_COLUMNS:
+            # The values are selected as tuples and encoded per column without
+            # constructing model instances.
+            codec = get_row_codec(model)
+            queryset = queryset.values_list(*codec.get_column_names())
+            page = paginator.paginate_queryset(queryset, request, api_view)
+            with record_timing('row_serialization'):
+                data = codec.encode_columns(page)
+        else:
+            page = paginator.paginate_queryset(queryset, request, api_view)
+            serializer_class = get_row_serializer_class(model, RowSerializer)
+            serializer = serializer_class(page, many=True)
+            with record_timing('row_serialization'):
+                data = serializer.data
+        from_replica = is_reading_from_replica(view.table.shard)
+
+    return paginator.get_paginated_response(data), from_replica
 
 
 class GridViewView(APIView):
     permission_classes = (IsAuthenticated,)
+    renderer_classes = ROW_RENDERER_CLASSES
     view_handler = ViewHandler()
 
+    @query_budget(14)
     @map_exceptions({
         UserNotInGroupError: ERROR_USER_NOT_IN_GROUP,
         ViewDoesNotExist: ERROR_GRID_DOES_NOT_EXIST
@@ -29,20 +119,139 @@ class GridViewView(APIView):
         Lists all the rows of a grid view, paginated either by a page or offset/limit.
         If the limit get parameter is provided the limit/offset pagination will be used
         else the page number pagination.
+
+        Only the fields that are not hidden in the view are selected and returned. The
+        optional `include_fields` get parameter, containing comma separated field ids
+        like `field_1,field_2`, narrows them further down. If `include` contains
+        `field_options` the options of all the fields in the view are added to the
+        response.
+
+        If the `layout` get parameter is `columns` the results contain the ids and
+        versions of the rows, the ids of the fields and a list of values per field
+        instead of a dict per row, which doesn't repeat the keys for every row.
+
+        The response has an entity tag based on the data and schema version of the
+        table. If it matches with the If-None-Match header a 304 is returned before
+        any row is selected.
         """
 
         view = self.view_handler.get_view(request.user, view_id, GridView)
+        table = view.table
 
-        model = view.table.get_model()
-        queryset = model.objects.all().order_by('id')
+        # The versions are selected before the rows, so an entity tag can at worst be
+        # older than the rows, which only results in a needless download.
+        etag = get_etag('grid', view.id, table.data_version, table.schema_version)
+        not_modified = get_not_modified_response(request, etag)
+        if not_modified:
+            return not_modified
 
-        if LimitOffsetPagination.limit_query_param in request.GET:
-            paginator = LimitOffsetPagination()
-        else:
-            paginator = PageNumberPagination()
+        # The model only contains the visible fields, so only their columns are
+        # selected and serialized.
+        model = view.get_model(get_include_field_ids(request))
+        response, from_replica = list_grid_view_rows(request, view, model, self)
+
+        # A replica might not have received the rows of the current data version yet,
+        # the entity tag would then be cached along with outdated rows.
+        if not from_replica:
+            response['ETag'] = etag
+
+        if 'field_options' in request.GET.get('include', '').split(','):
+            response.data['field_options'] = serialize_field_options(
+                view.get_field_options()
+            )
+
+        return response
+
+
+class GridViewRowsView(APIView):
+    permission_classes = (IsAuthenticated,)
+    renderer_classes = ROW_RENDERER_CLASSES
+    view_handler = ViewHandler()
 
-        page = paginator.paginate_queryset(queryset, request, self)
-        serializer_class = get_row_serializer_class(model, RowSerializer)
-        serializer = serializer_class(page, many=True)
+    @query_budget(10)
+    @map_exceptions({
+        UserNotInGroupError: ERROR_USER_NOT_IN_GROUP,
+        ViewDoesNotExist: ERROR_GRID_DOES_NOT_EXIST
+    })
+    def get(self, request, view_id):
+        """
+        Responds with the rows of the grid view with the ids provided by the `ids` get
+        parameter, ordered by id. Ids of rows that don't exist are ignored. This makes
+        it possible to load or refresh specific rows instead of whole pages. Like
+        when listing the rows only the visible fields are returned and the
+        `include_fields` get parameter narrows them further down.
+        """
+
+        view = self.view_handler.get_view(request.user, view_id, GridView)
+        data = validate_data(GridViewRowsQuerySerializer, request.GET)
+
+        model = view.get_model(get_include_field_ids(request))
+        queryset = model.objects.filter(id__any=data['ids']).order_by('id')
+
+        with read_from_replica(request.user, view.table):
+            rows = list(queryset)
+
+        with record_timing('row_serialization'):
+            codec = get_row_codec(model)
+            data = [codec.encode(row) for row in rows]
+
+        return Response(data)
+
+
+class GridViewRowIdsView(APIView):
+    permission_classes = (IsAuthenticated,)
+    renderer_classes = ROW_RENDERER_CLASSES
+    view_handler = ViewHandler()
+
+    @query_budget(5)
+    @map_exceptions({
+        UserNotInGroupError: ERROR_USER_NOT_IN_GROUP,
+        ViewDoesNotExist: ERROR_GRID_DOES_NOT_EXIST
+    })
+    def get(self, request, view_id):
+        """
+        Responds with the total amount of rows and only the ids of the rows in the
+        range provided by the `offset` and `limit` get parameters, in the same order
+        as the rows are listed. Clients can use them to virtualize scrolling and
+        fetch the rows that come into view by id.
+        """
+
+        view = self.view_handler.get_view(request.user, view_id, GridView)
+        data = validate_data(GridViewRowIdsQuerySerializer, request.GET)
+
+        # The model doesn't need any fields because only the ids are selected.
+        model = view.table.get_model(field_ids=[])
+        queryset = model.objects.order_by('id').values_list('id', flat=True)
+        offset = data['offset']
+
+        with read_from_replica(request.user, view.table):
+            count = queryset.count()
+            ids = list(queryset[offset:offset + data['limit']])
+
+        return Response({'count': count, 'ids': ids})
+
+
+class GridViewFieldOptionsView(APIView):
+    permission_classes = (IsAuthenticated,)
+    view_handler = ViewHandler()
+
+    @query_budget(10)
+    @transaction.atomic
+    @map_exceptions({
+        UserNotInGroupError: ERROR_USER_NOT_IN_GROUP,
+        ViewDoesNotExist: ERROR_GRID_DOES_NOT_EXIST,
+        UnrelatedFieldError: ERROR_UNRELATED_FIELD
+    })
+    @validate_body(UpdateGridViewFieldOptionsSerializer)
+    def patch(self, request, data, view_id):
+        """
+        Updates the field options, like the width and whether the field is hidden, of
+        the provided fields in the grid view.
+        """
+
+        view = self.view_handler.get_view(request.user, view_id, GridView)
+        field_options = self.view_handler.update_grid_view_field_options(
+            request.user, view, data['field_options']
+        )
 
-        return paginator.get_paginated_response(serializer.data)
+        return Response({'field_options': serialize_field_options(field_options)})
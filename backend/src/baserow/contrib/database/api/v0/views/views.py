@@ -5,8 +5,12 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
-from baserow.api.v0.decorators import validate_body_custom_fields, map_exceptions
-from baserow.api.v0.utils import validate_data_custom_fields
+from baserow.api.v0.decorators import (
+    validate_body_custom_fields, map_exceptions, query_budget
+)
+from baserow.api.v0.utils import (
+    validate_data_custom_fields, get_etag, get_not_modified_response
+)
 from baserow.api.v0.errors import ERROR_USER_NOT_IN_GROUP
 from baserow.core.exceptions import UserNotInGroupError
 from baserow.contrib.database.table.models import Table
@@ -34,6 +38,7 @@ class ViewsView(APIView):
 
         return table
 
+    @query_budget(6)
     @map_exceptions({
         UserNotInGroupError: ERROR_USER_NOT_IN_GROUP
     })
@@ -44,13 +49,23 @@ class ViewsView(APIView):
         """
 
         table = self.get_table(request.user, table_id)
+
+        # The views only change if the schema version of the table changes.
+        etag = get_etag('views', table.id, table.schema_version)
+        not_modified = get_not_modified_response(request, etag)
+        if not_modified:
+            return not_modified
+
         views = View.objects.filter(table=table).select_related('content_type')
-        data = [
-            view_type_registry.get_serializer(view, ViewSerializer).data
-            for view in views
-        ]
-        return Response(data)
+        data = view_type_registry.serialize_many(
+            views, ViewSerializer,
+            per_content_type_queryset_hook=(
+                lambda model, queryset: queryset.select_related('table')
+            )
+        )
+        return Response(data, headers={'ETag': etag})
 
+    @query_budget(8)
     @transaction.atomic
     @validate_body_custom_fields(
         view_type_registry, base_serializer_class=CreateViewSerializer)
@@ -72,6 +87,7 @@ class ViewView(APIView):
     permission_classes = (IsAuthenticated,)
     view_handler = ViewHandler()
 
+    @query_budget(5)
     @map_exceptions({
         UserNotInGroupError: ERROR_USER_NOT_IN_GROUP
     })
@@ -90,6 +106,7 @@ class ViewView(APIView):
         serializer = view_type_registry.get_serializer(view, ViewSerializer)
         return Response(serializer.data)
 
+    @query_budget(10)
     @transaction.atomic
     @map_exceptions({
         UserNotInGroupError: ERROR_USER_NOT_IN_GROUP
@@ -113,6 +130,7 @@ class ViewView(APIView):
         serializer = view_type_registry.get_serializer(view, ViewSerializer)
         return Response(serializer.data)
 
+    @query_budget(8)
     @transaction.atomic
     @map_exceptions({
         UserNotInGroupError: ERROR_USER_NOT_IN_GROUP
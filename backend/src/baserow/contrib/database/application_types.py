@@ -13,16 +13,17 @@ class DatabaseApplicationType(ApplicationType):
     model_class = Database
     instance_serializer_class = DatabaseSerializer
 
+    def enhance_queryset(self, queryset):
+        return queryset.prefetch_related('table_set')
+
     def pre_delete(self, user, database):
         """
-        When a database is deleted we must also delete the related tables via the table
-        handler.
+        When a database is deleted the related tables are deleted by the cascade, but
+        their database tables must be dropped. This is done in the background by
+        registering them as pending drops.
         """
-        database_tables = database.table_set.all().select_related('database__group')
-        table_handler = TableHandler()
 
-        for table in database_tables:
-            table_handler.delete_table(user, table)
+        TableHandler().schedule_table_drops(database.table_set.all())
 
     def get_api_v0_urls(self):
         return [
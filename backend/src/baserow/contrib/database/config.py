@@ -1,9 +1,10 @@
 from django.apps import AppConfig
 
 from baserow.core.registries import application_type_registry
+from baserow.core.jobs.registries import job_type_registry
 
 from .views.registries import view_type_registry
-from .fields.registries import field_type_registry
+from .fields.registries import field_type_registry, field_converter_registry
 
 
 class DatabaseConfig(AppConfig):
@@ -15,8 +16,18 @@ class DatabaseConfig(AppConfig):
         field_type_registry.register(NumberFieldType())
         field_type_registry.register(BooleanFieldType())
 
+        from .fields.field_converters import TextToNumberFieldConverter
+        field_converter_registry.register(TextToNumberFieldConverter())
+
         from .views.view_types import GridViewType
         view_type_registry.register(GridViewType())
 
         from .application_types import DatabaseApplicationType
         application_type_registry.register(DatabaseApplicationType())
+
+        from .fields.job_types import UpdateFieldJobType
+        from .table.job_types import DeleteTableJobType
+        from .rows.job_types import ImportRowsJobType
+        job_type_registry.register(UpdateFieldJobType())
+        job_type_registry.register(DeleteTableJobType())
+        job_type_registry.register(ImportRowsJobType())
@@ -1,23 +1,27 @@
 from django.conf import settings
 
+from baserow.contrib.database.db.replicas import get_read_database
+
 
 class TablesDatabaseRouter(object):
     """
     This database router is used to check if the model is a generated table model. If so
-    the configurable USER_TABLE_DATABASE connection must be used instead of the default
-    one. This is so that the user tables can be stored into another database.
+    the connection of the shard where the table is stored must be used instead of the
+    default one. This is so that the user tables can be stored into other databases.
+    Within the `read_from_replica` context the rows are read from a replica of that
+    shard.
     """
 
     @staticmethod
     def user_table_database_if_generated_table_database(model):
-        return (
-            settings.USER_TABLE_DATABASE
-            if hasattr(model, '_generated_table_model') else
-            None
-        )
+        if not hasattr(model, '_generated_table_model'):
+            return None
+
+        return getattr(model, '_shard', settings.USER_TABLE_DATABASE)
 
     def db_for_read(self, model, **hints):
-        return self.user_table_database_if_generated_table_database(model)
+        shard = self.user_table_database_if_generated_table_database(model)
+        return get_read_database(shard) if shard else None
 
     def db_for_write(self, model, **hints):
         return self.user_table_database_if_generated_table_database(model)
@@ -0,0 +1,5 @@
+class TableSchemaLocked(Exception):
+    """
+    Raised when the schema of a table could not be changed because the table stayed
+    locked by other operations after all the retries.
+    """
@@ -0,0 +1,218 @@
+import random
+import logging
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.utils import DatabaseError
+
+from prometheus_client import Counter, Gauge
+
+
+logger = logging.getLogger(__name__)
+
+_state = threading.local()
+
+user_table_reads = Counter(
+    'baserow_user_table_reads_total',
+    'Amount of user table read routings per database connection.',
+    ['database']
+)
+replica_lag_seconds = Gauge(
+    'baserow_user_table_replica_lag_seconds',
+    'The last measured replication lag of a user table replica.',
+    ['database']
+)
+replica_skipped = Counter(
+    'baserow_user_table_replica_skipped_total',
+    'Amount of times a replica was skipped because it lagged too far behind or '
+    'was unavailable.',
+    ['database']
+)
+
+
+def get_user_pin_cache_key(user):
+    return f'baserow_replica_pin_user_{user.id}'
+
+
+def get_table_pin_cache_key(table):
+    return f'baserow_replica_pin_table_{table.id}'
+
+
+def pin_user_to_primary(user):
+    """
+    Makes sure that the rows read by the user are read from the primary for a short
+    period, configured by the USER_TABLE_REPLICA_PIN_SECONDS setting. This must be
+    called after the user changed rows so that the user can directly read their own
+    writes, even if the replicas have not received them yet.
+
+    :param user: The user that has changed rows.
+    :type user: User
+    """
+
+    if settings.USER_TABLE_DATABASE_REPLICAS:
+        cache.set(get_user_pin_cache_key(user), True,
+                  settings.USER_TABLE_REPLICA_PIN_SECONDS)
+
+
+def pin_table_to_primary(table):
+    """
+    Makes sure that the rows of the table are read from the primary for a short period
+    by everyone. This must be called after the schema of the table has changed because
+    a replica that has not received the change yet would fail to select a new column.
+
+    :param table: The table of which the schema has changed.
+    :type table: Table
+    """
+
+    if settings.USER_TABLE_DATABASE_REPLICAS:
+        cache.set(get_table_pin_cache_key(table), True,
+                  settings.USER_TABLE_REPLICA_PIN_SECONDS)
+
+
+def is_pinned_to_primary(user, table):
+    return bool(cache.get_many([
+        get_user_pin_cache_key(user),
+        get_table_pin_cache_key(table)
+    ]))
+
+
+def get_replica_lag(alias):
+    """
+    Returns the replication lag in seconds of the replica with the provided connection
+    alias. The lag is cached for USER_TABLE_REPLICA_LAG_CHECK_INTERVAL seconds so that
+    it is not measured on every request. If the replica is not available None is
+    returned.
+
+    :param alias: The connection alias of the replica.
+    :type alias: str
+    :return: The lag in seconds or None if the replica is not available.
+    :rtype: float or None
+    """
+
+    cache_key = f'baserow_replica_lag_{alias}'
+    lag = cache.get(cache_key)
+
+    if lag is None:
+        try:
+            with connections[alias].cursor() as cursor:
+                # If everything that has been received is also replayed the replica
+                # is up to date, even if no transaction has been replayed recently.
+                cursor.execute("""
+                    SELECT CASE
+                        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+                            THEN 0
+                        ELSE COALESCE(
+                            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()),
+                            0
+                        )
+                    END
+                """)
+                lag = float(cursor.fetchone()[0] or 0)
+        except DatabaseError as e:
+            logger.warning(f'The lag of replica {alias} could not be measured: {e}')
+            lag = -1
+
+        cache.set(cache_key, lag, settings.USER_TABLE_REPLICA_LAG_CHECK_INTERVAL)
+        if lag >= 0:
+            replica_lag_seconds.labels(alias).set(lag)
+
+    return None if lag < 0 else lag
+
+
+def get_replica(shard):
+    """
+    Chooses one of the replicas of the shard that are not lagging more than the
+    USER_TABLE_REPLICA_MAX_LAG setting.
+
+    :param shard: The connection alias of the shard.
+    :type shard: str
+    :return: The connection alias of the chosen replica or None if there is no
+             usable replica.
+    :rtype: str or None
+    """
+
+    replicas = []
+    for alias in settings.USER_TABLE_DATABASE_REPLICAS.get(shard, []):
+        lag = get_replica_lag(alias)
+        if lag is None or lag > settings.USER_TABLE_REPLICA_MAX_LAG:
+            replica_skipped.labels(alias).inc()
+        else:
+            replicas.append(alias)
+
+    return random.choice(replicas) if replicas else None
+
+
+def get_read_database(shard):
+    """
+    Returns the connection alias from which the rows of a table stored in the provided
+    shard must be read. Within the `read_from_replica` context this is one of the
+    replicas of the shard, which is chosen once per context so that all the queries
+    read the same snapshot. Otherwise the shard itself is returned.
+
+    :param shard: The connection alias of the shard.
+    :type shard: str
+    :return: The connection alias to read from.
+    :rtype: str
+    """
+
+    replicas = getattr(_state, 'replicas', None)
+
+    if replicas is None:
+        database = shard
+    else:
+        if shard not in replicas:
+            replicas[shard] = get_replica(shard) or shard
+        database = replicas[shard]
+
+    user_table_reads.labels(database).inc()
+    return database
+
+
+def is_reading_from_replica(shard):
+    """
+    Indicates whether the rows of tables stored in the provided shard are read from
+    one of its replicas within the current `read_from_replica` context.
+
+    :param shard: The connection alias of the shard.
+    :type shard: str
+    :return: True if the rows are read from a replica.
+    :rtype: bool
+    """
+
+    replicas = getattr(_state, 'replicas', None)
+    return bool(replicas) and replicas.get(shard, shard) != shard
+
+
+@contextmanager
+def read_from_replica(user, table):
+    """
+    Reads the rows of generated table models from a replica within the context, if
+    the USER_TABLE_DATABASE_REPLICAS setting contains usable replicas. It must only be
+    used for read only requests because the replicas can lag a bit behind. The rows
+    are read from the primary if the user has recently changed rows or if the schema
+    of the table has recently changed.
+
+    Example:
+        with read_from_replica(request.user, table):
+            rows = list(table.get_model().objects.all())
+
+    :param user: The user on whose behalf the rows are read.
+    :type user: User
+    :param table: The table of which the rows are read.
+    :type table: Table
+    """
+
+    previous = getattr(_state, 'replicas', None)
+    use_replicas = (
+        settings.USER_TABLE_DATABASE_REPLICAS and
+        not is_pinned_to_primary(user, table)
+    )
+    _state.replicas = {} if use_replicas else None
+
+    try:
+        yield
+    finally:
+        _state.replicas = previous
@@ -0,0 +1,301 @@
+import time
+import logging
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.utils import OperationalError
+
+from prometheus_client import Counter, Histogram
+
+from baserow.contrib.database.table.models import (
+    TABLE_STORAGE_JSONB, JSONB_DATA_COLUMN, ROW_VERSION_FIELD
+)
+
+from .exceptions import TableSchemaLocked
+from .replicas import pin_table_to_primary
+
+
+logger = logging.getLogger(__name__)
+
+LOCK_NOT_AVAILABLE = '55P03'
+"""The PostgreSQL error code that is raised when the lock_timeout is exceeded."""
+
+TABLE_SCHEMA_ADVISORY_LOCK_NAMESPACE = 2147380001
+"""
+The first key of the two key advisory lock that serializes the schema changes of a
+table, the second key is the id of the table.
+"""
+
+advisory_lock_wait_seconds = Histogram(
+    'baserow_table_schema_advisory_lock_wait_seconds',
+    'Time spent waiting for other schema changes of the same table to complete.'
+)
+schema_change_seconds = Histogram(
+    'baserow_table_schema_change_seconds',
+    'Time spent changing the schema of a table, including waiting for the table '
+    'lock.'
+)
+lock_timeouts = Counter(
+    'baserow_table_schema_lock_timeouts_total',
+    'Amount of schema change attempts that exceeded the lock timeout.'
+)
+locked_failures = Counter(
+    'baserow_table_schema_locked_total',
+    'Amount of schema changes that failed because the table stayed locked after '
+    'all the retries.'
+)
+
+
+def is_lock_not_available_error(exception):
+    """
+    Checks if the provided exception has been raised because a lock could not be
+    obtained within the lock_timeout.
+
+    :param exception: The exception raised by the database.
+    :type exception: Exception
+    :rtype: bool
+    """
+
+    return getattr(exception.__cause__, 'pgcode', None) == LOCK_NOT_AVAILABLE
+
+
+def lock_table_schema(table, connection):
+    """
+    Acquires the advisory lock that serializes the schema changes of the table. It
+    must be called inside a transaction on the connection of the shard of the table
+    and is held until that transaction commits or rolls back. Operations that copy
+    the table based on its fields must acquire it before they select the fields, so
+    that fields can't be added or changed while the table is copied.
+
+    :param table: The table of which the schema is locked.
+    :type table: Table
+    :param connection: The connection of the database containing the table.
+    :type connection: DatabaseWrapper
+    """
+
+    with connection.cursor() as cursor:
+        with advisory_lock_wait_seconds.time():
+            cursor.execute(
+                'SELECT pg_advisory_xact_lock(%s, %s)',
+                [TABLE_SCHEMA_ADVISORY_LOCK_NAMESPACE, table.id]
+            )
+
+
+@contextmanager
+def hold_table_schema_lock(table, connection):
+    """
+    Holds the advisory lock that serializes the schema changes of the table within
+    the context. Unlike `lock_table_schema` the lock is held on the session, so it
+    is kept across the transactions that are committed within the context, like the
+    batches of a field conversion. The transaction level locks that are acquired
+    within the context by for example `alter_table_schema` are granted right away
+    because the session already holds the lock.
+
+    Example:
+        with hold_table_schema_lock(table, connection):
+            convert_in_batches()
+            alter_table_schema(table, swap_columns, connection)
+
+    :param table: The table of which the schema is locked.
+    :type table: Table
+    :param connection: The connection of the database containing the table.
+    :type connection: DatabaseWrapper
+    """
+
+    with connection.cursor() as cursor:
+        with advisory_lock_wait_seconds.time():
+            cursor.execute(
+                'SELECT pg_advisory_lock(%s, %s)',
+                [TABLE_SCHEMA_ADVISORY_LOCK_NAMESPACE, table.id]
+            )
+
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT pg_advisory_unlock(%s, %s)',
+                [TABLE_SCHEMA_ADVISORY_LOCK_NAMESPACE, table.id]
+            )
+
+
+def alter_table_schema(table, operation, connection=None):
+    """
+    Changes the schema of a user table without blocking the table for a long time.
+    A schema change needs an exclusive lock on the table. If it has to wait for that
+    lock behind a long running query, all the other queries on that table are queued
+    behind the schema change. Therefore the lock is only waited for a short time,
+    configured by the TABLE_SCHEMA_LOCK_TIMEOUT setting, after which the change is
+    retried with an exponential backoff. Concurrent schema changes of the same table
+    are serialized with an advisory lock that is held until the transaction commits.
+
+    Example:
+        alter_table_schema(
+            table,
+            lambda schema_editor: schema_editor.add_field(model, model_field)
+        )
+
+    :param table: The table of which the schema is changed.
+    :type table: Table
+    :param operation: Function that is called with the schema editor and changes the
+                      schema. It can be called multiple times if the table is locked.
+    :type operation: function
+    :param connection: The connection of the database containing the table. Defaults
+                       to the connection of the shard of the table.
+    :type connection: DatabaseWrapper
+    :raises TableSchemaLocked: When the lock could not be obtained after all the
+                               retries.
+    :return: The value returned by the operation.
+    :rtype: any
+    """
+
+    if not connection:
+        connection = connections[table.shard]
+
+    retries = settings.TABLE_SCHEMA_LOCK_RETRIES
+    attempt = 0
+
+    while True:
+        try:
+            with transaction.atomic(using=connection.alias):
+                lock_table_schema(table, connection)
+
+                with connection.cursor() as cursor:
+                    # The lock timeout is set locally so that it is reverted when
+                    # the savepoint is rolled back. If the change succeeds within an
+                    # outer transaction the previous value is restored afterwards.
+                    cursor.execute(
+                        "SELECT current_setting('lock_timeout'), "
+                        "set_config('lock_timeout', %s, true)",
+                        [f'{settings.TABLE_SCHEMA_LOCK_TIMEOUT}ms']
+                    )
+                    previous_lock_timeout = cursor.fetchone()[0]
+
+                with schema_change_seconds.time():
+                    with connection.schema_editor() as schema_editor:
+                        result = operation(schema_editor)
+
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT set_config('lock_timeout', %s, true)",
+                                   [previous_lock_timeout])
+
+                pin_table_to_primary(table)
+
+                return result
+        except OperationalError as e:
+            if not is_lock_not_available_error(e):
+                raise
+
+            lock_timeouts.inc()
+
+            if attempt >= retries:
+                locked_failures.inc()
+                raise TableSchemaLocked(f'The schema of table {table.id} could not '
+                                        f'be changed because it is locked.')
+
+            backoff = settings.TABLE_SCHEMA_LOCK_RETRY_BACKOFF * 2 ** attempt
+            logger.info(f'The schema of table {table.id} is locked, retrying in '
+                        f'{backoff} seconds.')
+            time.sleep(backoff)
+            attempt += 1
+
+
+def set_column_default(schema_editor, model, model_field):
+    """
+    Sets the default value of the model field as default of the column in the
+    database. Django only applies the default when inserting rows via the ORM, it
+    even drops the default from the column after adding it. Having the default in the
+    database means that inserts that do not go through the ORM, like COPY, also get
+    the default and that PostgreSQL 11 and newer can add a column with a default
+    without rewriting the table.
+
+    :param schema_editor: The schema editor that executes the statement.
+    :type schema_editor: BaseDatabaseSchemaEditor
+    :param model: The model containing the model field.
+    :type model: Model
+    :param model_field: The model field of which the default must be set.
+    :type model_field: models.Field
+    """
+
+    default = schema_editor.effective_default(model_field)
+    table_name = schema_editor.quote_name(model._meta.db_table)
+    column = schema_editor.quote_name(model_field.column)
+
+    if default is None:
+        schema_editor.execute(
+            f'ALTER TABLE {table_name} ALTER COLUMN {column} DROP DEFAULT'
+        )
+    else:
+        schema_editor.execute(
+            f'ALTER TABLE {table_name} ALTER COLUMN {column} SET DEFAULT %s',
+            [default]
+        )
+
+
+def create_model(schema_editor, model):
+    """
+    Creates the table of a generated table model like the schema editor does and
+    sets the defaults of all the field columns in the database. The JSONB data column
+    of a table with the JSONB storage gets a GIN index so that the values can be
+    searched.
+
+    :param schema_editor: The schema editor that creates the table.
+    :type schema_editor: BaseDatabaseSchemaEditor
+    :param model: The generated table model.
+    :type model: Model
+    """
+
+    schema_editor.create_model(model)
+    set_column_default(schema_editor, model, model._meta.get_field(ROW_VERSION_FIELD))
+
+    if model._storage == TABLE_STORAGE_JSONB:
+        model_field = model._meta.get_field(JSONB_DATA_COLUMN)
+        set_column_default(schema_editor, model, model_field)
+        schema_editor.execute(
+            f'CREATE INDEX {schema_editor.quote_name(f"{model._meta.db_table}_data")} '
+            f'ON {schema_editor.quote_name(model._meta.db_table)} '
+            f'USING GIN ({schema_editor.quote_name(model_field.column)} '
+            f'jsonb_path_ops)'
+        )
+        return
+
+    for field_object in model._field_objects.values():
+        model_field = model._meta.get_field(field_object['name'])
+        set_column_default(schema_editor, model, model_field)
+
+
+def add_field(schema_editor, model, model_field):
+    """
+    Adds the column of the model field like the schema editor does and keeps the
+    default of the column in the database.
+
+    :param schema_editor: The schema editor that adds the column.
+    :type schema_editor: BaseDatabaseSchemaEditor
+    :param model: The model to which the field is added.
+    :type model: Model
+    :param model_field: The model field that must be added.
+    :type model_field: models.Field
+    """
+
+    schema_editor.add_field(model, model_field)
+    set_column_default(schema_editor, model, model_field)
+
+
+def alter_field(schema_editor, model, old_model_field, new_model_field):
+    """
+    Alters the column of the model field like the schema editor does and sets the
+    default of the new model field in the database.
+
+    :param schema_editor: The schema editor that alters the column.
+    :type schema_editor: BaseDatabaseSchemaEditor
+    :param model: The model containing the old field.
+    :type model: Model
+    :param old_model_field: The model field that is altered.
+    :type old_model_field: models.Field
+    :param new_model_field: The model field that the column must be altered to.
+    :type new_model_field: models.Field
+    """
+
+    schema_editor.alter_field(model, old_model_field, new_model_field)
+    set_column_default(schema_editor, model, new_model_field)
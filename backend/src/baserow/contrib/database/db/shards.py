@@ -0,0 +1,75 @@
+from django.conf import settings
+from django.db.models import Count
+from django.utils.module_loading import import_string
+
+from baserow.contrib.database.table.models import Table
+
+
+class PlacementPolicy:
+    """
+    A placement policy decides in which of the USER_TABLE_DATABASES connections the
+    database table of a new table is created. The policy that is used can be
+    configured with the USER_TABLE_PLACEMENT_POLICY setting.
+
+    Example:
+        class FirstShardPlacementPolicy(PlacementPolicy):
+            def get_shard(self, database):
+                return settings.USER_TABLE_DATABASES[0]
+
+        USER_TABLE_PLACEMENT_POLICY = 'path.to.FirstShardPlacementPolicy'
+    """
+
+    def get_shard(self, database):
+        """
+        Should return the connection alias of the shard in which a new table of the
+        provided database must be created.
+
+        :param database: The database to which the new table belongs.
+        :type database: Database
+        :return: One of the USER_TABLE_DATABASES connection aliases.
+        :rtype: str
+        """
+
+        raise NotImplementedError('Each placement policy must have a get_shard '
+                                  'method.')
+
+
+class LeastTablesPlacementPolicy(PlacementPolicy):
+    """Places a new table in the shard that contains the least amount of tables."""
+
+    def get_shard(self, database):
+        shards = settings.USER_TABLE_DATABASES
+        table_counts = dict(
+            Table.objects.filter(shard__in=shards)
+            .order_by()
+            .values_list('shard')
+            .annotate(count=Count('id'))
+        )
+        return min(shards, key=lambda shard: table_counts.get(shard, 0))
+
+
+class DatabaseAffinityPlacementPolicy(LeastTablesPlacementPolicy):
+    """
+    Places a new table in the same shard as the other tables of the database so that
+    they could be queried together. The first table of a database is placed in the
+    shard that contains the least amount of tables.
+    """
+
+    def get_shard(self, database):
+        shard = Table.objects.filter(
+            database=database,
+            shard__in=settings.USER_TABLE_DATABASES
+        ).values_list('shard', flat=True).first()
+
+        return shard or super().get_shard(database)
+
+
+def get_placement_policy():
+    """
+    Returns an instance of the placement policy that is configured with the
+    USER_TABLE_PLACEMENT_POLICY setting.
+
+    :rtype: PlacementPolicy
+    """
+
+    return import_string(settings.USER_TABLE_PLACEMENT_POLICY)()
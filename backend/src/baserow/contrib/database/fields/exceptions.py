@@ -11,6 +11,18 @@ class FieldTypeDoesNotExist(InstanceTypeDoesNotExist):
     pass
 
 
+class FieldConverterAlreadyRegistered(InstanceTypeAlreadyRegistered):
+    pass
+
+
+class FieldConverterDoesNotExist(InstanceTypeDoesNotExist):
+    pass
+
+
+class FieldDoesNotExist(Exception):
+    """Raised when trying to get a field that doesn't exist."""
+
+
 class PrimaryFieldAlreadyExists(Exception):
     """Raised if a primary field is created, but is already exists for the table."""
 
@@ -0,0 +1,377 @@
+import json
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP, localcontext
+
+from django.db import models, transaction
+
+from baserow.contrib.database.db.schema import alter_table_schema, alter_field
+
+from .registries import FieldConverter, field_type_registry
+from .models import NUMBER_TYPE_INTEGER, TextField, NumberField
+
+
+class ShadowColumnFieldConverter(FieldConverter):
+    """
+    Abstract converter that converts the values of a field one by one in Python
+    instead of with one `ALTER COLUMN ... TYPE` statement. The converted values are
+    written to a shadow column in batches that are committed separately, so rows are
+    only locked for a short time and a failing value does not abort the conversion,
+    it is set to null instead. Rows that are updated during the conversion are marked
+    by a trigger and converted again right before the shadow column replaces the
+    original column. If the conversion does not complete, running it again resumes
+    where it stopped.
+    """
+
+    batch_size = 1000
+    """The amount of rows that are converted and committed at once."""
+
+    trigger_function_name = 'baserow_reset_conversion_state'
+    """
+    The name of the generic trigger function that marks a row as not converted when
+    the value of the converted column changes.
+    """
+
+    def convert_value(self, from_field, to_field, value):
+        """
+        Should convert a single non null value of the old field to a value of the new
+        field.
+
+        :param from_field: The old field instance.
+        :type from_field: Field
+        :param to_field: The new field instance.
+        :type to_field: Field
+        :param value: The old value that must be converted.
+        :type value: any
+        :raises ValueError: When the value cannot be converted. The new value is going
+                            to be null in that case.
+        :return: The converted value.
+        :rtype: any
+        """
+
+        raise NotImplementedError('Each shadow column field converter must have a '
+                                  'convert_value method.')
+
+    def get_shadow_model_field(self, model, model_field):
+        """
+        Returns the model field of the shadow column in which the converted values are
+        stored. It has the same type as the new model field, but always allows null.
+
+        :param model: The model to which the shadow field must be added.
+        :type model: Model
+        :param model_field: The new model field.
+        :type model_field: models.Field
+        :return: The shadow model field.
+        :rtype: models.Field
+        """
+
+        shadow_model_field = model_field.clone()
+        shadow_model_field.db_column = None
+        shadow_model_field.null = True
+        shadow_model_field.default = models.NOT_PROVIDED
+        shadow_model_field.set_attributes_from_name(f'{model_field.column}_conversion')
+        shadow_model_field.model = model
+        return shadow_model_field
+
+    def get_signature(self, to_field):
+        """
+        Returns a string that describes the new field. It is stored as comment of the
+        shadow column so that a later conversion can check if the already converted
+        values can be reused.
+
+        :param to_field: The new field instance.
+        :type to_field: Field
+        :return: The signature of the new field.
+        :rtype: str
+        """
+
+        to_field_type = field_type_registry.get_by_model(to_field)
+        return json.dumps({
+            'converter': self.type,
+            'type': to_field_type.type,
+            'values': {
+                name: getattr(to_field, name)
+                for name in to_field_type.allowed_fields
+            }
+        }, sort_keys=True, default=str)
+
+    def prepare_field(self, from_field, to_field, from_model, from_model_field,
+                      to_model_field, user, connection, progress):
+        table_name = from_model._meta.db_table
+        shadow_model_field = self.get_shadow_model_field(from_model, to_model_field)
+        self._create_shadow_column(from_field, to_field, from_model, from_model_field,
+                                   shadow_model_field, connection)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT MAX(id) FROM {connection.ops.quote_name(table_name)}'
+            )
+            max_id = cursor.fetchone()[0] or 0
+
+        # The progress is estimated based on the range of ids because counting the
+        # rows that still have to be converted would require a scan of the table.
+        backfill_progress = progress.create_child(100, max_id)
+        last_id = 0
+
+        while True:
+            last_converted_id, failed = self._convert_batch(
+                from_field, to_field, from_model, from_model_field, shadow_model_field,
+                connection, last_id
+            )
+
+            if last_converted_id is None:
+                break
+
+            backfill_progress.increment(
+                min(last_converted_id, max_id) - min(last_id, max_id),
+                failed=failed
+            )
+            last_id = last_converted_id
+
+    def alter_field(self, from_field, to_field, from_model, to_model,
+                    from_model_field, to_model_field, user, connection):
+        shadow_model_field = self.get_shadow_model_field(from_model, to_model_field)
+        quote_name = connection.ops.quote_name
+        table_name = quote_name(from_model._meta.db_table)
+
+        def swap_columns(schema_editor):
+            # Writes are blocked while the rows that have changed since they were
+            # converted are converted again and the columns are swapped. This lock is
+            # released when the transaction that updates the field is committed.
+            schema_editor.execute(f'LOCK TABLE {table_name} IN ACCESS EXCLUSIVE MODE')
+
+            last_id = 0
+            while last_id is not None:
+                last_id, _ = self._convert_batch(
+                    from_field, to_field, from_model, from_model_field,
+                    shadow_model_field, connection, last_id
+                )
+
+            self._drop_conversion_state(from_model, from_model_field, connection,
+                                        schema_editor)
+            schema_editor.execute(
+                f'COMMENT ON COLUMN {table_name}.'
+                f'{quote_name(shadow_model_field.column)} IS NULL'
+            )
+            schema_editor.remove_field(from_model, from_model_field)
+            alter_field(schema_editor, from_model, shadow_model_field, to_model_field)
+
+        alter_table_schema(from_field.table, swap_columns, connection)
+
+    def cleanup_field(self, field, model, model_field, connection):
+        shadow_column = f'{model_field.column}_conversion'
+
+        if self._get_column_comment(model, shadow_column, connection) is None:
+            return
+
+        def drop_columns(schema_editor):
+            self._drop_conversion_state(model, model_field, connection, schema_editor)
+            schema_editor.execute(
+                f'ALTER TABLE {connection.ops.quote_name(model._meta.db_table)} '
+                f'DROP COLUMN IF EXISTS {connection.ops.quote_name(shadow_column)}'
+            )
+
+        alter_table_schema(field.table, drop_columns, connection)
+
+    def _get_state_column(self, model_field):
+        return f'{model_field.column}_converted'
+
+    def _get_trigger_name(self, model_field):
+        return f'{model_field.column}_conversion'
+
+    def _get_column_comment(self, model, column, connection):
+        """
+        Returns the comment of the column or None if the column does not exist. An
+        existing column without comment results in an empty string.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                '''
+                SELECT COALESCE(col_description(attrelid, attnum), '')
+                FROM pg_attribute
+                WHERE attrelid = %s::regclass AND attname = %s AND NOT attisdropped
+                ''',
+                [connection.ops.quote_name(model._meta.db_table), column]
+            )
+            row = cursor.fetchone()
+            return row[0] if row else None
+
+    def _create_shadow_column(self, from_field, to_field, from_model,
+                              from_model_field, shadow_model_field, connection):
+        """
+        Creates the shadow column, the column that keeps track of which rows have been
+        converted and the trigger that resets that state when a row changes. If the
+        shadow column already exists for the same new field, the conversion is
+        resumed and nothing is created.
+        """
+
+        signature = self.get_signature(to_field)
+        existing_signature = self._get_column_comment(
+            from_model, shadow_model_field.column, connection
+        )
+
+        if existing_signature == signature:
+            return
+
+        quote_name = connection.ops.quote_name
+        table_name = quote_name(from_model._meta.db_table)
+        state_column = quote_name(self._get_state_column(from_model_field))
+
+        def create_columns(schema_editor):
+            if existing_signature is not None:
+                self._drop_conversion_state(from_model, from_model_field, connection,
+                                            schema_editor)
+                schema_editor.remove_field(from_model, shadow_model_field)
+
+            schema_editor.add_field(from_model, shadow_model_field)
+            schema_editor.execute(
+                f'COMMENT ON COLUMN {table_name}.'
+                f'{quote_name(shadow_model_field.column)} IS %s',
+                [signature]
+            )
+            schema_editor.execute(
+                f'ALTER TABLE {table_name} ADD COLUMN {state_column} boolean NULL'
+            )
+            schema_editor.execute(
+                f'''
+                CREATE OR REPLACE FUNCTION {self.trigger_function_name}()
+                RETURNS trigger AS $$
+                BEGIN
+                    NEW := jsonb_populate_record(
+                        NEW, jsonb_build_object(TG_ARGV[0], NULL)
+                    );
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql
+                '''
+            )
+            schema_editor.execute(
+                f'''
+                CREATE TRIGGER {quote_name(self._get_trigger_name(from_model_field))}
+                BEFORE UPDATE OF {quote_name(from_model_field.column)}
+                ON {table_name}
+                FOR EACH ROW EXECUTE PROCEDURE {self.trigger_function_name}(
+                    '{self._get_state_column(from_model_field)}'
+                )
+                '''
+            )
+
+        alter_table_schema(from_field.table, create_columns, connection)
+
+    def _drop_conversion_state(self, model, model_field, connection, schema_editor):
+        quote_name = connection.ops.quote_name
+        table_name = quote_name(model._meta.db_table)
+        schema_editor.execute(
+            f'DROP TRIGGER IF EXISTS {quote_name(self._get_trigger_name(model_field))} '
+            f'ON {table_name}'
+        )
+        schema_editor.execute(
+            f'ALTER TABLE {table_name} DROP COLUMN IF EXISTS '
+            f'{quote_name(self._get_state_column(model_field))}'
+        )
+
+    def _convert_batch(self, from_field, to_field, from_model, from_model_field,
+                       shadow_model_field, connection, last_id):
+        """
+        Converts the next batch of not yet converted rows with an id higher than the
+        provided last id in its own transaction.
+
+        :return: The id of the last converted row, or None if there was nothing left
+                 to convert, and the amount of values that could not be converted.
+        :rtype: tuple
+        """
+
+        quote_name = connection.ops.quote_name
+        table_name = quote_name(from_model._meta.db_table)
+        from_column = quote_name(from_model_field.column)
+        shadow_column = quote_name(shadow_model_field.column)
+        state_column = quote_name(self._get_state_column(from_model_field))
+
+        with transaction.atomic(using=connection.alias):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'''
+                    SELECT id, {from_column} FROM {table_name}
+                    WHERE id > %s AND {state_column} IS NULL
+                    ORDER BY id LIMIT %s FOR UPDATE
+                    ''',
+                    [last_id, self.batch_size]
+                )
+                rows = cursor.fetchall()
+
+                if len(rows) == 0:
+                    return None, 0
+
+                failed = 0
+                parameters = []
+                for row_id, value in rows:
+                    if value is not None:
+                        try:
+                            value = self.convert_value(from_field, to_field, value)
+                        except ValueError:
+                            value = None
+                            failed += 1
+                    parameters += [row_id, None if value is None else str(value)]
+
+                # The converted values are passed as text and cast to the type of the
+                # shadow column by the database.
+                db_type = shadow_model_field.db_type(connection)
+                placeholders = ', '.join(['(%s, %s)'] * len(rows))
+                cursor.execute(
+                    f'''
+                    UPDATE {table_name}
+                    SET {shadow_column} = CAST(v.value AS {db_type}),
+                        {state_column} = true
+                    FROM (VALUES {placeholders}) AS v (id, value)
+                    WHERE {table_name}.id = v.id
+                    ''',
+                    parameters
+                )
+
+        return rows[-1][0], failed
+
+
+class TextToNumberFieldConverter(ShadowColumnFieldConverter):
+    """
+    Converts a text field to a number field by parsing every value. Values that are
+    not a number or that do not fit in the number field are converted to null.
+    """
+
+    type = 'text_to_number'
+    min_integer = -2147483648
+    max_integer = 2147483647
+
+    def is_applicable(self, from_model, from_field, to_field):
+        return isinstance(from_field, TextField) and isinstance(to_field, NumberField)
+
+    def convert_value(self, from_field, to_field, value):
+        try:
+            number = Decimal(value.strip())
+        except InvalidOperation:
+            raise ValueError(f'The value {value} is not a number.')
+
+        if not number.is_finite():
+            raise ValueError(f'The value {value} is not a finite number.')
+
+        # The amount of digits before the decimal point is checked before rounding
+        # because rounding a number that has more digits than the precision of the
+        # decimal context would fail.
+        number_field_type = field_type_registry.get_by_model(to_field)
+        if number.adjusted() >= number_field_type.MAX_DIGITS:
+            raise ValueError(f'The value {value} has too many digits.')
+
+        with localcontext() as context:
+            context.prec = number_field_type.MAX_DIGITS * 2
+            if to_field.number_type == NUMBER_TYPE_INTEGER:
+                number = int(number.quantize(Decimal('1'), rounding=ROUND_HALF_UP))
+                if not self.min_integer <= number <= self.max_integer:
+                    raise ValueError(f'The value {value} does not fit in an integer.')
+            else:
+                number = number.quantize(
+                    Decimal(1).scaleb(-to_field.number_decimal_places),
+                    rounding=ROUND_HALF_UP
+                )
+
+        if not to_field.number_negative and number < 0:
+            raise ValueError(f'The value {value} cannot be negative.')
+
+        return number
@@ -1,4 +1,4 @@
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
 
 from django.db import models
 from django.core.exceptions import ValidationError
@@ -57,6 +57,14 @@ class NumberFieldType(FieldType):
                 **kwargs
             )
 
+    def get_jsonb_value(self, instance, value):
+        # Decimals are rounded like a numeric column would and stored as strings
+        # because JSON numbers could lose precision.
+        if isinstance(value, Decimal):
+            exponent = Decimal(1).scaleb(-instance.number_decimal_places)
+            return str(value.quantize(exponent, ROUND_HALF_UP))
+        return value
+
     def get_model_field(self, instance, **kwargs):
         kwargs['null'] = True
         kwargs['blank'] = True
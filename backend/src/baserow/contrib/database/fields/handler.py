@@ -1,16 +1,24 @@
 import logging
+from copy import deepcopy
 
-from django.db import connections
+from django.db import connections, transaction
 from django.db.utils import ProgrammingError, DataError
-from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 
 from baserow.core.exceptions import UserNotInGroupError
-from baserow.core.utils import extract_allowed, set_allowed_attrs
+from baserow.core.utils import extract_allowed, set_allowed_attrs, Progress
+
+from baserow.contrib.database.db.schema import (
+    alter_table_schema, add_field, alter_field, hold_table_schema_lock
+)
+from baserow.contrib.database.table.models import TABLE_STORAGE_JSONB
+from baserow.contrib.database.ws.events import publish_field_changed
 
 from .exceptions import (
-    PrimaryFieldAlreadyExists, CannotDeletePrimaryField, CannotChangeFieldType
+    PrimaryFieldAlreadyExists, CannotDeletePrimaryField, CannotChangeFieldType,
+    FieldDoesNotExist
 )
-from .registries import field_type_registry
+from .registries import field_type_registry, field_converter_registry
 from .models import Field
 
 
@@ -18,6 +26,32 @@ logger = logging.getLogger(__name__)
 
 
 class FieldHandler:
+    def get_field(self, user, field_id):
+        """
+        Selects a field with a given id from the database and checks if the user has
+        access to it.
+
+        :param user: The user on whose behalf the field is requested.
+        :type user: User
+        :param field_id: The identifier of the field that must be returned.
+        :type field_id: int
+        :return: The requested field in its most specific form.
+        :rtype: Field
+        """
+
+        try:
+            field = Field.objects.select_related('table__database__group').get(
+                id=field_id
+            )
+        except Field.DoesNotExist:
+            raise FieldDoesNotExist(f'The field with id {field_id} does not exist.')
+
+        group = field.table.database.group
+        if not group.has_user(user):
+            raise UserNotInGroupError(user, group)
+
+        return field.specific
+
     def create_field(self, user, table, type_name, primary=False, **kwargs):
         """
         Creates a new field with the given type for a table.
@@ -58,20 +92,33 @@ class FieldHandler:
 
         instance = model_class.objects.create(table=table, order=last_order,
                                               primary=primary, **field_values)
+        table.increment_schema_version()
+        publish_field_changed('field_created', instance, field_type)
+
+        # The values of a table with the JSONB storage are stored in one column, so
+        # adding a field only changes the metadata.
+        if table.storage == TABLE_STORAGE_JSONB:
+            return instance
 
         # Add the field to the table schema.
-        connection = connections[settings.USER_TABLE_DATABASE]
-        with connection.schema_editor() as schema_editor:
-            to_model = table.get_model(field_ids=[], fields=[instance])
-            model_field = to_model._meta.get_field(instance.db_column)
-            schema_editor.add_field(to_model, model_field)
+        to_model = table.get_model(field_ids=[], fields=[instance])
+        model_field = to_model._meta.get_field(instance.db_column)
+        alter_table_schema(
+            table,
+            lambda schema_editor: add_field(schema_editor, to_model, model_field)
+        )
 
         return instance
 
-    def update_field(self, user, field, new_type_name=None, **kwargs):
+    def update_field(self, user, field, new_type_name=None, progress=None, **kwargs):
         """
         Updates the values of the given field, if provided it is also possible to change
-        the type.
+        the type. If a field converter is applicable to the change, the values are
+        converted by that converter before the field is changed. The schema of the
+        table is locked until the field has been changed, so concurrent updates of
+        the same table are executed one after the other. Because the field could
+        have been changed while waiting for that lock, it is fetched again once the
+        lock has been acquired.
 
         :param user: The user on whose behalf the table is updated.
         :type user: User
@@ -79,6 +126,10 @@ class FieldHandler:
         :type field: Field
         :param new_type_name: If the type needs to be changed it can be provided here.
         :type new_type_name: str
+        :param progress: If provided, the progress of the conversion of the values and
+                         the amount of values that could not be converted are reported
+                         to this progress instance.
+        :type progress: Progress
         :param kwargs: The field values that need to be updated
         :type kwargs: object
         :return: The updated field instance.
@@ -92,39 +143,128 @@ class FieldHandler:
         if not group.has_user(user):
             raise UserNotInGroupError(user, group)
 
+        connection = connections[field.table.shard]
+
+        with hold_table_schema_lock(field.table, connection):
+            try:
+                current_field = Field.objects.select_related(
+                    'table__database__group'
+                ).get(id=field.id)
+            except Field.DoesNotExist:
+                raise FieldDoesNotExist(f'The field with id {field.id} does not '
+                                        f'exist.')
+
+            table = current_field.table
+            field = current_field.specific
+            field.table = table
+
+            return self._update_field(user, field, new_type_name, progress,
+                                      connection, **kwargs)
+
+    def _update_field(self, user, field, new_type_name, progress, connection,
+                      **kwargs):
+        """
+        Updates the field while the schema of the table is locked, see
+        `update_field`.
+        """
+
+        old_field = deepcopy(field)
         field_type = field_type_registry.get_by_model(field)
+        old_field_type = field_type
         from_model = field.table.get_model(field_ids=[], fields=[field])
+        from_model_field = self._get_model_field(from_model, field)
         from_field_type = field_type.type
+        new_model_class = None
 
         # If the provided field type does not match with the current one we need to
         # migrate the field to the new type.
         if new_type_name and field_type.type != new_type_name:
             field_type = field_type_registry.get(new_type_name)
             new_model_class = field_type.model_class
-            field.change_polymorphic_type_to(new_model_class)
 
         allowed_fields = ['name'] + field_type.allowed_fields
-        field = set_allowed_attrs(kwargs, allowed_fields, field)
-        field.save()
 
-        # Change the field in the table schema.
-        connection = connections[settings.USER_TABLE_DATABASE]
-        with connection.schema_editor() as schema_editor:
+        # The field converters need to know how the field is going to look before
+        # anything is changed, so an unsaved copy of the updated field is made first.
+        if new_model_class:
+            new_field = new_model_class(**{
+                model_field.attname: getattr(field, model_field.attname)
+                for model_field in Field._meta.concrete_fields
+            })
+            new_field.table = field.table
+            new_field.content_type = ContentType.objects.get_for_model(new_model_class)
+        else:
+            new_field = deepcopy(field)
+        new_field = set_allowed_attrs(kwargs, allowed_fields, new_field)
+        new_model = field.table.get_model(field_ids=[], fields=[new_field])
+        new_model_field = self._get_model_field(new_model, new_field)
+
+        jsonb_storage = field.table.storage == TABLE_STORAGE_JSONB
+        converter = None
+
+        # The values of a table with the JSONB storage are not converted, they are
+        # converted by the new field type when they are read.
+        if not jsonb_storage:
+            converter = field_converter_registry.find_applicable_converter(
+                from_model, old_field, new_field
+            )
+
+        if converter:
+            if not progress:
+                progress = Progress(100)
+
+            converter.prepare_field(old_field, new_field, from_model, from_model_field,
+                                    new_model_field, user, connection, progress)
+
+            if progress.failed > 0:
+                logger.info(f'{progress.failed} values could not be converted when '
+                            f'changing field {field.id} from {from_field_type} to '
+                            f'{field_type.type}.')
+
+        with transaction.atomic():
+            if new_model_class:
+                field.change_polymorphic_type_to(new_model_class)
+
+            field = set_allowed_attrs(kwargs, allowed_fields, field)
+
+            if jsonb_storage:
+                self._keep_jsonb_default(old_field, old_field_type, field,
+                                         from_model_field, new_model_field)
+
+            field.save()
+            field.table.increment_schema_version()
+            publish_field_changed('field_updated', field, field_type)
+
+            # Change the field in the table schema.
             to_model = field.table.get_model(field_ids=[], fields=[field])
-            from_model_field = from_model._meta.get_field(field.db_column)
-            to_model_field = to_model._meta.get_field(field.db_column)
+            to_model_field = self._get_model_field(to_model, field)
 
-            try:
-                schema_editor.alter_field(from_model, from_model_field, to_model_field)
-            except (ProgrammingError, DataError):
-                # If something is going wrong while changing the schema we will just
-                # raise a specific exception. In the future we want to have some sort
-                # of converter abstraction where the values of certain types can be
-                # converted to another value.
-                message = f'Could not alter field when changing field type ' \
-                          f'{from_field_type} to {new_type_name}.'
-                logger.error(message)
-                raise CannotChangeFieldType(message)
+            if converter:
+                converter.alter_field(old_field, field, from_model, to_model,
+                                      from_model_field, to_model_field, user,
+                                      connection)
+            elif not jsonb_storage:
+                self._cleanup_conversions(old_field, from_model, from_model_field,
+                                          connection)
+
+                try:
+                    alter_table_schema(
+                        field.table,
+                        lambda schema_editor: alter_field(
+                            schema_editor, from_model, from_model_field,
+                            to_model_field
+                        ),
+                        connection
+                    )
+                except (ProgrammingError, DataError):
+                    # If something is going wrong while changing the schema we will
+                    # just raise a specific exception. Field converters can be
+                    # registered for the type changes where the values should be
+                    # converted in a more lenient way.
+                    message = f'Could not alter field when changing field type ' \
+                              f'{from_field_type} to {new_type_name}.'
+                    logger.error(message)
+                    raise CannotChangeFieldType(message)
 
         return field
 
@@ -149,11 +289,69 @@ class FieldHandler:
             raise CannotDeletePrimaryField('Cannot delete the primary field of a '
                                            'table.')
 
+        field.table.increment_schema_version()
+        publish_field_changed('field_deleted', field,
+                              field_type_registry.get_by_model(field.specific_class))
+
+        # The values of a table with the JSONB storage are stored in one column, so
+        # deleting a field only changes the metadata. The values of the deleted field
+        # are ignored from then on.
+        if field.table.storage == TABLE_STORAGE_JSONB:
+            field.delete()
+            return
+
         # Remove the field from the table schema.
-        connection = connections[settings.USER_TABLE_DATABASE]
-        with connection.schema_editor() as schema_editor:
-            from_model = field.table.get_model(field_ids=[], fields=[field])
-            model_field = from_model._meta.get_field(field.db_column)
-            schema_editor.remove_field(from_model, model_field)
+        connection = connections[field.table.shard]
+        from_model = field.table.get_model(field_ids=[], fields=[field])
+        model_field = from_model._meta.get_field(field.db_column)
+        self._cleanup_conversions(field, from_model, model_field, connection)
+
+        alter_table_schema(
+            field.table,
+            lambda schema_editor: schema_editor.remove_field(from_model, model_field),
+            connection
+        )
 
         field.delete()
+
+    def _get_model_field(self, model, field):
+        """
+        Returns the model field of the field in the generated model. For a table with
+        the JSONB storage this is the model field that is used by the property that
+        accesses the value.
+        """
+
+        if model._storage == TABLE_STORAGE_JSONB:
+            return getattr(model, field.db_column).model_field
+
+        return model._meta.get_field(field.db_column)
+
+    def _keep_jsonb_default(self, old_field, old_field_type, field,
+                            old_model_field, new_model_field):
+        """
+        The rows of a table with the JSONB storage that existed before the field was
+        created don't have a value for it, the default of the field is returned
+        instead. If the default changes, the old default is stored with the field so
+        that those rows keep their value, just like the rows of a column would. The
+        rows themselves are not updated.
+        """
+
+        if field.jsonb_missing_default is not None:
+            return
+
+        old_default = old_model_field.get_default()
+        if old_default == new_model_field.get_default():
+            return
+
+        field.jsonb_missing_default = {
+            'value': old_field_type.get_jsonb_value(old_field, old_default)
+        }
+
+    def _cleanup_conversions(self, field, model, model_field, connection):
+        """
+        Lets every field converter remove what an incomplete conversion of the field
+        has left behind in the table schema.
+        """
+
+        for converter in field_converter_registry.registry.values():
+            converter.cleanup_field(field, model, model_field, connection)
@@ -0,0 +1,55 @@
+from baserow.api.v0.utils import validate_data_custom_fields, type_from_data_or_registry
+from baserow.api.v0.errors import ERROR_USER_NOT_IN_GROUP
+from baserow.core.exceptions import UserNotInGroupError
+from baserow.core.jobs.registries import JobType
+from baserow.contrib.database.api.v0.fields.errors import ERROR_FIELD_DOES_NOT_EXIST
+from baserow.contrib.database.api.v0.fields.serializers import (
+    UpdateFieldSerializer, UpdateFieldJobSerializer
+)
+
+from .exceptions import FieldDoesNotExist
+from .handler import FieldHandler
+from .registries import field_type_registry
+
+
+class UpdateFieldJobType(JobType):
+    """
+    Updates a field in the background. This is mainly useful when the type of a field
+    changes because the related column of a big table could be locked and converted
+    for a long time.
+    """
+
+    type = 'update_field'
+    serializer_class = UpdateFieldJobSerializer
+    api_exceptions_map = {
+        UserNotInGroupError: ERROR_USER_NOT_IN_GROUP,
+        FieldDoesNotExist: ERROR_FIELD_DOES_NOT_EXIST
+    }
+
+    def prepare_arguments(self, user, values):
+        field = FieldHandler().get_field(user, values['field_id'])
+        type_name = type_from_data_or_registry(values['values'], field_type_registry,
+                                               field)
+        field_values = validate_data_custom_fields(
+            type_name, field_type_registry, values['values'],
+            base_serializer_class=UpdateFieldSerializer
+        )
+
+        return {
+            'field_id': field.id,
+            'type_name': type_name,
+            'values': field_values
+        }
+
+    def run(self, job, progress):
+        handler = FieldHandler()
+        arguments = job.arguments
+
+        # The update is not wrapped in a transaction because a field converter can
+        # commit the converted values in batches. If the job fails or is cancelled
+        # while converting, running the same update again resumes the conversion.
+        field = handler.get_field(job.user, arguments['field_id'])
+        handler.update_field(job.user, field, arguments['type_name'],
+                             progress=progress, **arguments['values'])
+
+        return {'failed_conversions': progress.failed}
@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.fields import JSONField
 
 from baserow.core.utils import to_snake_case, remove_special_characters
 from baserow.core.mixins import OrderableMixin, PolymorphicContentTypeMixin
@@ -42,6 +43,14 @@ class Field(OrderableMixin, PolymorphicContentTypeMixin, models.Model):
         related_name='database_fields',
         on_delete=models.SET(get_default_field_content_type)
     )
+    jsonb_missing_default = JSONField(
+        null=True,
+        default=None,
+        help_text='The value of the rows of a table with the JSONB storage that '
+                  'existed before the field was created and don\'t contain a value '
+                  'for it. It is stored as {"value": ...} once the default of the '
+                  'field changes, until then the current default applies.'
+    )
 
     class Meta:
         ordering = ('-primary', 'order',)
@@ -1,8 +1,13 @@
+from django.core.exceptions import ValidationError
+
 from baserow.core.registry import (
     Instance, Registry, ModelInstanceMixin, ModelRegistryMixin,
     CustomFieldsInstanceMixin, CustomFieldsRegistryMixin
 )
-from .exceptions import FieldTypeAlreadyRegistered, FieldTypeDoesNotExist
+from .exceptions import (
+    FieldTypeAlreadyRegistered, FieldTypeDoesNotExist, FieldConverterAlreadyRegistered,
+    FieldConverterDoesNotExist
+)
 
 
 class FieldType(CustomFieldsInstanceMixin, ModelInstanceMixin, Instance):
@@ -50,6 +55,46 @@ class FieldType(CustomFieldsInstanceMixin, ModelInstanceMixin, Instance):
 
         return value
 
+    def decode_value(self, instance, serializer_field, value):
+        """
+        Validates, coerces and prepares a value of a row payload for the database in
+        one pass. This is used by the row codec for every path that writes rows. By
+        default the value is validated by the serializer field and then prepared by
+        the prepare_value_for_db method.
+
+        :param instance: The field instance.
+        :type instance: Field
+        :param serializer_field: The serializer field returned by the
+                                 get_serializer_field method.
+        :type serializer_field: serializer.Field
+        :param value: The value as provided in the payload.
+        :type value: any
+        :raises ValidationError: When the value is not valid, this can be the
+                                 ValidationError of Django or of Django REST framework.
+        :return: The value that is going to be saved in the database.
+        :rtype: any
+        """
+
+        return self.prepare_value_for_db(instance,
+                                         serializer_field.run_validation(value))
+
+    def encode_value(self, instance, serializer_field, value):
+        """
+        Converts the value of a row to the value that is returned by the API.
+
+        :param instance: The field instance.
+        :type instance: Field
+        :param serializer_field: The serializer field returned by the
+                                 get_serializer_field method.
+        :type serializer_field: serializer.Field
+        :param value: The value of the row.
+        :type value: any
+        :return: The JSON serializable value.
+        :rtype: any
+        """
+
+        return None if value is None else serializer_field.to_representation(value)
+
     def get_serializer_field(self, instance, **kwargs):
         """
         Should return the serializer field based on the custom model instance
@@ -83,6 +128,46 @@ class FieldType(CustomFieldsInstanceMixin, ModelInstanceMixin, Instance):
 
         raise NotImplementedError('Each must have his own get_model_field method.')
 
+    def get_jsonb_value(self, instance, value):
+        """
+        Tables with the JSONB storage keep the values of all the fields in one JSONB
+        column. This method converts the value, as it would be set on the model field,
+        to a value that can be stored in that column.
+
+        :param instance: The field instance of which the value is stored.
+        :type instance: Field
+        :param value: The value that must be stored.
+        :type value: any
+        :return: The JSON serializable value.
+        :rtype: any
+        """
+
+        return value
+
+    def get_value_from_jsonb(self, instance, model_field, value):
+        """
+        Converts a value stored in the JSONB column back to the value that the model
+        field would have in the columns storage. Because changing the type of a field
+        doesn't change the stored values of a table with the JSONB storage, the value
+        could have been stored by another field type. If it can't be converted the
+        default of the model field is returned.
+
+        :param instance: The field instance of which the value is read.
+        :type instance: Field
+        :param model_field: The model field that would contain the value in the
+                            columns storage.
+        :type model_field: models.Field
+        :param value: The value stored in the JSONB column.
+        :type value: any
+        :return: The converted value.
+        :rtype: any
+        """
+
+        try:
+            return model_field.to_python(value)
+        except ValidationError:
+            return model_field.get_default()
+
     def random_value(self, instance, fake):
         """
         Should return a random value that can be used as value for the field. This is
@@ -112,6 +197,157 @@ class FieldTypeRegistry(CustomFieldsRegistryMixin, ModelRegistryMixin, Registry)
     already_registered_exception_class = FieldTypeAlreadyRegistered
 
 
+class FieldConverter(Instance):
+    """
+    By default the type of a field is changed with one `ALTER COLUMN ... TYPE`
+    statement, which fails as a whole if one of the values cannot be converted. A
+    field converter can take over that conversion for specific combinations of field
+    types. If a converter is applicable the expensive part of the conversion happens
+    in the prepare_field method, before the field metadata changes, and the
+    alter_field method finishes it in the same transaction as the metadata change.
+
+    Example:
+        from baserow.contrib.database.fields.registries import (
+            FieldConverter, field_converter_registry
+        )
+
+        class ExampleFieldConverter(FieldConverter):
+            type = 'a-unique-field-converter-type'
+
+            def is_applicable(self, from_model, from_field, to_field):
+                return True
+
+            def alter_field(self, from_field, to_field, from_model, to_model,
+                            from_model_field, to_model_field, user, connection):
+                with connection.schema_editor() as schema_editor:
+                    schema_editor.remove_field(from_model, from_model_field)
+                    schema_editor.add_field(to_model, to_model_field)
+
+        field_converter_registry.register(ExampleFieldConverter())
+    """
+
+    def is_applicable(self, from_model, from_field, to_field):
+        """
+        Decides whether the converter is applicable to the alteration of the provided
+        fields. The first converter that is applicable is used.
+
+        :param from_model: The old model containing only the old field.
+        :type from_model: Model
+        :param from_field: The old field instance. It should only be used for type and
+                           property comparison with the to_field.
+        :type from_field: Field
+        :param to_field: The new field instance. This instance is not yet saved at
+                         this point and should only be used for comparison.
+        :type to_field: Field
+        :return: If True then the converter is going to be used for the alteration.
+        :rtype: bool
+        """
+
+        raise NotImplementedError('Each field converter must have an is_applicable '
+                                  'method.')
+
+    def prepare_field(self, from_field, to_field, from_model, from_model_field,
+                      to_model_field, user, connection, progress):
+        """
+        Does the expensive part of the conversion before the field metadata changes.
+        Because this method is not called within the transaction that changes the
+        metadata, it can for example commit its work in batches. If it does not
+        complete, the field is left untouched and running the same conversion again
+        should be able to resume.
+
+        :param from_field: The old field instance.
+        :type from_field: Field
+        :param to_field: The new, not yet saved, field instance.
+        :type to_field: Field
+        :param from_model: The old model containing only the old field.
+        :type from_model: Model
+        :param from_model_field: The old model field of the field.
+        :type from_model_field: models.Field
+        :param to_model_field: The new model field of the field.
+        :type to_model_field: models.Field
+        :param user: The user on whose behalf the field is altered.
+        :type user: User
+        :param connection: The connection of the database containing the table.
+        :type connection: DatabaseWrapper
+        :param progress: Must be incremented from 0 to 100 while preparing. Values
+                         that could not be converted must be reported as failed.
+        :type progress: Progress
+        """
+
+    def alter_field(self, from_field, to_field, from_model, to_model,
+                    from_model_field, to_model_field, user, connection):
+        """
+        Should finish the alteration of the field in the table schema. This method is
+        called in the same transaction as the one that changes the field metadata, so
+        it should be quick.
+
+        :param from_field: The old field instance.
+        :type from_field: Field
+        :param to_field: The new field instance.
+        :type to_field: Field
+        :param from_model: The old model containing only the old field.
+        :type from_model: Model
+        :param to_model: The new model containing only the new field.
+        :type to_model: Model
+        :param from_model_field: The old model field of the field.
+        :type from_model_field: models.Field
+        :param to_model_field: The new model field of the field.
+        :type to_model_field: models.Field
+        :param user: The user on whose behalf the field is altered.
+        :type user: User
+        :param connection: The connection of the database containing the table.
+        :type connection: DatabaseWrapper
+        """
+
+        raise NotImplementedError('Each field converter must have an alter_field '
+                                  'method.')
+
+    def cleanup_field(self, field, model, model_field, connection):
+        """
+        Should remove everything that an incomplete conversion has left behind in the
+        table schema. It is called before the column of the field is removed or
+        altered without this converter.
+
+        :param field: The field instance.
+        :type field: Field
+        :param model: The model containing only the field.
+        :type model: Model
+        :param model_field: The model field of the field.
+        :type model_field: models.Field
+        :param connection: The connection of the database containing the table.
+        :type connection: DatabaseWrapper
+        """
+
+
+class FieldConverterRegistry(Registry):
+    """
+    The registry that holds all the available field converters. A field converter can
+    be used to convert a field to another type in a custom way. It can also be used
+    when data must be converted in a special way.
+    """
+
+    name = 'field_converter'
+    does_not_exist_exception_class = FieldConverterDoesNotExist
+    already_registered_exception_class = FieldConverterAlreadyRegistered
+
+    def find_applicable_converter(self, *args, **kwargs):
+        """
+        Finds the first applicable converter that is in the register based on the
+        provided arguments. Note that the converters are tried in the order in which
+        they were registered.
+
+        :return: The applicable field converter or None if no converter has been
+                 found.
+        :rtype: None or FieldConverter
+        """
+
+        for converter in self.registry.values():
+            if converter.is_applicable(*args, **kwargs):
+                return converter
+        return None
+
+
 # A default field type registry is created here, this is the one that is used
 # throughout the whole Baserow application to add a new field type.
 field_type_registry = FieldTypeRegistry()
+field_converter_registry = FieldConverterRegistry()
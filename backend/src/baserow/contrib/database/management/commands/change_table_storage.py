@@ -0,0 +1,45 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from baserow.core.utils import Progress
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.models import Table, TABLE_STORAGE_CHOICES
+
+
+class Command(BaseCommand):
+    help = 'Changes the storage of a table between a column per field and one JSONB ' \
+           'column.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('table_id', type=int, help='The table of which the '
+                                                       'storage must be changed.')
+        parser.add_argument('storage', type=str,
+                            choices=[choice[0] for choice in TABLE_STORAGE_CHOICES],
+                            help='The new storage of the table.')
+        parser.add_argument('--batch-size', type=int, default=1000, help='The amount '
+                                                                         'of rows '
+                                                                         'that are '
+                                                                         'copied at '
+                                                                         'once.')
+
+    def handle(self, *args, **options):
+        table_id = options['table_id']
+        storage = options['storage']
+
+        try:
+            table = Table.objects.get(pk=table_id)
+        except Table.DoesNotExist:
+            self.stdout.write(self.style.ERROR(f"The table with id {table_id} was not "
+                                               f"found."))
+            sys.exit(1)
+
+        progress = Progress(100, callback=lambda percentage: (
+            self.stdout.write(f'{percentage}%')
+        ))
+        TableHandler().change_table_storage(table, storage, options['batch_size'],
+                                            progress)
+
+        self.stdout.write(self.style.SUCCESS(f'The storage of the table with id '
+                                             f'{table_id} has been changed to '
+                                             f'{storage}.'))
@@ -0,0 +1,60 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from baserow.core.utils import Progress
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.models import PendingTableDrop
+
+
+class Command(BaseCommand):
+    help = 'Starts a worker that drops the database tables of deleted tables in ' \
+           'small batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drops all the '
+                                                                'pending tables and '
+                                                                'stops afterwards.')
+        parser.add_argument('--batch-size', type=int, default=10, help='The maximum '
+                                                                       'amount of '
+                                                                       'tables that '
+                                                                       'are dropped '
+                                                                       'at once.')
+        parser.add_argument('--sleep', type=float, default=1.0, help='The amount of '
+                                                                     'seconds to wait '
+                                                                     'between two '
+                                                                     'batches.')
+
+    def handle(self, *args, **options):
+        once = options['once']
+        batch_size = options['batch_size']
+        sleep = options['sleep']
+        handler = TableHandler()
+
+        try:
+            while True:
+                # Because the worker is a long running process we need to make sure
+                # that broken or expired connections are replaced.
+                close_old_connections()
+                total = PendingTableDrop.objects.count()
+
+                if total > 0:
+                    self.stdout.write(f'Dropping {total} tables.')
+                    progress = Progress(total, callback=lambda percentage: (
+                        self.stdout.write(f'{percentage}%')
+                    ))
+
+                    # The batches are throttled so that the database has time to
+                    # process other queries between the drops.
+                    while handler.drop_pending_tables(batch_size, progress) > 0:
+                        time.sleep(sleep)
+
+                if once:
+                    break
+
+                time.sleep(sleep)
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS('Stopped dropping tables.'))
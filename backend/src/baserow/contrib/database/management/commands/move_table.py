@@ -0,0 +1,48 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from baserow.core.utils import Progress
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.models import Table
+
+
+class Command(BaseCommand):
+    help = 'Moves the rows of a table to another user table database shard.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('table_id', type=int, help='The table that needs to be '
+                                                       'moved.')
+        parser.add_argument('shard', type=str, help='The connection alias of the '
+                                                    'shard that the table must be '
+                                                    'moved to.')
+        parser.add_argument('--batch-size', type=int, default=1000, help='The amount '
+                                                                         'of rows '
+                                                                         'that are '
+                                                                         'copied at '
+                                                                         'once.')
+
+    def handle(self, *args, **options):
+        table_id = options['table_id']
+        shard = options['shard']
+
+        try:
+            table = Table.objects.get(pk=table_id)
+        except Table.DoesNotExist:
+            self.stdout.write(self.style.ERROR(f"The table with id {table_id} was not "
+                                               f"found."))
+            sys.exit(1)
+
+        source = table.shard
+        progress = Progress(100, callback=lambda percentage: (
+            self.stdout.write(f'{percentage}%')
+        ))
+
+        try:
+            TableHandler().move_table(table, shard, options['batch_size'], progress)
+        except ValueError as e:
+            self.stdout.write(self.style.ERROR(str(e)))
+            sys.exit(1)
+
+        self.stdout.write(self.style.SUCCESS(f'The table with id {table_id} has been '
+                                             f'moved from {source} to {shard}.'))
@@ -0,0 +1,25 @@
+# Generated by Django 2.2.2 on 2026-10-19 10:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0004_auto_20200117_1157'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingTableDrop',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True,
+                                        serialize=False, verbose_name='ID')),
+                ('db_table', models.CharField(max_length=255, unique=True)),
+                ('created_on', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ('id',),
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 2.2.2 on 2026-10-19 10:05
+
+import baserow.contrib.database.table.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0005_pendingtabledrop'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pendingtabledrop',
+            name='shard',
+            field=models.CharField(
+                default=baserow.contrib.database.table.models.get_default_table_shard,
+                max_length=255
+            ),
+        ),
+        migrations.AddField(
+            model_name='table',
+            name='shard',
+            field=models.CharField(
+                default=baserow.contrib.database.table.models.get_default_table_shard,
+                help_text='The database connection alias of the database in which '
+                          'the database table containing the rows is stored.',
+                max_length=255
+            ),
+        ),
+    ]
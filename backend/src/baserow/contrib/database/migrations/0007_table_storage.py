@@ -0,0 +1,25 @@
+# Generated by Django 2.2.2 on 2026-10-19 11:20
+
+import baserow.contrib.database.table.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0006_table_shard'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='table',
+            name='storage',
+            field=models.CharField(
+                choices=[('columns', 'Columns'), ('jsonb', 'JSONB')],
+                default=baserow.contrib.database.table.models.get_default_table_storage,
+                help_text='Indicates whether the values are stored in a column per '
+                          'field or in one JSONB column.',
+                max_length=32
+            ),
+        ),
+    ]
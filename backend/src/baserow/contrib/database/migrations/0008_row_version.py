@@ -0,0 +1,30 @@
+from django.db import connections, migrations
+
+
+def add_row_version_columns(apps, schema_editor):
+    """
+    Adds the version column to the database tables of the existing tables. They can be
+    stored in another database than the one that is migrated.
+    """
+
+    Table = apps.get_model('database', 'Table')
+
+    for table in Table.objects.using(schema_editor.connection.alias).iterator():
+        connection = connections[table.shard]
+        table_name = connection.ops.quote_name(f'database_table_{table.id}')
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'ALTER TABLE IF EXISTS {table_name} ADD COLUMN IF NOT EXISTS '
+                f'"version" integer NOT NULL DEFAULT 1 CHECK ("version" >= 0)'
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0007_table_storage'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_row_version_columns, migrations.RunPython.noop),
+    ]
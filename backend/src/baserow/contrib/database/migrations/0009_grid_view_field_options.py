@@ -0,0 +1,42 @@
+# Generated by Django 2.2.2 on 2026-10-19 10:39
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0008_row_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GridViewFieldOptions',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True,
+                                        serialize=False, verbose_name='ID')),
+                ('width', models.PositiveIntegerField(default=200)),
+                ('hidden', models.BooleanField(default=False)),
+                ('order', models.SmallIntegerField(default=32767)),
+                ('field', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    to='database.Field'
+                )),
+                ('grid_view', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    to='database.GridView'
+                )),
+            ],
+            options={
+                'ordering': ('field_id',),
+                'unique_together': {('grid_view', 'field')},
+            },
+        ),
+        migrations.AddField(
+            model_name='gridview',
+            name='field_options',
+            field=models.ManyToManyField(through='database.GridViewFieldOptions',
+                                         to='database.Field'),
+        ),
+    ]
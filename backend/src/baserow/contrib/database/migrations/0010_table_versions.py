@@ -0,0 +1,31 @@
+# Generated by Django 2.2.2 on 2026-10-19 10:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0009_grid_view_field_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='table',
+            name='data_version',
+            field=models.PositiveIntegerField(
+                default=1,
+                help_text='Incremented every time rows of the table are created, '
+                          'updated or deleted.'
+            ),
+        ),
+        migrations.AddField(
+            model_name='table',
+            name='schema_version',
+            field=models.PositiveIntegerField(
+                default=1,
+                help_text='Incremented every time the table, its fields or its '
+                          'views are changed.'
+            ),
+        ),
+    ]
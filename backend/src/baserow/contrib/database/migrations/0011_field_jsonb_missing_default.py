@@ -0,0 +1,27 @@
+# Generated by Django 2.2.2 on 2026-10-19 14:12
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0010_table_versions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='field',
+            name='jsonb_missing_default',
+            field=django.contrib.postgres.fields.jsonb.JSONField(
+                default=None,
+                null=True,
+                help_text='The value of the rows of a table with the JSONB storage '
+                          'that existed before the field was created and don\'t '
+                          'contain a value for it. It is stored as {"value": ...} '
+                          'once the default of the field changes, until then the '
+                          'current default applies.'
+            ),
+        ),
+    ]
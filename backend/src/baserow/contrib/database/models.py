@@ -1,12 +1,12 @@
 from baserow.core.models import Application
 
-from .table.models import Table
+from .table.models import Table, PendingTableDrop
 from .views.models import View, GridView
 from .fields.models import Field, TextField, NumberField, BooleanField
 
 __all__ = [
     'Database',
-    'Table',
+    'Table', 'PendingTableDrop',
     'View', 'GridView',
     'Field', 'TextField', 'NumberField', 'BooleanField',
 ]
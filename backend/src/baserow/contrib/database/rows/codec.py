@@ -0,0 +1,210 @@
+from django.core.exceptions import ValidationError
+
+from rest_framework.exceptions import ValidationError as SerializerValidationError
+
+from baserow.contrib.database.table.models import (
+    TABLE_STORAGE_JSONB, JSONB_DATA_COLUMN
+)
+
+
+class RowCodecField:
+    """
+    The compiled codec of one field of a table. It keeps the serializer field so that
+    it only has to be constructed once per generated model.
+    """
+
+    def __init__(self, field_id, field_object, model):
+        self.id = field_id
+        self.name = field_object['name']
+        self.field = field_object['field']
+        self.type = field_object['type']
+        self.serializer_field = self.type.get_serializer_field(self.field)
+        # The property that reads the value from the data column if the values of the
+        # table are stored in one JSONB column.
+        self.jsonb_value = (
+            getattr(model, self.name) if model._storage == TABLE_STORAGE_JSONB
+            else None
+        )
+
+    def decode(self, value):
+        return self.type.decode_value(self.field, self.serializer_field, value)
+
+    def encode(self, value):
+        return self.type.encode_value(self.field, self.serializer_field, value)
+
+
+class RowCodec:
+    """
+    Validates, coerces and prepares the values of a row payload for the database and
+    converts rows back to the values that the API returns, based on the fields of a
+    generated table model. It replaces the generated validation and response
+    serializers of the rows, which are expensive to construct and validate every
+    value twice.
+
+    Example:
+        codec = get_row_codec(model)
+        values = codec.decode({'field_1': 'Tesla', 2: '10.5'})
+        row = model.objects.create(**values)
+        codec.encode(row)
+    """
+
+    def __init__(self, model):
+        """
+        :param model: The generated table model.
+        :type model: Model
+        """
+
+        self.jsonb = model._storage == TABLE_STORAGE_JSONB
+        self.fields = []
+        self.fields_by_key = {}
+
+        for field_id, field_object in model._field_objects.items():
+            codec_field = RowCodecField(field_id, field_object, model)
+            self.fields.append(codec_field)
+            # The values can be provided by field id, by field id as string, by
+            # attribute name or by column name.
+            for key in (field_id, str(field_id), codec_field.name,
+                        codec_field.field.db_column):
+                self.fields_by_key[key] = codec_field
+
+    def decode(self, values):
+        """
+        Decodes the provided payload. Only the provided values are returned, unknown
+        keys are ignored. All the invalid values are collected before an error is
+        raised, so that the errors of all the fields can be reported at once.
+
+        :param values: The values of the row with the field id, the field id as
+                       string, the attribute name or the column name as key.
+        :type values: dict
+        :raises ValidationError: When one or more values are not valid. The error
+                                 contains the errors per attribute name.
+        :return: The values prepared for the database with the attribute name as key.
+        :rtype: dict
+        """
+
+        decoded = {}
+        errors = {}
+
+        for key, value in values.items():
+            codec_field = self.fields_by_key.get(key)
+            if codec_field is None:
+                continue
+
+            try:
+                decoded[codec_field.name] = codec_field.decode(value)
+            except SerializerValidationError as e:
+                errors[codec_field.name] = [
+                    ValidationError(str(detail), code=detail.code)
+                    for detail in e.detail
+                ]
+            except ValidationError as e:
+                errors[codec_field.name] = e.error_list
+
+        if errors:
+            raise ValidationError(errors)
+
+        return decoded
+
+    def encode(self, row, names=None):
+        """
+        Encodes the values of the row as they are returned by the API.
+
+        :param row: The row that must be encoded.
+        :type row: Model
+        :param names: If provided, only the values of the fields with these attribute
+                      names are encoded.
+        :type names: list or None
+        :return: The id and version of the row and the encoded values with the
+                 attribute name as key.
+        :rtype: dict
+        """
+
+        encoded = {'id': row.id, 'version': row.version}
+        encoded.update(self.encode_values(row, names))
+        return encoded
+
+    def encode_values(self, row, names=None):
+        """
+        Encodes only the values of the fields of the row.
+
+        :param row: The row that must be encoded.
+        :type row: Model
+        :param names: If provided, only the values of the fields with these attribute
+                      names are encoded.
+        :type names: list or None
+        :return: The encoded values with the attribute name as key.
+        :rtype: dict
+        """
+
+        return {
+            codec_field.name: codec_field.encode(getattr(row, codec_field.name))
+            for codec_field in self.fields
+            if names is None or codec_field.name in names
+        }
+
+    def get_column_names(self):
+        """
+        Returns the names of the values that must be selected for `encode_columns`,
+        for example via `queryset.values_list(*codec.get_column_names())`.
+
+        :return: The id, the version and the attribute names of all the fields or the
+                 data column if the values are stored in one JSONB column.
+        :rtype: list
+        """
+
+        if self.jsonb:
+            return ['id', 'version', JSONB_DATA_COLUMN]
+
+        return ['id', 'version'] + [codec_field.name for codec_field in self.fields]
+
+    def encode_columns(self, rows):
+        """
+        Encodes rows that have been selected as tuples in the order of
+        `get_column_names` into one list of values per column. Because the tuples
+        come straight from the database no model instances are constructed and the
+        keys of the fields are not repeated for every row.
+
+        :param rows: The tuples containing the values of the rows.
+        :type rows: list
+        :return: The ids and versions of the rows, the ids of the fields and a list
+                 containing the encoded values of the rows per field, in the same
+                 order as the field ids.
+        :rtype: dict
+        """
+
+        if self.jsonb:
+            ids, versions, data = list(zip(*rows)) or [(), (), ()]
+            values = [
+                [codec_field.jsonb_value.get_value_from_data(item) for item in data]
+                for codec_field in self.fields
+            ]
+        else:
+            columns = list(zip(*rows)) or [()] * (len(self.fields) + 2)
+            ids, versions, *values = columns
+
+        return {
+            'ids': list(ids),
+            'versions': list(versions),
+            'field_ids': [codec_field.id for codec_field in self.fields],
+            'columns': [
+                [codec_field.encode(value) for value in column]
+                for codec_field, column in zip(self.fields, values)
+            ]
+        }
+
+
+def get_row_codec(model):
+    """
+    Returns the row codec of the generated table model. It is compiled once and cached
+    on the model, so every path that uses the same model shares it.
+
+    :param model: The generated table model.
+    :type model: Model
+    :return: The row codec of the model.
+    :rtype: RowCodec
+    """
+
+    if '_row_codec' not in model.__dict__:
+        model._row_codec = RowCodec(model)
+
+    return model._row_codec
@@ -1,2 +1,9 @@
 class RowDoesNotExist(Exception):
     """Raised when trying to get a row that doesn't exist."""
+
+
+class RowVersionConflict(Exception):
+    """
+    Raised when a row is updated based on a version of the row that has been changed
+    by someone else in the meantime.
+    """
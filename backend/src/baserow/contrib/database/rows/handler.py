@@ -1,38 +1,21 @@
-import re
+import json
 
-from django.db import transaction
-from django.conf import settings
+from django.db import connections, transaction
 
 from baserow.core.exceptions import UserNotInGroupError
+from baserow.contrib.database.table.models import (
+    TABLE_STORAGE_JSONB, JSONB_DATA_COLUMN, ROW_VERSION_FIELD
+)
+from baserow.contrib.database.db.replicas import pin_user_to_primary
+from baserow.contrib.database.ws.events import (
+    publish_rows_created, publish_row_updated, publish_row_deleted
+)
 
-from .exceptions import RowDoesNotExist
+from .codec import get_row_codec
+from .exceptions import RowDoesNotExist, RowVersionConflict
 
 
 class RowHandler:
-    def prepare_values(self, fields, values):
-        """
-        Prepares a set of values so that they can be created or updated in the database.
-        It will check if the value can actually be set and prepares the value based on
-        the field type.
-
-        :param fields: The returned fields object from the get_model method.
-        :type fields: dict
-        :param values: The values that need to be prepared with the field id or the
-                       string 'field_{id}' as key.
-        :type values: dict
-        :return: The prepared values with the field name as key.
-        :rtype: dict
-        """
-
-        return {
-            field['name']: field['type'].prepare_value_for_db(
-                field['field'],
-                values[field_id] if field_id in values else values[field['name']]
-            )
-            for field_id, field in fields.items()
-            if field_id in values or field['name'] in values
-        }
-
     def extract_field_ids_from_dict(self, values):
         """
         Extracts the field ids from a dict containing the values that need to
@@ -44,13 +27,38 @@ class RowHandler:
         :rtype: list
         """
 
-        field_pattern = re.compile("^field_([0-9]+)$")
-        # @TODO improve this function
-        return [
-            int(re.sub("[^0-9]", "", str(key)))
-            for key in values.keys()
-            if str(key).isnumeric() or field_pattern.match(str(key))
-        ]
+        field_ids = []
+
+        for key in values.keys():
+            if isinstance(key, int):
+                field_ids.append(key)
+                continue
+
+            key = str(key)
+            if key.startswith('field_'):
+                key = key[6:]
+            if key.isdigit():
+                field_ids.append(int(key))
+
+        return field_ids
+
+    def extract_field_ids_from_string(self, value):
+        """
+        Extracts the field ids from a comma separated string. For example
+        'field_1,2' will result in [1, 2].
+
+        :param value: The string where to extract the field ids from.
+        :type value: str
+        :return: A list containing the field ids as integers.
+        :rtype: list
+        """
+
+        if not value:
+            return []
+
+        return self.extract_field_ids_from_dict(
+            dict.fromkeys(part.strip() for part in value.split(','))
+        )
 
     def create_row(self, user, table, values=None, model=None):
         """
@@ -66,6 +74,7 @@ class RowHandler:
         :param model: If a model is already generated it can be provided here to avoid
                       having to generate the model again.
         :type model: Model
+        :raises ValidationError: When one or more values are not valid.
         :return: The created row instance.
         :rtype: Model
         """
@@ -80,12 +89,63 @@ class RowHandler:
         if not model:
             model = table.get_model()
 
-        kwargs = self.prepare_values(model._field_objects, values)
-        return model.objects.create(**kwargs)
+        row = model.objects.create(**get_row_codec(model).decode(values))
+        self._increment_data_version_on_commit(table)
+        pin_user_to_primary(user)
+        publish_rows_created(table, model, [row])
+
+        return row
 
-    def update_row(self, user, table, row_id, values, model=None):
+    def create_rows(self, user, table, rows_values, model=None, decoded=False):
+        """
+        Creates multiple rows for a given table at once using a single insert query.
+
+        :param user: The user of whose behalf the rows are created.
+        :type user: User
+        :param table: The table for which to create the rows for.
+        :type table: Table
+        :param rows_values: A list containing the values of each row that must be
+                            created. The keys must be the field ids.
+        :type rows_values: list
+        :param model: If a model is already generated it can be provided here to avoid
+                      having to generate the model again.
+        :type model: Model
+        :param decoded: Indicates that the values have already been decoded by the row
+                        codec of the model, so that they are not decoded again.
+        :type decoded: bool
+        :raises ValidationError: When one or more values are not valid.
+        :return: The created row instances.
+        :rtype: list
         """
-        Updates one or more values of the provided row_id.
+
+        group = table.database.group
+        if not group.has_user(user):
+            raise UserNotInGroupError(user, group)
+
+        if not model:
+            model = table.get_model()
+
+        if not decoded:
+            codec = get_row_codec(model)
+            rows_values = [codec.decode(values) for values in rows_values]
+
+        rows = [model(**values) for values in rows_values]
+        rows = model.objects.bulk_create(rows)
+        self._increment_data_version_on_commit(table)
+        pin_user_to_primary(user)
+        publish_rows_created(table, model, rows)
+
+        return rows
+
+    def update_row(self, user, table, row_id, values, model=None, version=None):
+        """
+        Updates one or more values of the provided row_id. The row is updated with a
+        single query that only writes the changed columns and also increments the
+        version of the row, so no lock has to be held while the values are prepared.
+        The returned row only contains the changed values, the others are loaded when
+        they are accessed. If a version is provided the row is only updated if it
+        still has that version, otherwise someone else has changed the row in the
+        meantime and a RowVersionConflict is raised.
 
         :param user: The user of whose behalf the change is made.
         :type user: User
@@ -95,8 +155,15 @@ class RowHandler:
         :type row_id: int
         :param values: The values that must be updated. The keys must be the field ids.
         :type values: dict
-        :param model:
-        :type model:
+        :param model: If a model is already generated it can be provided here to avoid
+                      having to generate the model again.
+        :type model: Model
+        :param version: The version of the row that the changes are based on.
+        :type version: int or None
+        :raises ValidationError: When one or more values are not valid.
+        :raises RowDoesNotExist: When the row with the provided id does not exist.
+        :raises RowVersionConflict: When the row doesn't have the provided version
+                                    anymore.
         :return: The updated row instance.
         :rtype: Model
         """
@@ -109,21 +176,85 @@ class RowHandler:
             field_ids = self.extract_field_ids_from_dict(values)
             model = table.get_model(field_ids=field_ids)
 
-        # Because it is possible to have a different database for the user tables we
-        # need to start another transaction here, otherwise it is not possible to use
-        # the select_for_update function.
-        with transaction.atomic(settings.USER_TABLE_DATABASE):
-            try:
-                row = model.objects.select_for_update().get(id=row_id)
-            except model.DoesNotExist:
-                raise RowDoesNotExist(f'The row with id {row_id} does not exist.')
-
-            values = self.prepare_values(model._field_objects, values)
+        values = get_row_codec(model).decode(values)
+        connection = connections[table.shard]
+        quote_name = connection.ops.quote_name
+        assignments = []
+        params = []
+        # Only the changed columns are written and returned, the other columns of the
+        # row are not touched.
+        returned_fields = [
+            model._meta.get_field('id'),
+            model._meta.get_field(ROW_VERSION_FIELD)
+        ]
 
+        if model._storage == TABLE_STORAGE_JSONB:
+            if values:
+                data = {}
+                for name, value in values.items():
+                    field_value = getattr(model, name)
+                    data[field_value.key] = field_value.field_type.get_jsonb_value(
+                        field_value.field, value
+                    )
+                assignments.append(
+                    f'{quote_name(JSONB_DATA_COLUMN)} = '
+                    f'{quote_name(JSONB_DATA_COLUMN)} || %s::jsonb'
+                )
+                params.append(json.dumps(data))
+                returned_fields.append(model._meta.get_field(JSONB_DATA_COLUMN))
+        else:
             for name, value in values.items():
-                setattr(row, name, value)
+                model_field = model._meta.get_field(name)
+                assignments.append(f'{quote_name(model_field.column)} = %s')
+                params.append(model_field.get_db_prep_save(value, connection))
+                returned_fields.append(model_field)
+
+        version_column = quote_name(ROW_VERSION_FIELD)
+        assignments.append(f'{version_column} = {version_column} + 1')
+        sql = (
+            f'UPDATE {quote_name(model._meta.db_table)} '
+            f'SET {", ".join(assignments)} WHERE "id" = %s'
+        )
+        params.append(row_id)
+
+        if version is not None:
+            sql += f' AND {version_column} = %s'
+            params.append(version)
+
+        returning = ', '.join(quote_name(field.column) for field in returned_fields)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'{sql} RETURNING {returning}', params)
+            result = cursor.fetchone()
+
+        if result is None:
+            # The existence of the row is checked on the primary database because a
+            # replica might not have the row yet.
+            if (
+                version is not None and
+                model.objects.using(table.shard).filter(id=row_id).exists()
+            ):
+                raise RowVersionConflict(
+                    f'The row with id {row_id} does not have version {version} '
+                    f'anymore.'
+                )
+            raise RowDoesNotExist(f'The row with id {row_id} does not exist.')
 
-            row.save()
+        # The row is built from the returned values, the fields that have not been
+        # changed are deferred and only loaded when accessed.
+        row = model.from_db(
+            table.shard,
+            [field.attname for field in returned_fields],
+            [
+                field.from_db_value(value, None, connection)
+                if hasattr(field, 'from_db_value') else value
+                for field, value in zip(returned_fields, result)
+            ]
+        )
+
+        self._increment_data_version_on_commit(table)
+        pin_user_to_primary(user)
+        publish_row_updated(table, model, row, list(values.keys()))
 
         return row
 
@@ -150,4 +281,24 @@ class RowHandler:
         except model.DoesNotExist:
             raise RowDoesNotExist(f'The row with id {row_id} does not exist.')
 
+        row_id = row.id
         row.delete()
+        self._increment_data_version_on_commit(table)
+        pin_user_to_primary(user)
+        publish_row_deleted(table, row_id)
+
+    def _increment_data_version_on_commit(self, table):
+        """
+        Increments the data version of the table when the transaction of the shard
+        in which the rows have been changed commits, or right away outside a
+        transaction. The rows are then already visible, so a client can at worst see
+        the old version with the new rows, never the new version with the old rows.
+        Because the version is updated afterwards in its own short statement, the
+        table is not locked while the rows are changed, which would serialize all
+        the concurrent changes of the rows of the table.
+
+        :param table: The table of which the rows have been changed.
+        :type table: Table
+        """
+
+        transaction.on_commit(table.increment_data_version, using=table.shard)
@@ -0,0 +1,61 @@
+from django.db import transaction
+from django.core.exceptions import ValidationError
+
+from baserow.api.v0.errors import ERROR_USER_NOT_IN_GROUP
+from baserow.core.exceptions import UserNotInGroupError
+from baserow.core.jobs.registries import JobType
+from baserow.contrib.database.api.v0.tables.errors import ERROR_TABLE_DOES_NOT_EXIST
+from baserow.contrib.database.api.v0.rows.serializers import ImportRowsJobSerializer
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.exceptions import TableDoesNotExist
+
+from .codec import get_row_codec
+from .handler import RowHandler
+
+
+class ImportRowsJobType(JobType):
+    """
+    Imports a list of rows into an existing table in the background. All the rows are
+    validated first, after that they are inserted in batches. Every batch is committed
+    separately so that the progress is visible, which means that the rows of the
+    already inserted batches are kept if the job is cancelled.
+    """
+
+    type = 'import_rows'
+    serializer_class = ImportRowsJobSerializer
+    api_exceptions_map = {
+        UserNotInGroupError: ERROR_USER_NOT_IN_GROUP,
+        TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST
+    }
+    batch_size = 1000
+
+    def prepare_arguments(self, user, values):
+        table = TableHandler().get_table(user, values['table_id'])
+        return {'table_id': table.id, 'rows': values['rows']}
+
+    def run(self, job, progress):
+        table = TableHandler().get_table(job.user, job.arguments['table_id'])
+        rows = job.arguments['rows']
+        model = table.get_model()
+        codec = get_row_codec(model)
+        handler = RowHandler()
+
+        # The values are decoded once by the row codec, the batches are inserted
+        # without decoding them again.
+        validate_progress = progress.create_child(10, len(rows))
+        rows_values = []
+        for index, row in enumerate(rows):
+            try:
+                rows_values.append(codec.decode(row))
+            except ValidationError as e:
+                raise ValueError(f'Row {index} is invalid: {e.message_dict}')
+            validate_progress.increment()
+
+        insert_progress = progress.create_child(90, len(rows_values))
+        for start in range(0, len(rows_values), self.batch_size):
+            batch = rows_values[start:start + self.batch_size]
+            with transaction.atomic(table.shard):
+                handler.create_rows(job.user, table, batch, model=model, decoded=True)
+            insert_progress.increment(len(batch))
+
+        return {'imported_rows': len(rows_values)}
@@ -1,14 +1,27 @@
-from django.db import connections
+import logging
+
 from django.conf import settings
+from django.core.management.color import no_style
+from django.db import connections, transaction
+from django.db.utils import OperationalError
 
 from baserow.core.exceptions import UserNotInGroupError
 from baserow.core.utils import extract_allowed, set_allowed_attrs
 from baserow.contrib.database.fields.models import TextField
+from baserow.contrib.database.db.schema import (
+    alter_table_schema, lock_table_schema, create_model, is_lock_not_available_error
+)
+
+from baserow.contrib.database.db.shards import get_placement_policy
+from baserow.contrib.database.db.replicas import pin_table_to_primary
 
-from .models import Table
+from .models import Table, PendingTableDrop, TABLE_STORAGE_CHOICES
 from .exceptions import TableDoesNotExist
 
 
+logger = logging.getLogger(__name__)
+
+
 class TableHandler:
     def get_table(self, user, table_id):
         """
@@ -52,17 +65,19 @@ class TableHandler:
 
         table_values = extract_allowed(kwargs, ['name'])
         last_order = Table.get_last_order(database)
-        table = Table.objects.create(database=database, order=last_order,
+        shard = get_placement_policy().get_shard(database)
+        table = Table.objects.create(database=database, order=last_order, shard=shard,
                                      **table_values)
 
         # Create a primary text field for the table.
         TextField.objects.create(table=table, order=0, primary=True, name='Name')
 
         # Create the table schema in the database database.
-        connection = connections[settings.USER_TABLE_DATABASE]
-        with connection.schema_editor() as schema_editor:
-            model = table.get_model()
-            schema_editor.create_model(model)
+        model = table.get_model()
+        alter_table_schema(
+            table,
+            lambda schema_editor: create_model(schema_editor, model)
+        )
 
         return table
 
@@ -87,13 +102,20 @@ class TableHandler:
             raise UserNotInGroupError(user, table.database.group)
 
         table = set_allowed_attrs(kwargs, ['name'], table)
-        table.save()
+        # Only the name is saved so that the versions, which can be incremented
+        # concurrently, are not overwritten with the possibly outdated ones of the
+        # instance.
+        table.save(update_fields=['name'])
+        table.increment_schema_version()
 
         return table
 
     def delete_table(self, user, table):
         """
-        Deletes an existing table instance.
+        Deletes an existing table instance. The related database table is not dropped
+        right away because that could take a long time and many locks, it is
+        registered as pending drop and dropped in the background by the
+        drop_pending_tables method.
 
         :param user: The user on whose behalf the table is deleted.
         :type user: User
@@ -107,10 +129,242 @@ class TableHandler:
         if not table.database.group.has_user(user):
             raise UserNotInGroupError(user, table.database.group)
 
-        # Delete the table schema from the database.
-        connection = connections[settings.USER_TABLE_DATABASE]
-        with connection.schema_editor() as schema_editor:
+        self.schedule_table_drops([table])
+        table.delete()
+
+    def schedule_table_drops(self, tables):
+        """
+        Registers the database tables of the provided tables as pending drop. The
+        table instances themselves must be deleted by the caller, for example via a
+        cascading delete of the database.
+
+        :param tables: The tables of which the database tables must be dropped.
+        :type tables: list or QuerySet
+        """
+
+        PendingTableDrop.objects.bulk_create([
+            PendingTableDrop(db_table=table.get_database_table_name(),
+                             shard=table.shard)
+            for table in tables
+        ], ignore_conflicts=True)
+
+    def drop_pending_tables(self, batch_size=10, progress=None):
+        """
+        Drops the next batch of database tables that are pending to be dropped. Every
+        table is dropped in its own transaction with a short lock timeout so that a
+        table that is still in use does not block the other ones. Those tables stay
+        pending and are dropped in a later batch.
+
+        :param batch_size: The maximum amount of tables that are dropped.
+        :type batch_size: int
+        :param progress: If provided, it is incremented for every dropped table.
+        :type progress: Progress
+        :return: The amount of tables that have been dropped.
+        :rtype: int
+        """
+
+        pending_drops = PendingTableDrop.objects.all()[:batch_size]
+        dropped = 0
+
+        for pending_drop in pending_drops:
+            connection = connections[pending_drop.shard]
+
+            try:
+                with transaction.atomic(using=connection.alias):
+                    with connection.cursor() as cursor:
+                        cursor.execute(
+                            "SELECT set_config('lock_timeout', %s, true)",
+                            [f'{settings.TABLE_SCHEMA_LOCK_TIMEOUT}ms']
+                        )
+                        cursor.execute(
+                            f'DROP TABLE IF EXISTS '
+                            f'{connection.ops.quote_name(pending_drop.db_table)}'
+                        )
+            except OperationalError as e:
+                if not is_lock_not_available_error(e):
+                    raise
+
+                logger.info(f'Could not drop {pending_drop.db_table} because it is '
+                            f'locked, it will be retried later.')
+                continue
+
+            pending_drop.delete()
+            dropped += 1
+
+            if progress:
+                progress.increment()
+
+        return dropped
+
+    def move_table(self, table, shard, batch_size=1000, progress=None):
+        """
+        Moves the database table of the provided table to another shard. Writes to the
+        table are blocked while the rows are copied, reading is still possible. When
+        all the rows are copied the table is changed to the new shard and the old
+        database table is dropped.
+
+        :param table: The table that must be moved.
+        :type table: Table
+        :param shard: The connection alias of the shard that the table is moved to.
+        :type shard: str
+        :param batch_size: The amount of rows that are copied at once.
+        :type batch_size: int
+        :param progress: If provided, it is incremented for every copied row.
+        :type progress: Progress
+        :raises ValueError: When the shard is not one of the USER_TABLE_DATABASES.
+        :return: The moved table.
+        :rtype: Table
+        """
+
+        if shard not in settings.USER_TABLE_DATABASES:
+            raise ValueError(f'The shard {shard} is not one of the user table '
+                             f'databases.')
+
+        if table.shard == shard:
+            return table
+
+        source = connections[table.shard]
+        target = connections[shard]
+
+        with transaction.atomic(using=source.alias):
+            # The model is generated while holding the schema lock, so no field can be
+            # added or changed on the source table before it is dropped.
+            lock_table_schema(table, source)
             model = table.get_model()
-            schema_editor.delete_model(model)
+            table_name = source.ops.quote_name(model._meta.db_table)
 
-        table.delete()
+            with source.cursor() as cursor:
+                cursor.execute(f'LOCK TABLE {table_name} IN EXCLUSIVE MODE')
+
+            rows = model.objects.using(source.alias).order_by('id')
+            copy_progress = None
+            if progress:
+                copy_progress = progress.create_child(100, rows.count())
+
+            with transaction.atomic(using=target.alias):
+                with target.schema_editor() as schema_editor:
+                    create_model(schema_editor, model)
+
+                last_id = 0
+                while True:
+                    batch = list(rows.filter(id__gt=last_id)[:batch_size])
+                    if len(batch) == 0:
+                        break
+
+                    model.objects.using(target.alias).bulk_create(batch)
+                    last_id = batch[-1].id
+
+                    if copy_progress:
+                        copy_progress.increment(len(batch))
+
+                # Because the rows are inserted with their ids the sequence of the
+                # new table must continue after the highest id.
+                with target.cursor() as cursor:
+                    for sql in target.ops.sequence_reset_sql(no_style(), [model]):
+                        cursor.execute(sql)
+
+            Table.objects.filter(id=table.id).update(shard=shard)
+            table.shard = shard
+
+            with source.schema_editor() as schema_editor:
+                schema_editor.delete_model(model)
+
+        return table
+
+    def change_table_storage(self, table, storage, batch_size=1000, progress=None):
+        """
+        Changes the storage of the table between a column per field and one JSONB
+        column. A new database table with the new storage is created next to the
+        existing one and the rows are copied in batches while writing to the table is
+        blocked, reading is still possible. When all the rows are copied the old
+        database table is replaced by the new one.
+
+        :param table: The table of which the storage must be changed.
+        :type table: Table
+        :param storage: The new storage, one of the TABLE_STORAGE_CHOICES.
+        :type storage: str
+        :param batch_size: The amount of rows that are copied at once.
+        :type batch_size: int
+        :param progress: If provided, it is incremented for every copied row.
+        :type progress: Progress
+        :raises ValueError: When the storage is not one of the TABLE_STORAGE_CHOICES.
+        :return: The changed table.
+        :rtype: Table
+        """
+
+        if storage not in dict(TABLE_STORAGE_CHOICES):
+            raise ValueError(f'The storage {storage} does not exist.')
+
+        if table.storage == storage:
+            return table
+
+        connection = connections[table.shard]
+
+        with transaction.atomic(using=connection.alias):
+            # The models are generated while holding the schema lock, so no field can
+            # be added or changed on the old database table before it is replaced.
+            lock_table_schema(table, connection)
+            from_model = table.get_model()
+            table_name = from_model._meta.db_table
+
+            old_storage = table.storage
+            table.storage = storage
+            to_model = table.get_model()
+            table.storage = old_storage
+
+            # The new database table is created with a temporary name and gets the
+            # name of the old one after that one is dropped.
+            temporary_table_name = f'{table_name}_{storage}'
+            to_model._meta.db_table = temporary_table_name
+            field_names = [
+                field_object['name']
+                for field_object in from_model._field_objects.values()
+            ]
+
+            with connection.cursor() as cursor:
+                cursor.execute(f'LOCK TABLE {connection.ops.quote_name(table_name)} '
+                               f'IN EXCLUSIVE MODE')
+
+            rows = from_model.objects.using(connection.alias).order_by('id')
+            copy_progress = None
+            if progress:
+                copy_progress = progress.create_child(100, rows.count())
+
+            with connection.schema_editor() as schema_editor:
+                create_model(schema_editor, to_model)
+
+            last_id = 0
+            while True:
+                batch = list(rows.filter(id__gt=last_id)[:batch_size])
+                if len(batch) == 0:
+                    break
+
+                to_model.objects.using(connection.alias).bulk_create([
+                    to_model(id=row.id, version=row.version, **{
+                        name: getattr(row, name)
+                        for name in field_names
+                    })
+                    for row in batch
+                ])
+                last_id = batch[-1].id
+
+                if copy_progress:
+                    copy_progress.increment(len(batch))
+
+            # Because the rows are inserted with their ids the sequence of the new
+            # table must continue after the highest id.
+            with connection.cursor() as cursor:
+                for sql in connection.ops.sequence_reset_sql(no_style(), [to_model]):
+                    cursor.execute(sql)
+
+            with connection.schema_editor() as schema_editor:
+                schema_editor.delete_model(from_model)
+                schema_editor.alter_db_table(to_model, temporary_table_name,
+                                             table_name)
+
+            Table.objects.filter(id=table.id).update(storage=storage)
+            table.storage = storage
+
+        pin_table_to_primary(table)
+
+        return table
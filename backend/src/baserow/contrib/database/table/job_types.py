@@ -0,0 +1,32 @@
+from django.db import transaction
+
+from baserow.api.v0.errors import ERROR_USER_NOT_IN_GROUP
+from baserow.core.exceptions import UserNotInGroupError
+from baserow.core.jobs.registries import JobType
+from baserow.contrib.database.api.v0.tables.errors import ERROR_TABLE_DOES_NOT_EXIST
+from baserow.contrib.database.api.v0.tables.serializers import DeleteTableJobSerializer
+
+from .exceptions import TableDoesNotExist
+from .handler import TableHandler
+
+
+class DeleteTableJobType(JobType):
+    """Deletes a table and drops the related database table in the background."""
+
+    type = 'delete_table'
+    serializer_class = DeleteTableJobSerializer
+    api_exceptions_map = {
+        UserNotInGroupError: ERROR_USER_NOT_IN_GROUP,
+        TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST
+    }
+
+    def prepare_arguments(self, user, values):
+        table = TableHandler().get_table(user, values['table_id'])
+        return {'table_id': table.id}
+
+    def run(self, job, progress):
+        handler = TableHandler()
+
+        with transaction.atomic():
+            table = handler.get_table(job.user, job.arguments['table_id'])
+            handler.delete_table(job.user, table)
@@ -1,15 +1,143 @@
+from django.conf import settings
 from django.db import models
+from django.contrib.postgres.fields import JSONField
 
+from baserow.core.db import specific_iterator
 from baserow.core.mixins import OrderableMixin
+from baserow.core.metrics import record_timing
 from baserow.core.utils import to_pascal_case, remove_special_characters
 from baserow.contrib.database.config import DatabaseConfig
 from baserow.contrib.database.fields.registries import field_type_registry
 
 
+TABLE_STORAGE_COLUMNS = 'columns'
+TABLE_STORAGE_JSONB = 'jsonb'
+TABLE_STORAGE_CHOICES = (
+    (TABLE_STORAGE_COLUMNS, 'Columns'),
+    (TABLE_STORAGE_JSONB, 'JSONB'),
+)
+JSONB_DATA_COLUMN = 'data'
+ROW_VERSION_FIELD = 'version'
+RESERVED_ATTRIBUTE_NAMES = ('id', ROW_VERSION_FIELD, JSONB_DATA_COLUMN)
+
+
+def get_default_table_shard():
+    return settings.USER_TABLE_DATABASE
+
+
+def get_default_table_storage():
+    return settings.USER_TABLE_STORAGE
+
+
+class JSONBFieldValue(property):
+    """
+    The property that reads and writes the value of a field in the JSONB data column
+    of a row. The values are converted by the field type so that the property behaves
+    like the model field would in the columns storage. If the row doesn't have a
+    value for the field yet, which is the case for the rows that existed before the
+    field was created, the default that applied when the field was created is
+    returned.
+    """
+
+    def __init__(self, field, field_type, model_field):
+        """
+        :param field: The field of which the value must be accessed.
+        :type field: Field
+        :param field_type: The type of the field.
+        :type field_type: FieldType
+        :param model_field: The model field that would store the value in the columns
+                            storage. It is used for the default and the conversion.
+        :type model_field: models.Field
+        """
+
+        self.key = str(field.id)
+        self.field = field
+        self.field_type = field_type
+        self.model_field = model_field
+        self.db_column = field.db_column
+        super().__init__(self.get_value, self.set_value)
+
+    def get_value(self, row):
+        return self.get_value_from_data(getattr(row, JSONB_DATA_COLUMN))
+
+    def get_value_from_data(self, data):
+        """
+        Returns the value of the field from the data of a row, which is for example
+        useful when the data column has been selected without constructing the row.
+
+        :param data: The value of the JSONB data column of the row.
+        :type data: dict
+        :return: The value of the field.
+        :rtype: any
+        """
+
+        if self.key in data:
+            value = data[self.key]
+        elif self.field.jsonb_missing_default is not None:
+            value = self.field.jsonb_missing_default['value']
+        else:
+            return self.model_field.get_default()
+
+        return self.field_type.get_value_from_jsonb(self.field, self.model_field,
+                                                    value)
+
+    def set_value(self, row, value):
+        data = getattr(row, JSONB_DATA_COLUMN)
+        data[self.key] = self.field_type.get_jsonb_value(self.field, value)
+
+
+class JSONBTableModel(models.Model):
+    """
+    The base class of the generated models of tables with the JSONB storage. The
+    values of all the fields are stored in one JSONB column and the fields are
+    properties that read and write their value in that column.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # A new row gets the default values of all the fields, like it does in the
+        # columns storage. Rows loaded from the database are instantiated with
+        # positional arguments.
+        if not args:
+            data = getattr(self, JSONB_DATA_COLUMN)
+            for field_id, field_object in self._field_objects.items():
+                if str(field_id) not in data:
+                    name = field_object['name']
+                    model_field = getattr(type(self), name).model_field
+                    setattr(self, name, model_field.get_default())
+
+    class Meta:
+        abstract = True
+
+
 class Table(OrderableMixin, models.Model):
     database = models.ForeignKey('database.Database', on_delete=models.CASCADE)
     order = models.PositiveIntegerField()
     name = models.CharField(max_length=255)
+    shard = models.CharField(
+        max_length=255,
+        default=get_default_table_shard,
+        help_text='The database connection alias of the database in which the '
+                  'database table containing the rows is stored.'
+    )
+    storage = models.CharField(
+        max_length=32,
+        choices=TABLE_STORAGE_CHOICES,
+        default=get_default_table_storage,
+        help_text='Indicates whether the values are stored in a column per field or '
+                  'in one JSONB column.'
+    )
+    data_version = models.PositiveIntegerField(
+        default=1,
+        help_text='Incremented every time rows of the table are created, updated or '
+                  'deleted.'
+    )
+    schema_version = models.PositiveIntegerField(
+        default=1,
+        help_text='Incremented every time the table, its fields or its views are '
+                  'changed.'
+    )
 
     class Meta:
         ordering = ('order',)
@@ -36,6 +164,38 @@ class Table(OrderableMixin, models.Model):
 
         return name
 
+    def increment_data_version(self):
+        """
+        Increments the data version of the table. It must be called after the changes
+        of the rows have been committed, so that clients that use the version to
+        check if they are up to date never see the new version with the old rows.
+        """
+
+        Table.objects.filter(id=self.id).update(
+            data_version=models.F('data_version') + 1
+        )
+
+    def increment_schema_version(self):
+        """
+        Increments the schema version of the table. It must be called after the
+        table, its fields or its views have been changed.
+        """
+
+        Table.objects.filter(id=self.id).update(
+            schema_version=models.F('schema_version') + 1
+        )
+
+    def get_database_table_name(self):
+        """
+        Returns the name of the database table that contains the rows of this table.
+
+        :return: The database table name.
+        :rtype: str
+        """
+
+        return f'database_table_{self.id}'
+
+    @record_timing('get_model')
     def get_model(self, fields=None, field_ids=None, attribute_names=False):
         """
         Generates a django model based on available fields that belong to this table.
@@ -59,7 +219,7 @@ class Table(OrderableMixin, models.Model):
         app_label = f'{DatabaseConfig.name}_tables'
         meta = type('Meta', (), {
             'managed': False,
-            'db_table': f'database_table_{self.id}',
+            'db_table': self.get_database_table_name(),
             'app_label': app_label
         })
 
@@ -68,9 +228,18 @@ class Table(OrderableMixin, models.Model):
             '__module__': 'database.models',
             # An indication that the model is a generated table model.
             '_generated_table_model': True,
+            # The database connection alias where the table is stored, it is used by
+            # the database router.
+            '_shard': self.shard,
+            # Whether the values are stored in a column per field or in one JSONB
+            # column.
+            '_storage': self.storage,
             # An object containing the table fields, field types and the chosen names
             # with the table field id as key.
-            '_field_objects': {}
+            '_field_objects': {},
+            # Incremented on every update of the row, so that clients can detect that
+            # a row has been changed by someone else.
+            ROW_VERSION_FIELD: models.PositiveIntegerField(default=1)
         }
 
         # Construct a query to fetch all the fields of that table.
@@ -85,8 +254,12 @@ class Table(OrderableMixin, models.Model):
                 fields_query = fields_query.filter(pk__in=field_ids)
 
         # Create a combined list of fields that must be added and belong to the this
-        # table.
-        fields = fields + [field for field in fields_query]
+        # table. The specific instances are fetched with one query per field type
+        # instead of one query per field.
+        fields = fields + specific_iterator(fields_query)
+
+        if self.storage == TABLE_STORAGE_JSONB:
+            attrs[JSONB_DATA_COLUMN] = JSONField(default=dict)
 
         # If there are duplicate field names we have to store them in a list so we know
         # later which ones are duplicate.
@@ -102,6 +275,9 @@ class Table(OrderableMixin, models.Model):
             # but we will rather use a name the user provided.
             if attribute_names:
                 field_name = field.model_attribute_name
+                # The attributes that every table model has can't be overwritten.
+                if field_name in RESERVED_ATTRIBUTE_NAMES:
+                    field_name = f'{field_name}_{field.db_column}'
                 # If the field name already exists we will append '_field_{id}' to each
                 # entry that is a duplicate.
                 if field_name in attrs:
@@ -122,13 +298,22 @@ class Table(OrderableMixin, models.Model):
             # Add the field to the attribute dict that is used to generate the model.
             # All the kwargs that are passed to the `get_model_field` method are going
             # to be passed along to the model field.
-            attrs[field_name] = field_type.get_model_field(
+            model_field = field_type.get_model_field(
                 field, db_column=field.db_column, verbose_name=field.name)
 
+            if self.storage == TABLE_STORAGE_JSONB:
+                attrs[field_name] = JSONBFieldValue(field, field_type, model_field)
+            else:
+                attrs[field_name] = model_field
+
         # Create the model class.
         model = type(
             str(f'{self.model_class_name}TableModel'),
-            (models.Model,),
+            (
+                JSONBTableModel
+                if self.storage == TABLE_STORAGE_JSONB
+                else models.Model,
+            ),
             attrs
         )
 
@@ -138,3 +323,18 @@ class Table(OrderableMixin, models.Model):
         del all_models[app_label][model_name]
 
         return model
+
+
+class PendingTableDrop(models.Model):
+    """
+    When a table is deleted its metadata is deleted right away, but dropping the
+    related database table is deferred. This model keeps track of the database tables
+    that still have to be dropped in the background.
+    """
+
+    db_table = models.CharField(max_length=255, unique=True)
+    shard = models.CharField(max_length=255, default=get_default_table_shard)
+    created_on = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ('id',)
@@ -7,6 +7,13 @@ class ViewDoesNotExist(Exception):
     """Raised when trying to get a view that doesn't exist."""
 
 
+class UnrelatedFieldError(Exception):
+    """
+    Raised when field options are provided for a field that doesn't belong to the
+    table of the view.
+    """
+
+
 class ViewTypeAlreadyRegistered(InstanceTypeAlreadyRegistered):
     pass
 
@@ -1,9 +1,9 @@
 from baserow.core.exceptions import UserNotInGroupError
 from baserow.core.utils import extract_allowed, set_allowed_attrs
 
-from .exceptions import ViewDoesNotExist
+from .exceptions import ViewDoesNotExist, UnrelatedFieldError
 from .registries import view_type_registry
-from .models import View
+from .models import View, GridViewFieldOptions
 
 
 class ViewHandler:
@@ -68,6 +68,7 @@ class ViewHandler:
 
         instance = model_class.objects.create(table=table, order=last_order,
                                               **view_values)
+        table.increment_schema_version()
 
         return instance
 
@@ -96,6 +97,7 @@ class ViewHandler:
         allowed_fields = ['name'] + view_type.allowed_fields
         view = set_allowed_attrs(kwargs, allowed_fields, view)
         view.save()
+        view.table.increment_schema_version()
 
         return view
 
@@ -117,3 +119,70 @@ class ViewHandler:
             raise UserNotInGroupError(user, group)
 
         view.delete()
+        view.table.increment_schema_version()
+
+    def update_grid_view_field_options(self, user, grid_view, field_options):
+        """
+        Updates the field options of the provided fields in the grid view. Options
+        that don't exist yet are created.
+
+        :param user: The user on whose behalf the options are updated.
+        :type user: User
+        :param grid_view: The grid view of which the field options are updated.
+        :type grid_view: GridView
+        :param field_options: A dict containing the field id as key and a dict with
+                              the options that must be updated as value. For example
+                              {1: {'hidden': True, 'width': 100}}.
+        :type field_options: dict
+        :raises UnrelatedFieldError: When a field doesn't belong to the table of the
+                                     grid view.
+        :return: The field options of all the fields of the table.
+        :rtype: list
+        """
+
+        group = grid_view.table.database.group
+        if not group.has_user(user):
+            raise UserNotInGroupError(user, group)
+
+        field_ids = {int(field_id) for field_id in field_options.keys()}
+        existing_field_ids = set(
+            grid_view.table.field_set.filter(id__in=field_ids).values_list(
+                'id', flat=True
+            )
+        )
+        unrelated_field_ids = field_ids - existing_field_ids
+        if unrelated_field_ids:
+            raise UnrelatedFieldError(
+                f'The fields {sorted(unrelated_field_ids)} are not related to the '
+                f'grid view {grid_view.id}.'
+            )
+
+        # The options are created and updated in bulk so that the amount of queries
+        # doesn't depend on the amount of fields.
+        existing_options = {
+            options.field_id: options
+            for options in GridViewFieldOptions.objects.filter(grid_view=grid_view,
+                                                               field_id__in=field_ids)
+        }
+        allowed_fields = ['width', 'hidden', 'order']
+        create_options = []
+        update_options = []
+
+        for field_id, options in field_options.items():
+            instance = existing_options.get(int(field_id))
+            if instance:
+                update_options.append(instance)
+            else:
+                instance = GridViewFieldOptions(grid_view=grid_view,
+                                                field_id=int(field_id))
+                create_options.append(instance)
+            set_allowed_attrs(options, allowed_fields, instance)
+
+        if create_options:
+            GridViewFieldOptions.objects.bulk_create(create_options)
+        if update_options:
+            GridViewFieldOptions.objects.bulk_update(update_options, allowed_fields)
+
+        grid_view.table.increment_schema_version()
+
+        return grid_view.get_field_options()
@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.contenttypes.models import ContentType
 
+from baserow.core.db import specific_iterator
 from baserow.core.mixins import OrderableMixin, PolymorphicContentTypeMixin
 
 
@@ -29,4 +30,123 @@ class View(OrderableMixin, PolymorphicContentTypeMixin, models.Model):
 
 
 class GridView(View):
-    pass
+    field_options = models.ManyToManyField('database.Field',
+                                           through='GridViewFieldOptions')
+
+    def get_field_options(self, fields=None):
+        """
+        Returns the field options of all the fields of the table. If a field doesn't
+        have options yet an unsaved instance containing the defaults is returned for
+        it, so that the options only have to be stored once they are changed.
+
+        :param fields: If the fields of the table have already been fetched they can
+                       be provided, so that they don't have to be fetched again.
+        :type fields: None or list
+        :return: A list containing the field options ordered by field id.
+        :rtype: list
+        """
+
+        field_options = {
+            options.field_id: options
+            for options in GridViewFieldOptions.objects.filter(grid_view=self)
+        }
+        if fields is None:
+            field_ids = self.table.field_set.order_by('id').values_list(
+                'id', flat=True
+            )
+        else:
+            field_ids = sorted(field.id for field in fields)
+
+        return [
+            field_options.get(field_id) or
+            GridViewFieldOptions(grid_view=self, field_id=field_id)
+            for field_id in field_ids
+        ]
+
+    def get_visible_fields(self, field_ids=None, fields=None, field_options=None):
+        """
+        Returns the fields of the table that are not hidden in this view. The primary
+        field can't be hidden.
+
+        :param field_ids: If provided the fields are narrowed further down to the
+                          fields with these ids.
+        :type field_ids: None or list
+        :param fields: If the fields of the table have already been fetched they can
+                       be provided, they are then filtered instead of selected.
+        :type fields: None or list
+        :param field_options: If the field options of the provided fields have
+                              already been fetched they can be provided, so that they
+                              don't have to be fetched again.
+        :type field_options: None or list
+        :return: A queryset selecting the visible fields or, if the fields are
+                 provided, a list containing the visible ones.
+        :rtype: QuerySet or list
+        """
+
+        if fields is None:
+            hidden_field_ids = GridViewFieldOptions.objects.filter(
+                grid_view=self, hidden=True
+            ).values('field_id')
+            queryset = self.table.field_set.exclude(id__in=hidden_field_ids,
+                                                    primary=False)
+
+            if field_ids is not None:
+                queryset = queryset.filter(id__in=field_ids)
+
+            return queryset
+
+        if field_options is None:
+            field_options = self.get_field_options(fields)
+
+        hidden_field_ids = {
+            options.field_id for options in field_options if options.hidden
+        }
+        return [
+            field for field in fields
+            if (field.primary or field.id not in hidden_field_ids) and
+            (field_ids is None or field.id in field_ids)
+        ]
+
+    def get_model(self, field_ids=None, fields=None, field_options=None):
+        """
+        Generates the model of the table containing only the visible fields, so that
+        only their columns are selected.
+
+        :param field_ids: If provided the fields are narrowed further down to the
+                          fields with these ids.
+        :type field_ids: None or list
+        :param fields: If the specific fields of the table have already been fetched
+                       they can be provided, so that they don't have to be fetched
+                       again.
+        :type fields: None or list
+        :param field_options: If the field options of the provided fields have
+                              already been fetched they can be provided, so that they
+                              don't have to be fetched again.
+        :type field_options: None or list
+        :return: The generated model.
+        :rtype: Model
+        """
+
+        if fields is None:
+            fields = specific_iterator(self.get_visible_fields(field_ids))
+        else:
+            fields = self.get_visible_fields(field_ids, fields, field_options)
+
+        return self.table.get_model(fields=fields, field_ids=[])
+
+
+class GridViewFieldOptions(models.Model):
+    """
+    The options of a field in a grid view, like whether the column is hidden, its
+    width and position. A field that doesn't have options uses the defaults.
+    """
+
+    grid_view = models.ForeignKey(GridView, on_delete=models.CASCADE)
+    field = models.ForeignKey('database.Field', on_delete=models.CASCADE)
+    width = models.PositiveIntegerField(default=200)
+    hidden = models.BooleanField(default=False)
+    order = models.SmallIntegerField(default=32767)
+
+    class Meta:
+        ordering = ('field_id',)
+        unique_together = ('grid_view', 'field')
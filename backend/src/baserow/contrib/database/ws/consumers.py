@@ -0,0 +1,85 @@
+from asgiref.sync import async_to_sync
+from channels.generic.websocket import JsonWebsocketConsumer
+
+from baserow.core.exceptions import UserNotInGroupError
+from baserow.contrib.database.table.exceptions import TableDoesNotExist
+from baserow.contrib.database.table.handler import TableHandler
+
+from .events import get_table_group_name
+
+
+class TableConsumer(JsonWebsocketConsumer):
+    """
+    Pushes the changes of the rows and fields of a table to the client, so that it
+    doesn't have to poll the table. The changes made within one transaction are sent
+    as one message:
+
+        {
+            "type": "table_events",
+            "table_id": 1,
+            "events": [
+                {"type": "row_created", "row_id": 1, "values": {"field_1": "A"}},
+                {"type": "row_updated", "row_id": 2, "values": {"field_1": "B"}},
+                {"type": "row_deleted", "row_id": 3},
+                {"type": "field_created", "field_id": 2, "name": "Name",
+                 "field_type": "text"}
+            ]
+        }
+
+    The access of the user to the table is checked when connecting and again before
+    the events are delivered, so the connection is closed if the user has been
+    removed from the group or if the table has been deleted in the meantime.
+    """
+
+    group_name = None
+
+    def connect(self):
+        user = self.scope['user']
+        table_id = self.scope['url_route']['kwargs']['table_id']
+
+        if not user.is_authenticated:
+            self.close()
+            return
+
+        self.table_id = table_id
+
+        if not self.has_access():
+            self.close()
+            return
+
+        self.group_name = get_table_group_name(table_id)
+        async_to_sync(self.channel_layer.group_add)(self.group_name, self.channel_name)
+        self.accept()
+
+    def disconnect(self, code):
+        if self.group_name:
+            async_to_sync(self.channel_layer.group_discard)(self.group_name,
+                                                            self.channel_name)
+            self.group_name = None
+
+    def has_access(self):
+        """
+        Checks if the user of the connection still has access to the table.
+
+        :return: Whether the user belongs to the group of the table.
+        :rtype: bool
+        """
+
+        try:
+            TableHandler().get_table(self.scope['user'], self.table_id)
+        except (TableDoesNotExist, UserNotInGroupError):
+            return False
+
+        return True
+
+    def events_batch(self, message):
+        if not self.has_access():
+            self.disconnect(None)
+            self.close()
+            return
+
+        self.send_json({
+            'type': 'table_events',
+            'table_id': self.table_id,
+            'events': message['events']
+        })
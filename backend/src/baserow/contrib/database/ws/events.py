@@ -0,0 +1,60 @@
+from baserow.ws.events import publish_event
+from baserow.contrib.database.rows.codec import get_row_codec
+
+
+def get_table_group_name(table_id):
+    return f'database-table-{table_id}'
+
+
+def publish_table_event(table, event, using=None):
+    """
+    Publishes an event to the WebSocket connections that are subscribed to the table.
+    The event is sent when the transaction commits.
+
+    :param table: The table in which something has changed.
+    :type table: Table
+    :param event: The event that describes the change.
+    :type event: dict
+    :param using: The alias of the database connection of which the transaction
+                  must commit.
+    :type using: str
+    """
+
+    publish_event(get_table_group_name(table.id), event, using=using)
+
+
+def publish_rows_created(table, model, rows):
+    codec = get_row_codec(model)
+
+    for row in rows:
+        publish_table_event(table, {
+            'type': 'row_created',
+            'row_id': row.id,
+            'version': row.version,
+            'values': codec.encode_values(row)
+        }, using=table.shard)
+
+
+def publish_row_updated(table, model, row, names):
+    publish_table_event(table, {
+        'type': 'row_updated',
+        'row_id': row.id,
+        'version': row.version,
+        'values': get_row_codec(model).encode_values(row, names)
+    }, using=table.shard)
+
+
+def publish_row_deleted(table, row_id):
+    publish_table_event(table, {
+        'type': 'row_deleted',
+        'row_id': row_id
+    }, using=table.shard)
+
+
+def publish_field_changed(event_type, field, field_type):
+    publish_table_event(field.table, {
+        'type': event_type,
+        'field_id': field.id,
+        'name': field.name,
+        'field_type': field_type.type
+    })
@@ -0,0 +1,8 @@
+from django.urls import path
+
+from .consumers import TableConsumer
+
+
+websocket_urlpatterns = [
+    path('ws/database/tables/<int:table_id>/', TableConsumer),
+]
@@ -0,0 +1,82 @@
+from collections import defaultdict
+
+from django.db import models
+from django.contrib.contenttypes.models import ContentType
+
+
+@models.AutoField.register_lookup
+class AnyLookup(models.Lookup):
+    """
+    Filters on a list of values with `= ANY(%s)` and the list as one array parameter,
+    instead of a parameter per value like the `in` lookup does. The SQL therefore
+    stays the same regardless of the amount of values.
+
+    Example:
+        model.objects.filter(id__any=[1, 2, 3])
+    """
+
+    lookup_name = 'any'
+    prepare_rhs = False
+
+    def get_db_prep_lookup(self, value, connection):
+        return '%s', [[self.lhs.output_field.get_prep_value(item) for item in value]]
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} = ANY({rhs})', lhs_params + rhs_params
+
+
+def specific_iterator(queryset, per_content_type_queryset_hook=None):
+    """
+    Converts the objects of the provided polymorphic queryset to their most specific
+    instances while preserving the original order. Instead of calling the
+    `specific` property for each object, which results in a query per object, the
+    specific instances are fetched with one query per content type. Objects that
+    already are specific instances are kept as they are.
+
+    Example:
+        fields = Field.objects.filter(table=table).select_related('content_type')
+        for field in specific_iterator(fields):
+            print(field.__class__)  # TextField, NumberField, ...
+
+    :param queryset: The queryset or list of objects containing the polymorphic base
+                     instances. The objects must have a `content_type_id` attribute.
+    :type queryset: QuerySet or list
+    :param per_content_type_queryset_hook: If provided, this function is called with
+                                           the specific model and the queryset that
+                                           selects the specific instances of that model.
+                                           It must return a queryset, which makes it
+                                           possible to add for example select_related
+                                           calls.
+    :type per_content_type_queryset_hook: function
+    :return: A list containing the specific instances in the original order.
+    :rtype: list
+    """
+
+    objects = list(queryset)
+    ids_per_content_type = defaultdict(list)
+    specific_objects = {}
+
+    for obj in objects:
+        model_class = ContentType.objects.get_for_id(obj.content_type_id).model_class()
+        if obj.__class__ is model_class:
+            specific_objects[obj.id] = obj
+        else:
+            ids_per_content_type[obj.content_type_id].append(obj.id)
+
+    for content_type_id, ids in ids_per_content_type.items():
+        model_class = ContentType.objects.get_for_id(content_type_id).model_class()
+        specific_queryset = model_class.objects.filter(id__in=ids)
+
+        if per_content_type_queryset_hook:
+            specific_queryset = per_content_type_queryset_hook(
+                model_class, specific_queryset
+            )
+
+        for specific_object in specific_queryset:
+            specific_objects[specific_object.id] = specific_object
+
+    # Objects that have been deleted in the meantime are not in the specific objects
+    # dict, they are skipped here.
+    return [specific_objects[obj.id] for obj in objects if obj.id in specific_objects]
@@ -0,0 +1,83 @@
+import os
+
+from django.db.backends.postgresql.base import (
+    Database, DatabaseWrapper as PostgresDatabaseWrapper
+)
+from django.db.backends.postgresql.creation import (
+    DatabaseCreation as PostgresDatabaseCreation
+)
+
+from .pool import get_pool, close_pools
+
+
+class DatabaseCreation(PostgresDatabaseCreation):
+    def _destroy_test_db(self, test_database_name, verbosity):
+        # The idle pooled connections to the test database must be closed, otherwise
+        # it can't be dropped.
+        close_pools()
+        super()._destroy_test_db(test_database_name, verbosity)
+
+
+class DatabaseWrapper(PostgresDatabaseWrapper):
+    """
+    A PostgreSQL backend that keeps the connections open in a pool per worker process
+    instead of opening a new connection for every request. When Django closes the
+    connection at the end of a request, it is released to the pool and the next
+    request reuses it. The pool can be configured with the POOL key of the database
+    settings:
+
+        'POOL': {
+            'MAX_SIZE': 10,  # The maximum amount of open connections per worker.
+            'TIMEOUT': 10,  # Seconds to wait for a connection if all are in use.
+            'HEALTH_CHECK_INTERVAL': 30,  # Idle seconds after which a connection
+                                          # is checked before it is used.
+            'MAX_LIFETIME': 3600,  # Seconds after which a connection is reopened.
+        }
+
+    A connection is held by the thread that checked it out until Django closes it, so
+    transactions, including the ones using select_for_update, always run on one
+    connection.
+    """
+
+    creation_class = DatabaseCreation
+
+    def get_pool(self, conn_params):
+        options = self.settings_dict.get('POOL', {})
+        return get_pool(
+            self.alias,
+            conn_params,
+            lambda: Database.connect(**conn_params),
+            max_size=options.get('MAX_SIZE', 10),
+            timeout=options.get('TIMEOUT', 10),
+            health_check_interval=options.get('HEALTH_CHECK_INTERVAL', 30),
+            max_lifetime=options.get('MAX_LIFETIME', 3600)
+        )
+
+    def get_new_connection(self, conn_params):
+        self.pool = self.get_pool(conn_params)
+        connection = self.pool.checkout()
+
+        # Same as the PostgreSQL backend, the isolation level is set on the
+        # connection because it is not reset when it is released to the pool.
+        options = self.settings_dict['OPTIONS']
+        try:
+            self.isolation_level = options['isolation_level']
+        except KeyError:
+            self.isolation_level = connection.isolation_level
+        else:
+            if self.isolation_level != connection.isolation_level:
+                connection.set_session(isolation_level=self.isolation_level)
+
+        return connection
+
+    def _close(self):
+        if self.connection is None:
+            return
+
+        with self.wrap_database_errors:
+            # A connection inherited from the parent process can't be given to the
+            # pool of this process.
+            if self.pool.pid == os.getpid():
+                self.pool.release(self.connection)
+            else:
+                self.connection.close()
@@ -0,0 +1,271 @@
+import os
+import time
+import logging
+import threading
+
+import psycopg2 as Database
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+
+from prometheus_client import Counter, Gauge, Histogram
+
+
+logger = logging.getLogger(__name__)
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+pool_connections = Gauge(
+    'baserow_db_pool_connections',
+    'Amount of open connections in the connection pool of this worker.',
+    ['database']
+)
+pool_connections_in_use = Gauge(
+    'baserow_db_pool_connections_in_use',
+    'Amount of connections of the connection pool of this worker that are checked '
+    'out.',
+    ['database']
+)
+pool_checkout_seconds = Histogram(
+    'baserow_db_pool_checkout_seconds',
+    'Time spent waiting for a connection from the connection pool.',
+    ['database']
+)
+pool_checkout_timeouts = Counter(
+    'baserow_db_pool_checkout_timeouts_total',
+    'Amount of times no connection became available within the checkout timeout.',
+    ['database']
+)
+pool_discarded_connections = Counter(
+    'baserow_db_pool_discarded_connections_total',
+    'Amount of pooled connections that were closed because they were broken or too '
+    'old.',
+    ['database']
+)
+
+
+class PoolTimeout(Database.OperationalError):
+    """
+    Raised when no connection became available within the checkout timeout. Because
+    it extends the psycopg2 OperationalError, Django raises it as its own
+    OperationalError.
+    """
+
+
+class ConnectionPool:
+    """
+    A thread safe pool of psycopg2 connections to one database. Connections that are
+    released are kept open and are handed out again on the next checkout, so that a
+    request doesn't have to open a new connection. At most `max_size` connections
+    are open at the same time, a checkout waits at most `timeout` seconds for one of
+    them to be released.
+    """
+
+    def __init__(self, name, connect, max_size=10, timeout=10,
+                 health_check_interval=30, max_lifetime=3600):
+        """
+        :param name: The name of the pool, used as label of the metrics.
+        :type name: str
+        :param connect: Function that opens a new connection.
+        :type connect: function
+        :param max_size: The maximum amount of open connections.
+        :type max_size: int
+        :param timeout: The maximum amount of seconds a checkout waits for a
+                        connection.
+        :type timeout: float
+        :param health_check_interval: Connections that have been idle for more than
+                                      this amount of seconds are checked with a
+                                      query before they are handed out.
+        :type health_check_interval: float
+        :param max_lifetime: Connections that are open for more than this amount of
+                             seconds are closed when they are released.
+        :type max_lifetime: float
+        """
+
+        self.name = name
+        self.connect = connect
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self.max_lifetime = max_lifetime
+        self.pid = os.getpid()
+
+        self._condition = threading.Condition()
+        self._idle = []
+        self._opened_on = {}
+        self._released_on = {}
+        self._size = 0
+
+    @property
+    def size(self):
+        """The amount of open connections, including the checked out ones."""
+
+        return self._size
+
+    @property
+    def idle(self):
+        """The amount of open connections that are not checked out."""
+
+        return len(self._idle)
+
+    def checkout(self):
+        """
+        Returns an open connection. An idle connection is reused if there is one,
+        otherwise a new connection is opened if the pool is not full yet. If it is
+        full, it waits until another connection is released.
+
+        :raises PoolTimeout: When no connection became available within the timeout.
+        :return: The connection.
+        :rtype: connection
+        """
+
+        start = time.monotonic()
+        deadline = start + self.timeout
+
+        while True:
+            connection = None
+
+            with self._condition:
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        pool_checkout_timeouts.labels(self.name).inc()
+                        raise PoolTimeout(
+                            f'No connection of the pool {self.name} became available '
+                            f'within {self.timeout} seconds.'
+                        )
+                    self._condition.wait(remaining)
+
+                if self._idle:
+                    connection = self._idle.pop()
+                else:
+                    self._size += 1
+
+            if connection is None:
+                try:
+                    connection = self.connect()
+                except Exception:
+                    with self._condition:
+                        self._size -= 1
+                        self._condition.notify()
+                    raise
+                self._opened_on[id(connection)] = time.monotonic()
+                pool_connections.labels(self.name).inc()
+            elif not self._is_healthy(connection):
+                self._discard(connection)
+                continue
+
+            pool_connections_in_use.labels(self.name).inc()
+            pool_checkout_seconds.labels(self.name).observe(time.monotonic() - start)
+            return connection
+
+    def release(self, connection):
+        """
+        Gives a checked out connection back to the pool. An open transaction is rolled
+        back and the session is reset, so that nothing leaks to the next user of the
+        connection. Broken connections and connections that exceeded the maximum
+        lifetime are closed.
+
+        :param connection: The connection that was returned by the checkout.
+        :type connection: connection
+        """
+
+        pool_connections_in_use.labels(self.name).dec()
+
+        age = time.monotonic() - self._opened_on.get(id(connection), 0)
+        if connection.closed or age > self.max_lifetime:
+            self._discard(connection)
+            return
+
+        try:
+            connection.reset()
+        except Database.Error:
+            self._discard(connection)
+            return
+
+        self._released_on[id(connection)] = time.monotonic()
+
+        with self._condition:
+            self._idle.append(connection)
+            self._condition.notify()
+
+    def close(self):
+        """Closes all the idle connections."""
+
+        with self._condition:
+            idle, self._idle = self._idle, []
+
+        for connection in idle:
+            self._discard(connection, broken=False)
+
+    def _is_healthy(self, connection):
+        if connection.closed:
+            return False
+
+        idle_time = time.monotonic() - self._released_on.get(id(connection), 0)
+        if idle_time < self.health_check_interval:
+            return connection.get_transaction_status() == TRANSACTION_STATUS_IDLE
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            connection.rollback()
+            return True
+        except Database.Error as e:
+            logger.info(f'Discarding a broken connection of pool {self.name}: {e}')
+            return False
+
+    def _discard(self, connection, broken=True):
+        self._opened_on.pop(id(connection), None)
+        self._released_on.pop(id(connection), None)
+
+        try:
+            connection.close()
+        except Database.Error:
+            pass
+
+        if broken:
+            pool_discarded_connections.labels(self.name).inc()
+        pool_connections.labels(self.name).dec()
+
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+
+def get_pool(name, conn_params, connect, **options):
+    """
+    Returns the connection pool of this worker process for the provided connection
+    parameters. It is created if it doesn't exist yet. A forked worker process gets its
+    own pools because connections can't be shared between processes.
+
+    :param name: The name of the pool, used as label of the metrics.
+    :type name: str
+    :param conn_params: The connection parameters that identify the database.
+    :type conn_params: dict
+    :param connect: Function that opens a new connection.
+    :type connect: function
+    :param options: The options passed to the ConnectionPool if it is created.
+    :type options: dict
+    :return: The connection pool.
+    :rtype: ConnectionPool
+    """
+
+    key = (os.getpid(), repr(sorted(conn_params.items())))
+
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = ConnectionPool(name, connect, **options)
+
+        return _pools[key]
+
+
+def close_pools():
+    """Closes the idle connections of all the pools of this worker process."""
+
+    pid = os.getpid()
+
+    with _pools_lock:
+        pools = [pool for (pool_pid, _), pool in _pools.items() if pool_pid == pid]
+
+    for pool in pools:
+        pool.close()
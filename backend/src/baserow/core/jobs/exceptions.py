@@ -0,0 +1,23 @@
+from baserow.core.exceptions import (
+    InstanceTypeDoesNotExist, InstanceTypeAlreadyRegistered
+)
+
+
+class JobTypeAlreadyRegistered(InstanceTypeAlreadyRegistered):
+    pass
+
+
+class JobTypeDoesNotExist(InstanceTypeDoesNotExist):
+    pass
+
+
+class JobDoesNotExist(Exception):
+    """Raised when trying to get a job that doesn't exist."""
+
+
+class JobAlreadyFinished(Exception):
+    """Raised when trying to cancel a job that has already finished."""
+
+
+class JobCancelled(Exception):
+    """Raised inside a running job when the job has been cancelled by the user."""
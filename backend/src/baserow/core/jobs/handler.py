@@ -0,0 +1,256 @@
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+
+from baserow.core.utils import Progress
+
+from .exceptions import JobDoesNotExist, JobAlreadyFinished, JobCancelled
+from .registries import job_type_registry
+from .models import (
+    Job, JOB_STATE_PENDING, JOB_STATE_RUNNING, JOB_STATE_FINISHED, JOB_STATE_FAILED,
+    JOB_STATE_CANCELLED
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class JobHeartbeat:
+    """
+    Touches the updated_on timestamp of a running job from a separate thread every
+    JOB_HEARTBEAT_INTERVAL seconds, so that a job that doesn't report progress for a
+    long time, like deleting a big table, is not considered stale while its worker is
+    still alive.
+
+    Example:
+        with JobHeartbeat(job):
+            job_type.run(job, progress)
+    """
+
+    def __init__(self, job, interval=None):
+        """
+        :param job: The running job that must be touched.
+        :type job: Job
+        :param interval: The amount of seconds between the heartbeats. Defaults to the
+                         JOB_HEARTBEAT_INTERVAL setting.
+        :type interval: float or None
+        """
+
+        self.job = job
+        self.interval = (
+            settings.JOB_HEARTBEAT_INTERVAL if interval is None else interval
+        )
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stopped.set()
+        self.thread.join()
+
+    def run(self):
+        try:
+            while not self.stopped.wait(self.interval):
+                try:
+                    Job.objects.filter(id=self.job.id, state=JOB_STATE_RUNNING).update(
+                        updated_on=timezone.now()
+                    )
+                except Exception:
+                    logger.exception(f'Could not touch the job with id '
+                                     f'{self.job.id}.')
+        finally:
+            # The thread has its own database connections, which Django doesn't
+            # close because it only does that at the end of a request.
+            connections.close_all()
+
+
+class JobHandler:
+    def get_job(self, user, job_id):
+        """
+        Selects a job of the user with the given id from the database.
+
+        :param user: The user on whose behalf the job is requested.
+        :type user: User
+        :param job_id: The identifier of the job that must be returned.
+        :type job_id: int
+        :return: The requested job.
+        :rtype: Job
+        """
+
+        try:
+            return Job.objects.get(id=job_id, user=user)
+        except Job.DoesNotExist:
+            raise JobDoesNotExist(f'The job with id {job_id} does not exist.')
+
+    def create_job(self, user, type_name, **kwargs):
+        """
+        Creates a new pending job that will be executed by a worker. The arguments are
+        prepared by the job type, which also checks if the user has access to the
+        related objects.
+
+        :param user: The user on whose behalf the job is created.
+        :type user: User
+        :param type_name: The type name of the job. Available types can be found in the
+                          job_type_registry.
+        :type type_name: str
+        :param kwargs: The values that are passed to the prepare_arguments method of
+                       the job type.
+        :type kwargs: object
+        :return: The created job.
+        :rtype: Job
+        """
+
+        job_type = job_type_registry.get(type_name)
+        arguments = job_type.prepare_arguments(user, kwargs)
+
+        return Job.objects.create(user=user, type=job_type.type, arguments=arguments)
+
+    def cancel_job(self, user, job):
+        """
+        Cancels a job. A pending job is cancelled immediately, a running job is
+        cancelled the next time it reports progress.
+
+        :param user: The user on whose behalf the job is cancelled.
+        :type user: User
+        :param job: The job that must be cancelled.
+        :type job: Job
+        :return: The updated job.
+        :rtype: Job
+        """
+
+        if not isinstance(job, Job):
+            raise ValueError('The job is not an instance of Job.')
+
+        if job.user_id != user.id:
+            raise JobDoesNotExist(f'The job with id {job.id} does not exist.')
+
+        with transaction.atomic():
+            job = Job.objects.select_for_update().get(id=job.id)
+
+            if job.finished:
+                raise JobAlreadyFinished(f'The job with id {job.id} has already '
+                                         f'finished.')
+
+            job.cancel_requested = True
+            if job.state == JOB_STATE_PENDING:
+                job.state = JOB_STATE_CANCELLED
+                job.finished_on = timezone.now()
+            job.save()
+
+        return job
+
+    def claim_next_job(self):
+        """
+        Selects the oldest pending job and marks it as running. Jobs that are locked by
+        another worker are skipped so that multiple workers can run at the same time.
+
+        :return: The claimed job or None if there are no pending jobs.
+        :rtype: Job or None
+        """
+
+        with transaction.atomic():
+            job = Job.objects.select_for_update(skip_locked=True).filter(
+                state=JOB_STATE_PENDING
+            ).order_by('id').first()
+
+            if not job:
+                return None
+
+            job.state = JOB_STATE_RUNNING
+            job.started_on = timezone.now()
+            job.save()
+
+        return job
+
+    def fail_stale_jobs(self, timeout=None):
+        """
+        Marks the running jobs of which the heartbeat hasn't been received within the
+        timeout as failed. This happens when the worker that was running the job
+        died, the job would otherwise stay running forever. They are not requeued
+        because a job that has been partially executed, like importing rows, can't
+        safely be executed again.
+
+        :param timeout: The amount of seconds since the last heartbeat after which a
+                        running job is considered stale. Defaults to the
+                        JOB_HEARTBEAT_TIMEOUT setting.
+        :type timeout: int or None
+        :return: The amount of jobs that have been marked as failed.
+        :rtype: int
+        """
+
+        if timeout is None:
+            timeout = settings.JOB_HEARTBEAT_TIMEOUT
+
+        now = timezone.now()
+        return Job.objects.filter(
+            state=JOB_STATE_RUNNING,
+            updated_on__lt=now - timedelta(seconds=timeout)
+        ).update(
+            state=JOB_STATE_FAILED,
+            error='The worker running the job stopped responding.',
+            finished_on=now,
+            updated_on=now
+        )
+
+    def run_job(self, job):
+        """
+        Executes a job that has been claimed by the worker. The state, progress, result
+        and error are stored with the job. While the job runs a heartbeat is sent, so
+        that other workers don't consider it stale. The outcome is only stored if the
+        job is still running, it is discarded if the job has been marked as failed by
+        another worker in the meantime. Note that this method must not be called
+        inside a transaction because the progress would otherwise not be visible to
+        the user until the job has finished.
+
+        :param job: The job that must be executed.
+        :type job: Job
+        :return: The updated job.
+        :rtype: Job
+        """
+
+        def progress_callback(percentage):
+            # The percentage is stored immediately so that it can be polled via the
+            # API. This is also the moment to check if the job has been cancelled.
+            updated = Job.objects.filter(id=job.id, cancel_requested=False).update(
+                progress_percentage=percentage, updated_on=timezone.now()
+            )
+            if updated == 0:
+                raise JobCancelled(f'The job with id {job.id} has been cancelled.')
+
+        job_type = job_type_registry.get(job.type)
+        progress = Progress(100, callback=progress_callback)
+
+        try:
+            with JobHeartbeat(job):
+                result = job_type.run(job, progress)
+            # The progress of an unfinished job has already been stored by the
+            # callback.
+            outcome = {
+                'state': JOB_STATE_FINISHED,
+                'result': result or {},
+                'progress_percentage': 100
+            }
+        except JobCancelled:
+            outcome = {'state': JOB_STATE_CANCELLED, 'cancel_requested': True}
+        except Exception as e:
+            logger.exception(f'The job with id {job.id} failed.')
+            outcome = {'state': JOB_STATE_FAILED, 'error': str(e)}
+
+        now = timezone.now()
+        updated = Job.objects.filter(id=job.id, state=JOB_STATE_RUNNING).update(
+            finished_on=now, updated_on=now, **outcome
+        )
+        if updated == 0:
+            logger.warning(f'The job with id {job.id} was not running anymore when it '
+                           f'ended with state {outcome["state"]}.')
+
+        job.refresh_from_db()
+
+        return job
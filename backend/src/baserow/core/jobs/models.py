@@ -0,0 +1,54 @@
+from django.db import models
+from django.contrib.auth import get_user_model
+from django.contrib.postgres.fields import JSONField
+
+
+User = get_user_model()
+
+
+JOB_STATE_PENDING = 'pending'
+JOB_STATE_RUNNING = 'running'
+JOB_STATE_FINISHED = 'finished'
+JOB_STATE_FAILED = 'failed'
+JOB_STATE_CANCELLED = 'cancelled'
+JOB_STATE_CHOICES = (
+    (JOB_STATE_PENDING, 'Pending'),
+    (JOB_STATE_RUNNING, 'Running'),
+    (JOB_STATE_FINISHED, 'Finished'),
+    (JOB_STATE_FAILED, 'Failed'),
+    (JOB_STATE_CANCELLED, 'Cancelled'),
+)
+JOB_FINISHED_STATES = (JOB_STATE_FINISHED, JOB_STATE_FAILED, JOB_STATE_CANCELLED)
+
+
+class Job(models.Model):
+    """
+    A job is a long running operation that is executed in the background by the
+    run_jobs management command instead of inside the request. The type refers to a
+    job type in the job_type_registry, which knows how to run the job based on the
+    arguments.
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    type = models.CharField(max_length=64)
+    state = models.CharField(max_length=32, choices=JOB_STATE_CHOICES,
+                             default=JOB_STATE_PENDING)
+    progress_percentage = models.PositiveIntegerField(default=0)
+    arguments = JSONField(default=dict)
+    result = JSONField(default=dict)
+    error = models.TextField(blank=True, default='')
+    cancel_requested = models.BooleanField(default=False)
+    created_on = models.DateTimeField(auto_now_add=True)
+    updated_on = models.DateTimeField(auto_now=True)
+    started_on = models.DateTimeField(null=True)
+    finished_on = models.DateTimeField(null=True)
+
+    class Meta:
+        ordering = ('id',)
+
+    @property
+    def finished(self):
+        return self.state in JOB_FINISHED_STATES
+
+    def __str__(self):
+        return f'<Job id={self.id}, type={self.type}, state={self.state}>'
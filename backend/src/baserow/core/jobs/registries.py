@@ -0,0 +1,89 @@
+from baserow.core.registry import Instance, Registry
+
+from .exceptions import JobTypeAlreadyRegistered, JobTypeDoesNotExist
+
+
+class JobType(Instance):
+    """
+    This abstract class represents a long running operation that can be executed in
+    the background. When a job is created via the API the request data is validated
+    with the serializer_class, prepared by the prepare_arguments method and stored with
+    the job. A worker started via the run_jobs management command eventually calls the
+    run method.
+
+    Example:
+        from baserow.core.jobs.registries import JobType, job_type_registry
+
+        class ExampleJobType(JobType):
+            type = 'a-unique-job-type-name'
+            serializer_class = ExampleJobSerializer
+            api_exceptions_map = {
+                SomeException: 'ERROR_SOME_EXCEPTION'
+            }
+
+            def prepare_arguments(self, user, values):
+                return {'example_id': values['example_id']}
+
+            def run(self, job, progress):
+                for item in range(0, 10):
+                    progress.increment(10)
+
+        job_type_registry.register(ExampleJobType())
+    """
+
+    serializer_class = None
+    """The serializer that validates the request data when creating the job."""
+
+    api_exceptions_map = {}
+    """
+    A dict mapping the exceptions that could be raised by prepare_arguments to API error
+    codes. It is used the same way as the map_exceptions decorator.
+    """
+
+    def prepare_arguments(self, user, values):
+        """
+        Called when the job is created. It must check if the user has access to the
+        related objects and returns the arguments that are stored with the job. The
+        returned dict must be JSON serializable.
+
+        :param user: The user on whose behalf the job is created.
+        :type user: User
+        :param values: The values that have been validated by the serializer_class.
+        :type values: dict
+        :return: The arguments that are stored with the job.
+        :rtype: dict
+        """
+
+        return values
+
+    def run(self, job, progress):
+        """
+        Executes the job. This method is called by the worker and should regularly
+        increment the provided progress, which stores the progress percentage and
+        raises a JobCancelled exception if the user has cancelled the job.
+
+        :param job: The job that must be executed.
+        :type job: Job
+        :param progress: The progress of the job which has a total of 100.
+        :type progress: Progress
+        :return: Optionally a JSON serializable dict that is stored as result.
+        :rtype: dict or None
+        """
+
+        raise NotImplementedError('Each job type must have his own run method.')
+
+
+class JobTypeRegistry(Registry):
+    """
+    With the job type registry it is possible to register new job types. A job type
+    describes a long running operation that is executed in the background.
+    """
+
+    name = 'job'
+    does_not_exist_exception_class = JobTypeDoesNotExist
+    already_registered_exception_class = JobTypeAlreadyRegistered
+
+
+# A default job type registry is created here, this is the one that is used
+# throughout the whole Baserow application to add a new job type.
+job_type_registry = JobTypeRegistry()
@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from baserow.core.jobs.handler import JobHandler
+
+
+class Command(BaseCommand):
+    help = 'Starts a worker that executes the pending background jobs.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Executes all the '
+                                                                'pending jobs and '
+                                                                'stops afterwards.')
+        parser.add_argument('--sleep', type=float, default=1.0, help='The amount of '
+                                                                     'seconds to wait '
+                                                                     'before checking '
+                                                                     'for new jobs.')
+
+    def handle(self, *args, **options):
+        once = options['once']
+        sleep = options['sleep']
+        handler = JobHandler()
+
+        self.stdout.write(self.style.SUCCESS('Waiting for jobs.'))
+
+        try:
+            while True:
+                # Because the worker is a long running process we need to make sure
+                # that broken or expired connections are replaced.
+                close_old_connections()
+                handler.fail_stale_jobs()
+                job = handler.claim_next_job()
+
+                if job:
+                    self.stdout.write(f'Running job {job.id} of type {job.type}.')
+                    job = handler.run_job(job)
+                    self.stdout.write(f'Job {job.id} ended with state {job.state}.')
+                elif once:
+                    break
+                else:
+                    time.sleep(sleep)
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS('The worker has stopped.'))
@@ -0,0 +1,189 @@
+import os
+import hmac
+import time
+import threading
+from contextlib import contextmanager, ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpResponse, HttpResponseForbidden, Http404
+
+from prometheus_client import (
+    Counter, Histogram, CollectorRegistry, REGISTRY, CONTENT_TYPE_LATEST,
+    generate_latest
+)
+
+
+_state = threading.local()
+
+REQUEST_LABELS = ['view', 'method']
+TIMINGS = ('get_model', 'row_serialization')
+"""The names of the timings that can be recorded with `record_timing`."""
+
+requests_total = Counter(
+    'baserow_http_requests_total',
+    'Amount of handled requests per view, method and status code.',
+    REQUEST_LABELS + ['status']
+)
+request_duration_seconds = Histogram(
+    'baserow_http_request_duration_seconds',
+    'Time spent handling a request.',
+    REQUEST_LABELS
+)
+request_queries = Histogram(
+    'baserow_http_request_queries',
+    'Amount of SQL queries executed while handling a request.',
+    REQUEST_LABELS,
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500, float('inf'))
+)
+request_sql_seconds = Histogram(
+    'baserow_http_request_sql_seconds',
+    'Time spent executing SQL queries while handling a request.',
+    REQUEST_LABELS
+)
+request_timing_seconds = {
+    'get_model': Histogram(
+        'baserow_http_request_get_model_seconds',
+        'Time spent generating table models while handling a request.',
+        REQUEST_LABELS
+    ),
+    'row_serialization': Histogram(
+        'baserow_http_request_row_serialization_seconds',
+        'Time spent serializing rows while handling a request.',
+        REQUEST_LABELS
+    )
+}
+
+
+class RequestMetrics:
+    """The measurements of the request that is handled by the current thread."""
+
+    def __init__(self):
+        self.queries = 0
+        self.sql_seconds = 0.0
+        self.timings = dict.fromkeys(TIMINGS, 0.0)
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_seconds += time.perf_counter() - start
+            self.queries += 1
+
+
+@contextmanager
+def record_timing(name):
+    """
+    Adds the time spent within the context to the timing with the provided name of the
+    request that is handled by the current thread. Outside of a request it does
+    nothing. Because it is a context decorator it can also decorate a function.
+
+    Example:
+        with record_timing('row_serialization'):
+            data = serializer.data
+
+    :param name: The name of the timing, must be one of the `TIMINGS`.
+    :type name: str
+    """
+
+    metrics = getattr(_state, 'metrics', None)
+    if metrics is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.timings[name] += time.perf_counter() - start
+
+
+class MetricsMiddleware:
+    """
+    Records the latency, the amount of SQL queries, the time spent executing them and
+    the recorded timings of every request per view and method. The queries of all the
+    database connections are counted, including the ones of the user table databases.
+    The metrics are exposed in the Prometheus format by the `metrics_view`. It is only
+    active if the METRICS_ENABLED setting is True.
+    """
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = RequestMetrics()
+        previous = getattr(_state, 'metrics', None)
+        _state.metrics = metrics
+        start = time.perf_counter()
+
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(
+                        connections[alias].execute_wrapper(metrics.execute_wrapper)
+                    )
+                response = self.get_response(request)
+        finally:
+            _state.metrics = previous
+
+        duration = time.perf_counter() - start
+        resolver_match = getattr(request, 'resolver_match', None)
+        labels = (
+            resolver_match.view_name if resolver_match else 'unresolved',
+            request.method
+        )
+
+        requests_total.labels(*labels, response.status_code).inc()
+        request_duration_seconds.labels(*labels).observe(duration)
+        request_queries.labels(*labels).observe(metrics.queries)
+        request_sql_seconds.labels(*labels).observe(metrics.sql_seconds)
+        for name, seconds in metrics.timings.items():
+            request_timing_seconds[name].labels(*labels).observe(seconds)
+
+        return response
+
+
+def get_metrics_registry():
+    """
+    Returns the registry of which the metrics must be exposed. If the application is
+    served by multiple worker processes the `prometheus_multiproc_dir` environment
+    variable must point to a directory that is shared by the workers, the metrics of
+    all of them are then collected from that directory.
+
+    :return: The registry containing the metrics.
+    :rtype: CollectorRegistry
+    """
+
+    if 'prometheus_multiproc_dir' not in os.environ:
+        return REGISTRY
+
+    from prometheus_client import multiprocess
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def metrics_view(request):
+    """
+    Exposes the metrics in the Prometheus text format. It responds with a 404 if the
+    METRICS_ENABLED setting is False. If the METRICS_TOKEN setting is set, the request
+    must contain it in an `Authorization: Bearer <token>` header.
+    """
+
+    if not settings.METRICS_ENABLED:
+        raise Http404()
+
+    if settings.METRICS_TOKEN:
+        expected = f'Bearer {settings.METRICS_TOKEN}'
+        provided = request.META.get('HTTP_AUTHORIZATION', '')
+        if not hmac.compare_digest(provided.encode(), expected.encode()):
+            return HttpResponseForbidden()
+
+    return HttpResponse(generate_latest(get_metrics_registry()),
+                        content_type=CONTENT_TYPE_LATEST)
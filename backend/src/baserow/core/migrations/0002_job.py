@@ -0,0 +1,46 @@
+# Generated by Django 2.2.2 on 2026-10-19 09:48
+
+from django.conf import settings
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True,
+                                        serialize=False, verbose_name='ID')),
+                ('type', models.CharField(max_length=64)),
+                ('state', models.CharField(choices=[
+                    ('pending', 'Pending'), ('running', 'Running'),
+                    ('finished', 'Finished'), ('failed', 'Failed'),
+                    ('cancelled', 'Cancelled')
+                ], default='pending', max_length=32)),
+                ('progress_percentage', models.PositiveIntegerField(default=0)),
+                ('arguments',
+                 django.contrib.postgres.fields.jsonb.JSONField(default=dict)),
+                ('result',
+                 django.contrib.postgres.fields.jsonb.JSONField(default=dict)),
+                ('error', models.TextField(blank=True, default='')),
+                ('cancel_requested', models.BooleanField(default=False)),
+                ('created_on', models.DateTimeField(auto_now_add=True)),
+                ('updated_on', models.DateTimeField(auto_now=True)),
+                ('started_on', models.DateTimeField(null=True)),
+                ('finished_on', models.DateTimeField(null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE,
+                                           to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ('id',),
+            },
+        ),
+    ]
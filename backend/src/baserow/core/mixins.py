@@ -97,7 +97,7 @@ class PolymorphicContentTypeMixin:
             del self.__dict__[name]
 
         for name in field_names_to_add:
-            self.__dict__[name] = new_model_class._meta.get_field(name).default
+            self.__dict__[name] = new_model_class._meta.get_field(name).get_default()
 
         # Because the field type has changed we need to invalidate the cached
         # properties so that they wont return the values of the old type.
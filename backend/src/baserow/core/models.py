@@ -4,6 +4,9 @@ from django.contrib.contenttypes.models import ContentType
 
 from .managers import GroupQuerySet
 from .mixins import OrderableMixin, PolymorphicContentTypeMixin
+from .jobs.models import Job
+
+__all__ = ['Group', 'GroupUser', 'Application', 'Job']
 
 
 User = get_user_model()
@@ -1,6 +1,6 @@
 from .registry import (
     Instance, Registry, ModelInstanceMixin, ModelRegistryMixin, APIUrlsRegistryMixin,
-    APIUrlsInstanceMixin
+    APIUrlsInstanceMixin, SerializeManyRegistryMixin
 )
 from .exceptions import ApplicationTypeAlreadyRegistered, ApplicationTypeDoesNotExist
 
@@ -40,6 +40,34 @@ class ApplicationType(APIUrlsInstanceMixin, ModelInstanceMixin, Instance):
     instance_serializer_class = None
     """This serializer that is used to serialize the instance model."""
 
+    def enhance_queryset(self, queryset):
+        """
+        A hook that can be used to enhance the queryset that selects the specific
+        instances of this application type when multiple applications are serialized at
+        once. It could for example add prefetch_related calls to avoid having to do a
+        query per application.
+
+        :param queryset: The queryset that selects the specific application instances.
+        :type queryset: QuerySet
+        :return: The enhanced queryset.
+        :rtype: QuerySet
+        """
+
+        return queryset
+
+    def get_serializer_class(self, base_class=None):
+        """
+        Returns the serializer class of the instances of this application type.
+
+        :param base_class: The serializer class that is used if the application type
+                           doesn't have an instance_serializer_class.
+        :type base_class: ModelSerializer
+        :return: The serializer class.
+        :rtype: ModelSerializer
+        """
+
+        return self.instance_serializer_class or base_class
+
     def pre_delete(self, application):
         """
         A hook that is called before the application instance is deleted.
@@ -49,7 +77,8 @@ class ApplicationType(APIUrlsInstanceMixin, ModelInstanceMixin, Instance):
         """
 
 
-class ApplicationTypeRegistry(APIUrlsRegistryMixin, ModelRegistryMixin, Registry):
+class ApplicationTypeRegistry(SerializeManyRegistryMixin, APIUrlsRegistryMixin,
+                              ModelRegistryMixin, Registry):
     """
     With the application registry it is possible to register new applications. An
     application is an abstraction made specifically for Baserow. If added to the
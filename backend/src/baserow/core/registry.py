@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from django.core.exceptions import ImproperlyConfigured
 
 from baserow.api.v0.utils import get_serializer_class
@@ -46,10 +48,15 @@ class CustomFieldsInstanceMixin:
     serializer_field_overrides = {}
     """The fields that must be added to the serializer."""
 
-    def get_serializer_class(self, *args, **kwargs):
+    def get_serializer_class(self, base_class=None):
         """
         Returns a model serializer class based on this type field names and overrides.
+        Because generating the class and the field introspection that Django REST
+        framework does for every new serializer class are expensive, the generated class
+        is cached per base class on this instance.
 
+        :param base_class: The base serializer class that must be extended.
+        :type base_class: ModelSerializer
         :return: The generated model serializer class.
         :rtype: ModelSerializer
         """
@@ -59,11 +66,17 @@ class CustomFieldsInstanceMixin:
             raise ValueError('Attribute model_class must be set, maybe you forgot to '
                              'extend the ModelInstanceMixin?')
 
-        return get_serializer_class(
-            model_class, self.serializer_field_names,
-            field_overrides=self.serializer_field_overrides,
-            *args, **kwargs
-        )
+        if not hasattr(self, '_serializer_class_cache'):
+            self._serializer_class_cache = {}
+
+        if base_class not in self._serializer_class_cache:
+            self._serializer_class_cache[base_class] = get_serializer_class(
+                model_class, self.serializer_field_names,
+                field_overrides=self.serializer_field_overrides,
+                base_class=base_class
+            )
+
+        return self._serializer_class_cache[base_class]
 
     def get_serializer(self, model_instance, base_class=None):
         """
@@ -217,7 +230,65 @@ class ModelRegistryMixin:
                                                   f'{model_instance} does not exist.')
 
 
-class CustomFieldsRegistryMixin:
+class SerializeManyRegistryMixin:
+    """
+    Makes it possible to serialize a list of polymorphic model instances of different
+    types at once. The registered instance types must implement a
+    `get_serializer_class(base_class=None)` method.
+    """
+
+    def serialize_many(self, queryset, base_class=None,
+                       per_content_type_queryset_hook=None):
+        """
+        Serializes a list of polymorphic model instances of possibly different types
+        with a fixed amount of queries. The specific instances are fetched with one
+        query per content type and for every type one serializer is generated that
+        serializes all the instances of that type at once.
+
+        :param queryset: The queryset or list containing the polymorphic instances that
+                         must be serialized.
+        :type queryset: QuerySet or list
+        :param base_class: The base serializer class that must be extended. For example
+                           common fields could be stored here.
+        :type base_class: ModelSerializer
+        :param per_content_type_queryset_hook: Is passed to the specific_iterator and
+                                               can be used to for example add
+                                               select_related calls to the queryset
+                                               fetching the specific instances.
+        :type per_content_type_queryset_hook: function
+        :return: The serialized data of the instances in the original order.
+        :rtype: list
+        """
+
+        # Imported here because the registry is already loaded before the apps are
+        # ready and the db module depends on the content type model.
+        from .db import specific_iterator
+
+        specific_instances = specific_iterator(
+            queryset, per_content_type_queryset_hook=per_content_type_queryset_hook
+        )
+
+        indexes_per_class = defaultdict(list)
+        for index, instance in enumerate(specific_instances):
+            indexes_per_class[instance.__class__].append(index)
+
+        data = [None] * len(specific_instances)
+        for model_class, indexes in indexes_per_class.items():
+            instance_type = self.get_by_model(model_class)
+            serializer_class = instance_type.get_serializer_class(
+                base_class=base_class)
+            serializer = serializer_class(
+                [specific_instances[index] for index in indexes],
+                many=True,
+                context={'instance_type': instance_type}
+            )
+            for index, item in zip(indexes, serializer.data):
+                data[index] = item
+
+        return data
+
+
+class CustomFieldsRegistryMixin(SerializeManyRegistryMixin):
     def get_serializer(self, model_instance, base_class=None):
         """
         Based on the provided model_instance and base_class a unique serializer
@@ -113,3 +113,94 @@ def remove_special_characters(value, remove_spaces=True):
         for character in value
         if character.isalnum() or (character == ' ' and not remove_spaces)
     )
+
+
+class Progress:
+    """
+    Keeps track of the progress of a long running operation. Every time the progress
+    percentage changes the optional callback is called with the new percentage, this
+    can for example be used to store the progress of a job. Parts of the operation can
+    create child progress instances that represent a part of the parent progress.
+
+    Example:
+        progress = Progress(100, callback=lambda percentage: print(percentage))
+        progress.increment(20)
+        >> 20
+        child = progress.create_child(represents_progress=80, total=4)
+        child.increment()
+        >> 40
+    """
+
+    def __init__(self, total, callback=None):
+        self.total = total
+        self.progress = 0
+        self.failed = 0
+        self.callback = callback
+        self.last_percentage = 0
+
+    @property
+    def percentage(self):
+        """
+        Returns the progress as a rounded down percentage between 0 and 100.
+
+        :return: The progress percentage.
+        :rtype: int
+        """
+
+        if self.total <= 0:
+            return 100
+
+        return min(100, int(self.progress / self.total * 100))
+
+    def increment(self, by=1, failed=0):
+        """
+        Increments the progress and calls the callback if the percentage has changed.
+
+        :param by: The amount that must be added to the progress.
+        :type by: int or float
+        :param failed: The amount of processed items that could not be processed
+                       successfully, they are counted in the failed attribute.
+        :type failed: int
+        """
+
+        self.progress += by
+        self.failed += failed
+        percentage = self.percentage
+
+        if percentage != self.last_percentage:
+            self.last_percentage = percentage
+            if self.callback:
+                self.callback(percentage)
+
+    def create_child(self, represents_progress, total):
+        """
+        Creates a new progress instance that represents a part of this progress. When
+        the child progress is completed, this progress has been incremented by the
+        represents_progress value.
+
+        :param represents_progress: The amount of progress of this instance that the
+                                    child represents.
+        :type represents_progress: int or float
+        :param total: The total of the child progress.
+        :type total: int
+        :return: The child progress.
+        :rtype: Progress
+        """
+
+        def increment_parent(by, failed):
+            self.increment(by / total * represents_progress if total > 0 else 0,
+                           failed=failed)
+
+        return ChildProgress(total, increment_parent)
+
+
+class ChildProgress(Progress):
+    """A progress that increments a part of a parent progress when incremented."""
+
+    def __init__(self, total, increment_parent):
+        super().__init__(total)
+        self.increment_parent = increment_parent
+
+    def increment(self, by=1, failed=0):
+        super().increment(by, failed=failed)
+        self.increment_parent(by, failed)
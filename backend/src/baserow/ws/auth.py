@@ -0,0 +1,50 @@
+from urllib.parse import parse_qs
+
+from jwt import InvalidTokenError
+
+from django.contrib.auth.models import AnonymousUser
+from django.utils.functional import SimpleLazyObject
+
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_jwt.settings import api_settings
+from rest_framework_jwt.authentication import JSONWebTokenAuthentication
+
+
+jwt_decode_handler = api_settings.JWT_DECODE_HANDLER
+
+
+def get_user(token):
+    """
+    Returns the user related to the provided JWT token. The same token as the one
+    used for the REST API must be provided.
+
+    :param token: The JWT token.
+    :type token: str
+    :return: The user or an anonymous user if the token is not valid.
+    :rtype: User or AnonymousUser
+    """
+
+    try:
+        payload = jwt_decode_handler(token)
+        return JSONWebTokenAuthentication().authenticate_credentials(payload)
+    except (InvalidTokenError, AuthenticationFailed):
+        return AnonymousUser()
+
+
+class JWTTokenAuthMiddleware:
+    """
+    Authenticates the user of a WebSocket connection with the JWT token that must be
+    provided as `jwt_token` GET parameter, because browsers can't set headers when
+    opening a WebSocket. The user is added to the scope and is looked up lazily, so
+    that it happens in the synchronous thread of the consumer instead of in the event
+    loop.
+    """
+
+    def __init__(self, inner):
+        self.inner = inner
+
+    def __call__(self, scope):
+        query = parse_qs(scope.get('query_string', b'').decode())
+        token = query.get('jwt_token', [None])[0]
+        user = SimpleLazyObject(lambda: get_user(token) if token else AnonymousUser())
+        return self.inner(dict(scope, user=user))
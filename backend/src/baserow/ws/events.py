@@ -0,0 +1,116 @@
+import threading
+import weakref
+from collections import defaultdict
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+
+local = threading.local()
+
+
+def send_events(events):
+    """
+    Sends the events to the channel layer groups in one message per group.
+
+    :param events: The events that must be sent per group name.
+    :type events: dict
+    """
+
+    channel_layer = get_channel_layer()
+    group_send = async_to_sync(channel_layer.group_send)
+
+    for group, group_events in events.items():
+        group_send(group, {'type': 'events.batch', 'events': group_events})
+
+
+class PublishedEvent:
+    """
+    An event that has been published within a transaction. It is registered as a
+    commit callback that does nothing, only to find out if the event must be sent.
+    Django discards the commit callbacks of a savepoint that is rolled back, after
+    which the event is not referenced anymore.
+    """
+
+    def __init__(self, group, event):
+        self.group = group
+        self.event = event
+
+    def __call__(self):
+        pass
+
+
+class EventBatch:
+    """
+    Collects the events that are published within one transaction, so that they can
+    be sent to every group in one message when the transaction commits. It is
+    registered as commit callback before the events of the transaction, so the
+    events that have not been discarded by a savepoint rollback are still referenced
+    when it is called.
+    """
+
+    def __init__(self):
+        self.published_events = []
+        self.sent = False
+
+    def add(self, published_event):
+        self.published_events.append(weakref.ref(published_event))
+
+    def __call__(self):
+        self.sent = True
+        events = defaultdict(list)
+
+        for reference in self.published_events:
+            published_event = reference()
+            if published_event is not None:
+                events[published_event.group].append(published_event.event)
+
+        send_events(events)
+
+
+def publish_event(group, event, using=None):
+    """
+    Publishes an event to all the WebSocket connections that are subscribed to the
+    group. The event is only sent when the transaction of the provided database
+    connection commits and all the events of that transaction are sent as one
+    message per group. Nothing is sent if the transaction, or the savepoint in which
+    the event was published, rolls back. Outside a transaction the event is sent
+    right away.
+
+    Example:
+        publish_event('table-1', {'type': 'row_deleted', 'row_id': 1})
+
+    :param group: The name of the channel layer group.
+    :type group: str
+    :param event: The JSON serializable event.
+    :type event: dict
+    :param using: The alias of the database connection of which the transaction
+                  must commit. Defaults to the default database.
+    :type using: str
+    """
+
+    using = using or DEFAULT_DB_ALIAS
+
+    if not transaction.get_connection(using).in_atomic_block:
+        send_events({group: [event]})
+        return
+
+    # The batches are only referenced weakly, so a batch of which the commit callback
+    # has been discarded, because the transaction or the savepoint in which it was
+    # created rolled back, is replaced by a new one, just like a sent batch.
+    if not hasattr(local, 'event_batches'):
+        local.event_batches = {}
+
+    reference = local.event_batches.get(using)
+    batch = reference() if reference else None
+
+    if batch is None or batch.sent:
+        batch = EventBatch()
+        local.event_batches[using] = weakref.ref(batch)
+        transaction.on_commit(batch, using=using)
+
+    published_event = PublishedEvent(group, event)
+    batch.add(published_event)
+    transaction.on_commit(published_event, using=using)
@@ -0,0 +1,109 @@
+import pytest
+
+from django.shortcuts import reverse
+
+from baserow.core.jobs.handler import JobHandler
+from baserow.core.jobs.models import Job
+
+
+@pytest.mark.django_db
+def test_create_job(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    table_2 = data_fixture.create_database_table()
+
+    response = api_client.post(
+        reverse('api_v0:jobs:list'),
+        {'type': 'NOT_EXISTING'},
+        format='json',
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    assert response.status_code == 400
+    assert response.json()['error'] == 'ERROR_REQUEST_BODY_VALIDATION'
+    assert response.json()['detail']['type'][0]['code'] == 'invalid_choice'
+
+    response = api_client.post(
+        reverse('api_v0:jobs:list'),
+        {'type': 'delete_table'},
+        format='json',
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    assert response.status_code == 400
+    assert response.json()['detail']['table_id'][0]['code'] == 'required'
+
+    response = api_client.post(
+        reverse('api_v0:jobs:list'),
+        {'type': 'delete_table', 'table_id': table_2.id},
+        format='json',
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    assert response.status_code == 400
+    assert response.json()['error'] == 'ERROR_USER_NOT_IN_GROUP'
+
+    response = api_client.post(
+        reverse('api_v0:jobs:list'),
+        {'type': 'delete_table', 'table_id': 99999},
+        format='json',
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    assert response.status_code == 404
+    assert response.json()['error'] == 'ERROR_TABLE_DOES_NOT_EXIST'
+
+    response = api_client.post(
+        reverse('api_v0:jobs:list'),
+        {'type': 'delete_table', 'table_id': table.id},
+        format='json',
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    assert response.status_code == 202
+    response_json = response.json()
+    assert response_json['type'] == 'delete_table'
+    assert response_json['state'] == 'pending'
+    assert response_json['progress_percentage'] == 0
+
+    job = Job.objects.get(id=response_json['id'])
+    assert job.arguments == {'table_id': table.id}
+
+
+@pytest.mark.django_db
+def test_get_and_cancel_job(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    user_2, token_2 = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    job = JobHandler().create_job(user, 'delete_table', table_id=table.id)
+
+    response = api_client.get(
+        reverse('api_v0:jobs:item', kwargs={'job_id': job.id}),
+        HTTP_AUTHORIZATION=f'JWT {token_2}'
+    )
+    assert response.status_code == 404
+    assert response.json()['error'] == 'ERROR_JOB_DOES_NOT_EXIST'
+
+    response = api_client.get(
+        reverse('api_v0:jobs:item', kwargs={'job_id': job.id}),
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    assert response.status_code == 200
+    assert response.json()['id'] == job.id
+    assert response.json()['state'] == 'pending'
+
+    response = api_client.get(
+        reverse('api_v0:jobs:list'),
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    assert response.status_code == 200
+    assert [item['id'] for item in response.json()] == [job.id]
+
+    response = api_client.post(
+        reverse('api_v0:jobs:cancel', kwargs={'job_id': job.id}),
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    assert response.status_code == 200
+    assert response.json()['state'] == 'cancelled'
+
+    response = api_client.post(
+        reverse('api_v0:jobs:cancel', kwargs={'job_id': job.id}),
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    assert response.status_code == 400
+    assert response.json()['error'] == 'ERROR_JOB_ALREADY_FINISHED'
@@ -0,0 +1,71 @@
+import pytest
+
+from django.shortcuts import reverse
+from django.urls import get_resolver, URLPattern
+
+from rest_framework.views import APIView
+
+from baserow.api.v0.exceptions import QueryBudgetExceeded
+from baserow.contrib.database.api.v0.views.grid.views import GridViewView
+
+
+def get_api_views(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLPattern):
+            view_class = getattr(pattern.callback, 'cls', None)
+            if (
+                view_class and
+                issubclass(view_class, APIView) and
+                view_class.__module__.startswith('baserow.')
+            ):
+                yield pattern.name, view_class
+        else:
+            yield from get_api_views(pattern.url_patterns)
+
+
+def test_all_api_views_declare_query_budget():
+    views = list(get_api_views(get_resolver().url_patterns))
+    assert len(views) > 0
+
+    for name, view_class in views:
+        for method in view_class.http_method_names:
+            if method == 'options' or not hasattr(view_class, method):
+                continue
+            assert hasattr(getattr(view_class, method), 'query_budget'), (
+                f'{view_class.__name__}.{method} of {name} does not declare a query '
+                f'budget.'
+            )
+
+
+@pytest.mark.django_db
+def test_query_budget_middleware(api_client, data_fixture, settings, monkeypatch,
+                                 caplog):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    url = reverse('api_v0:database:views:grid:list', kwargs={'view_id': grid.id})
+
+    response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 200
+
+    monkeypatch.setattr(GridViewView.get, 'query_budget', 1)
+    with pytest.raises(QueryBudgetExceeded) as e:
+        api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    assert 'api_v0:database:views:grid:list' in str(e.value)
+    assert 'the budget is 1' in str(e.value)
+    assert 'FROM "database_table_' in str(e.value)
+
+    settings.QUERY_BUDGET_ACTION = 'warn'
+    response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 200
+    assert 'the budget is 1' in caplog.text
+
+    # The budget can depend on the request, for example on the page size.
+    monkeypatch.setattr(GridViewView.get, 'query_budget',
+                        lambda request: int(request.GET['size']))
+    settings.QUERY_BUDGET_ACTION = 'raise'
+    response = api_client.get(f'{url}?size=100', HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 200
+    with pytest.raises(QueryBudgetExceeded):
+        api_client.get(f'{url}?size=2', HTTP_AUTHORIZATION=f'JWT {token}')
@@ -0,0 +1,101 @@
+import pytest
+import json
+import uuid
+from collections import OrderedDict
+from datetime import datetime, date, time, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.shortcuts import reverse
+from django.utils.translation import gettext_lazy
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from baserow.api.v0.renderers import FastJSONRenderer
+
+
+def test_fast_json_renderer(settings):
+    data = ReturnDict({
+        'count': 2,
+        'next': None,
+        'decimal': Decimal('10.50'),
+        'float': 1.5,
+        'boolean': True,
+        'datetime': datetime(2020, 1, 1, 10, 30, 15, 123456, tzinfo=timezone.utc),
+        'naive_datetime': datetime(2020, 1, 1, 10, 30),
+        'date': date(2020, 1, 1),
+        'time': time(10, 30),
+        'timedelta': timedelta(hours=1),
+        'uuid': uuid.UUID('a2a4b4a0-5d5c-4a4e-9d4b-36f4a2e0a8f1'),
+        'lazy': gettext_lazy('Lazy'),
+        'unicode': 'Ünïcode 🚀     "quoted" \\',
+        'field_options': {1: {'width': 200}, 2: {'hidden': True}},
+        'results': ReturnList([
+            OrderedDict([('id', 1), ('field_1', 'Green')]),
+            OrderedDict([('id', 2), ('field_1', None)])
+        ], serializer=None)
+    }, serializer=None)
+
+    expected = JSONRenderer().render(data)
+    assert FastJSONRenderer().render(data) == expected
+    assert b'"2020-01-01T10:30:15.123456Z"' in expected
+    assert b'\\u2028' in expected
+
+    assert FastJSONRenderer().render(None) == b''
+
+    # Integers that don't fit in 64 bits are rendered by the JSONRenderer.
+    assert FastJSONRenderer().render({'big': 2 ** 70}) == b'{"big":%d}' % 2 ** 70
+
+    # Unsupported values fail like they do with the JSONRenderer.
+    with pytest.raises(TypeError):
+        FastJSONRenderer().render({'object': object()})
+
+    # Some floats are notated differently, but they are the same numbers when parsed.
+    for value in [1e16, 1e-7, 1e-5, 1.2345678901234568e17, -2.5e-10, 1e300, 5e-324]:
+        floats = {'float': value, 'list': [1.5, value]}
+        assert json.loads(FastJSONRenderer().render(floats)) == floats
+    assert FastJSONRenderer().render({'float': 1e16}) == b'{"float":1e16}'
+
+    # Texts that look like those floats, for example numbers with five decimal
+    # places, are rendered by orjson.
+    texts = {'number': '0.00001', 'text': '10em', 'uuid': '1e16a2a4-0000-4a4e'}
+    expected_texts = JSONRenderer().render(texts)
+    with patch.object(JSONRenderer, 'render', side_effect=AssertionError):
+        assert FastJSONRenderer().render(texts) == expected_texts
+
+    # NaN and infinite floats are encoded as null, the JSONRenderer fails on them.
+    for value in [float('nan'), float('inf'), float('-inf')]:
+        with pytest.raises(ValueError):
+            JSONRenderer().render({'float': value})
+        assert FastJSONRenderer().render({'float': value}) == b'{"float":null}'
+
+    # Indented output is rendered by the JSONRenderer.
+    indented = FastJSONRenderer().render(data, 'application/json; indent=4')
+    assert indented == JSONRenderer().render(data, 'application/json; indent=4')
+
+    settings.FAST_JSON_RENDERER = False
+    assert FastJSONRenderer().render(data) == expected
+
+
+@pytest.mark.django_db
+def test_fast_json_renderer_rows(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(table=table,
+                                                    number_decimal_places=2,
+                                                    number_type='DECIMAL')
+    grid = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    model.objects.create(**{
+        f'field_{text_field.id}': 'Grün  ',
+        f'field_{number_field.id}': Decimal('10.50')
+    })
+
+    url = reverse('api_v0:database:views:grid:list', kwargs={'view_id': grid.id})
+    response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 200
+    assert isinstance(response.accepted_renderer, FastJSONRenderer)
+    assert response.content == JSONRenderer().render(response.data)
+    assert response.json()['results'][0][f'field_{number_field.id}'] == '10.50'
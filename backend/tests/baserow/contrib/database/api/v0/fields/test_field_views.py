@@ -1,7 +1,13 @@
 import pytest
 
+from django.db import connection
 from django.shortcuts import reverse
 
+from baserow.core.jobs.handler import JobHandler
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.field_converters import TextToNumberFieldConverter
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.db.schema import TABLE_SCHEMA_ADVISORY_LOCK_NAMESPACE
 from baserow.contrib.database.fields.models import Field, TextField, NumberField
 
 
@@ -265,6 +271,141 @@ def test_update_field(api_client, data_fixture):
     assert response_json['error'] == 'ERROR_CANNOT_CHANGE_FIELD_TYPE'
 
 
+@pytest.mark.django_db
+def test_update_field_type_as_job(api_client, data_fixture, settings):
+    settings.BACKGROUND_JOBS_ENABLED = True
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    model.objects.create(**{f'field_{text_field.id}': '10'})
+
+    url = reverse('api_v0:database:fields:item', kwargs={'field_id': text_field.id})
+
+    # Changes that don't change the type are made within the request.
+    response = api_client.patch(url, {'name': 'Price', 'type': 'text'},
+                                format='json', HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 200
+    assert response.json()['name'] == 'Price'
+
+    response = api_client.patch(url, {'type': 'number', 'number_negative': 'invalid'},
+                                format='json', HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 400
+    assert response.json()['error'] == 'ERROR_REQUEST_BODY_VALIDATION'
+
+    response = api_client.patch(url, {'type': 'number'}, format='json',
+                                HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 202
+    job_id = response.json()['job_id']
+    assert Field.objects.get(id=text_field.id).specific_class == TextField
+
+    job = JobHandler().run_job(JobHandler().claim_next_job())
+    assert job.id == job_id
+    assert job.state == 'finished'
+    assert Field.objects.get(id=text_field.id).specific_class == NumberField
+    row = table.get_model().objects.get()
+    assert getattr(row, f'field_{text_field.id}') == 10
+
+
+@pytest.mark.django_db(transaction=True)
+def test_update_field_type_commits_converted_batches(api_client, data_fixture,
+                                                     monkeypatch):
+    user, token = data_fixture.create_user_and_token()
+    database = data_fixture.create_database_application(user=user)
+    table = TableHandler().create_table(user, database, name='Test')
+    text_field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    for value in ['1', '2', 'Three']:
+        model.objects.create(**{f'field_{text_field.id}': value})
+
+    in_atomic_block = []
+    schema_locked = []
+    other_connection = connection.copy()
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_backend_pid()')
+        backend_pid = cursor.fetchone()[0]
+    convert_batch = TextToNumberFieldConverter._convert_batch
+
+    def record_convert_batch(self, *args, **kwargs):
+        # The locks are inspected with another connection, so that the queries
+        # don't count towards the query budget of the request.
+        with other_connection.cursor() as cursor:
+            cursor.execute(
+                '''
+                SELECT count(*) FROM pg_locks
+                WHERE locktype = 'advisory' AND classid = %s AND objid = %s
+                AND pid = %s AND granted
+                ''',
+                [TABLE_SCHEMA_ADVISORY_LOCK_NAMESPACE, table.id, backend_pid]
+            )
+            schema_locked.append(cursor.fetchone()[0] > 0)
+        in_atomic_block.append(connection.in_atomic_block)
+        return convert_batch(self, *args, **kwargs)
+
+    monkeypatch.setattr(TextToNumberFieldConverter, 'batch_size', 2)
+    monkeypatch.setattr(TextToNumberFieldConverter, '_convert_batch',
+                        record_convert_batch)
+
+    try:
+        url = reverse('api_v0:database:fields:item',
+                      kwargs={'field_id': text_field.id})
+        response = api_client.patch(url, {'type': 'number'}, format='json',
+                                    HTTP_AUTHORIZATION=f'JWT {token}')
+        assert response.status_code == 200
+        assert response.json()['type'] == 'number'
+
+        # Every batch of the backfill is committed on its own instead of becoming a
+        # savepoint of the request transaction. Only the final pass, which converts
+        # the rows that changed during the backfill, runs in the transaction that
+        # changes the field.
+        assert in_atomic_block == [False, False, False, True]
+
+        # The schema of the table is locked during the whole conversion so that the
+        # field can't be changed concurrently.
+        assert schema_locked == [True, True, True, True]
+
+        rows = table.get_model().objects.order_by('id')
+        assert [getattr(row, f'field_{text_field.id}') for row in rows] == [
+            1, 2, None
+        ]
+    finally:
+        other_connection.close()
+        TableHandler().delete_table(user, table)
+        TableHandler().drop_pending_tables()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_update_field_type_query_budget(api_client, data_fixture, monkeypatch):
+    user, token = data_fixture.create_user_and_token()
+    database = data_fixture.create_database_application(user=user)
+    table = TableHandler().create_table(user, database, name='Test')
+    text_field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    model.objects.bulk_create([
+        model(**{f'field_{text_field.id}': str(index)}) for index in range(25)
+    ])
+
+    monkeypatch.setattr(TextToNumberFieldConverter, 'batch_size', 2)
+
+    try:
+        # The rows are converted in 13 batches, the query budget depends on the
+        # amount of rows, so the request doesn't exceed it.
+        url = reverse('api_v0:database:fields:item',
+                      kwargs={'field_id': text_field.id})
+        response = api_client.patch(url, {'type': 'number'}, format='json',
+                                    HTTP_AUTHORIZATION=f'JWT {token}')
+        assert response.status_code == 200
+        assert response.json()['type'] == 'number'
+
+        rows = table.get_model().objects.order_by('id')
+        assert [getattr(row, f'field_{text_field.id}') for row in rows] == list(
+            range(25)
+        )
+    finally:
+        TableHandler().delete_table(user, table)
+        TableHandler().drop_pending_tables()
+
+
 @pytest.mark.django_db
 def test_delete_field(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token()
@@ -300,3 +441,26 @@ def test_delete_field(api_client, data_fixture):
     response_json = response.json()
     assert response.status_code == 400
     assert response_json['error'] == 'ERROR_CANNOT_DELETE_PRIMARY_FIELD'
+
+
+@pytest.mark.django_db
+def test_list_fields_etag(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, primary=True)
+
+    url = reverse('api_v0:database:fields:list', kwargs={'table_id': table.id})
+    response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 200
+    etag = response['ETag']
+
+    response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}',
+                              HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+    FieldHandler().create_field(user, table, 'number', name='Number')
+    response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}',
+                              HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    assert response['ETag'] != etag
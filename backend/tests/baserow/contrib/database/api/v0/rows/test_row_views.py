@@ -267,6 +267,26 @@ def test_update_row(api_client, data_fixture):
 
     row_3.refresh_from_db()
     assert getattr(row_3, f'field_{decimal_field.id}') == Decimal('10.22')
+    assert response_json['version'] == 2
+
+    response = api_client.patch(
+        url,
+        {f'field_{decimal_field.id}': 11, 'version': 1},
+        format='json',
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    assert response.status_code == 409
+    assert response.json()['error'] == 'ERROR_ROW_VERSION_CONFLICT'
+
+    response = api_client.patch(
+        url,
+        {f'field_{decimal_field.id}': 11, 'version': 2},
+        format='json',
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    assert response.status_code == 200
+    assert response.json()['version'] == 3
+    assert response.json()[f'field_{decimal_field.id}'] == '11.00'
 
 
 @pytest.mark.django_db
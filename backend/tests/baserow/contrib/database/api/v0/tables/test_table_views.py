@@ -1,7 +1,10 @@
 import pytest
 
+from django.db import connection
 from django.shortcuts import reverse
+from django.test.utils import CaptureQueriesContext
 
+from baserow.core.jobs.handler import JobHandler
 from baserow.contrib.database.table.models import Table
 
 
@@ -189,6 +192,30 @@ def test_delete_group(api_client, data_fixture):
     assert response.status_code == 404
 
 
+@pytest.mark.django_db
+def test_delete_table_as_job(api_client, data_fixture, settings):
+    settings.BACKGROUND_JOBS_ENABLED = True
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    table_2 = data_fixture.create_database_table()
+
+    url = reverse('api_v0:database:tables:item', kwargs={'table_id': table_2.id})
+    response = api_client.delete(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 400
+    assert response.json()['error'] == 'ERROR_USER_NOT_IN_GROUP'
+
+    url = reverse('api_v0:database:tables:item', kwargs={'table_id': table.id})
+    response = api_client.delete(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 202
+    job_id = response.json()['job_id']
+    assert Table.objects.filter(id=table.id).exists()
+
+    job = JobHandler().run_job(JobHandler().claim_next_job())
+    assert job.id == job_id
+    assert job.state == 'finished'
+    assert not Table.objects.filter(id=table.id).exists()
+
+
 @pytest.mark.django_db
 def test_get_database_application_with_tables(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token()
@@ -208,3 +235,103 @@ def test_get_database_application_with_tables(api_client, data_fixture):
     assert len(response_json['tables']) == 2
     assert response_json['tables'][0]['id'] == table_1.id
     assert response_json['tables'][1]['id'] == table_2.id
+
+
+@pytest.mark.django_db
+def test_table_bootstrap(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    table_2 = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, primary=True,
+                                                name='Name')
+    number_field = data_fixture.create_number_field(table=table, name='Amount')
+    grid = data_fixture.create_grid_view(table=table, order=1)
+    grid_2 = data_fixture.create_grid_view(table=table, order=2)
+    data_fixture.create_grid_view_field_options(grid, number_field, hidden=True)
+    model = table.get_model()
+    row = model.objects.create(**{
+        f'field_{text_field.id}': 'Green',
+        f'field_{number_field.id}': 10
+    })
+
+    url = reverse('api_v0:database:tables:bootstrap', kwargs={'table_id': table_2.id})
+    response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 400
+    assert response.json()['error'] == 'ERROR_USER_NOT_IN_GROUP'
+
+    url = reverse('api_v0:database:tables:bootstrap', kwargs={'table_id': table.id})
+    response = api_client.get(url, {'view_id': 9999},
+                              HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 404
+    assert response.json()['error'] == 'ERROR_GRID_DOES_NOT_EXIST'
+
+    with CaptureQueriesContext(connection) as captured:
+        response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    response_json = response.json()
+    assert response.status_code == 200
+    assert response_json['table'] == {
+        'id': table.id, 'name': table.name, 'order': table.order
+    }
+    assert [field['id'] for field in response_json['fields']] == [
+        text_field.id, number_field.id
+    ]
+    assert response_json['fields'][1]['type'] == 'number'
+    assert [view['id'] for view in response_json['views']] == [grid.id, grid_2.id]
+    assert response_json['views'][0]['type'] == 'grid'
+    assert response_json['views'][0]['table']['id'] == table.id
+    assert response_json['grid']['view_id'] == grid.id
+    assert response_json['grid']['count'] == 1
+    assert response_json['grid']['results'] == [{
+        'id': row.id,
+        'version': 1,
+        f'field_{text_field.id}': 'Green'
+    }]
+    assert response_json['grid']['field_options'][str(number_field.id)]['hidden']
+
+    response = api_client.get(url, {'view_id': grid_2.id},
+                              HTTP_AUTHORIZATION=f'JWT {token}')
+    response_json = response.json()
+    assert response_json['grid']['view_id'] == grid_2.id
+    assert response_json['grid']['results'][0][f'field_{number_field.id}'] == 10
+
+    # The rows are listed with the same parameters as the rows of a grid view.
+    response = api_client.get(
+        url,
+        {'view_id': grid_2.id, 'include_fields': f'field_{number_field.id}',
+         'layout': 'columns', 'limit': 1},
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    response_json = response.json()
+    assert response_json['grid']['count'] == 1
+    assert response_json['grid']['results'] == {
+        'ids': [row.id],
+        'versions': [1],
+        'field_ids': [number_field.id],
+        'columns': [[10]]
+    }
+
+    # The amount of queries doesn't depend on the amount of fields and views.
+    for index in range(5):
+        data_fixture.create_text_field(table=table)
+        data_fixture.create_number_field(table=table)
+        data_fixture.create_grid_view(table=table, order=3 + index)
+
+    with CaptureQueriesContext(connection) as captured_2:
+        response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    assert len(response.json()['fields']) == 12
+    assert len(response.json()['views']) == 7
+    assert len(captured_2) == len(captured)
+
+
+@pytest.mark.django_db
+def test_table_bootstrap_without_grid_view(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+
+    url = reverse('api_v0:database:tables:bootstrap', kwargs={'table_id': table.id})
+    response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    response_json = response.json()
+    assert response.status_code == 200
+    assert response_json['fields'] == []
+    assert response_json['views'] == []
+    assert response_json['grid'] is None
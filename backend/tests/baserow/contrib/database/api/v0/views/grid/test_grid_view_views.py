@@ -1,6 +1,13 @@
 import pytest
 
+from unittest.mock import patch
+
+from django.db import connection
 from django.shortcuts import reverse
+from django.test.utils import CaptureQueriesContext
+
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.views.handler import ViewHandler
 
 
 @pytest.mark.django_db
@@ -145,3 +152,325 @@ def test_list_views(api_client, data_fixture):
     assert not response_json['previous']
     assert not response_json['next']
     assert len(response_json['results']) == 0
+
+
+@pytest.mark.django_db
+def test_list_rows_visible_fields(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(table=table)
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    row = model.objects.create(**{
+        f'field_{text_field.id}': 'Green',
+        f'field_{number_field.id}': 10,
+        f'field_{boolean_field.id}': True
+    })
+
+    url = reverse('api_v0:database:views:grid:field_options',
+                  kwargs={'view_id': grid.id})
+    response = api_client.patch(
+        url,
+        {'field_options': {number_field.id: {'hidden': True, 'width': 100}}},
+        format='json',
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    response_json = response.json()
+    assert response.status_code == 200
+    assert response_json['field_options'] == {
+        str(text_field.id): {'width': 200, 'hidden': False, 'order': 32767},
+        str(number_field.id): {'width': 100, 'hidden': True, 'order': 32767},
+        str(boolean_field.id): {'width': 200, 'hidden': False, 'order': 32767}
+    }
+
+    url = reverse('api_v0:database:views:grid:list', kwargs={'view_id': grid.id})
+    response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    response_json = response.json()
+    assert response.status_code == 200
+    assert 'field_options' not in response_json
+    assert response_json['results'] == [{
+        'id': row.id,
+        'version': 1,
+        f'field_{text_field.id}': 'Green',
+        f'field_{boolean_field.id}': True
+    }]
+
+    response = api_client.get(
+        url,
+        {'include_fields': f'field_{text_field.id},field_{number_field.id}',
+         'include': 'field_options'},
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    response_json = response.json()
+    assert response.status_code == 200
+    assert response_json['results'] == [{
+        'id': row.id,
+        'version': 1,
+        f'field_{text_field.id}': 'Green'
+    }]
+    assert response_json['field_options'][str(number_field.id)]['hidden']
+
+    response = api_client.get(url, {'include_fields': ''},
+                              HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.json()['results'] == [{'id': row.id, 'version': 1}]
+
+
+@pytest.mark.django_db
+def test_update_field_options(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    grid_2 = data_fixture.create_grid_view()
+    unrelated_field = data_fixture.create_text_field()
+
+    url = reverse('api_v0:database:views:grid:field_options',
+                  kwargs={'view_id': 999})
+    response = api_client.patch(url, {'field_options': {}}, format='json',
+                                HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 404
+    assert response.json()['error'] == 'ERROR_GRID_DOES_NOT_EXIST'
+
+    url = reverse('api_v0:database:views:grid:field_options',
+                  kwargs={'view_id': grid_2.id})
+    response = api_client.patch(url, {'field_options': {}}, format='json',
+                                HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 400
+    assert response.json()['error'] == 'ERROR_USER_NOT_IN_GROUP'
+
+    url = reverse('api_v0:database:views:grid:field_options',
+                  kwargs={'view_id': grid.id})
+    response = api_client.patch(
+        url,
+        {'field_options': {'abc': {'width': 100}, text_field.id: {'width': -1}}},
+        format='json',
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    response_json = response.json()
+    assert response.status_code == 400
+    assert response_json['error'] == 'ERROR_REQUEST_BODY_VALIDATION'
+    assert 'field_options' in response_json['detail']
+
+    response = api_client.patch(
+        url,
+        {'field_options': {unrelated_field.id: {'width': 100}}},
+        format='json',
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    assert response.status_code == 400
+    assert response.json()['error'] == 'ERROR_UNRELATED_FIELD'
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('storage', ['columns', 'jsonb'])
+def test_list_rows_columns_layout(api_client, data_fixture, storage):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user, storage=storage)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(table=table,
+                                                    number_type='DECIMAL',
+                                                    number_decimal_places=2)
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    data_fixture.create_grid_view_field_options(grid, boolean_field, hidden=True)
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{
+            f'field_{text_field.id}': f'Row {index}',
+            f'field_{number_field.id}': index
+        })
+        for index in range(3)
+    ]
+
+    url = reverse('api_v0:database:views:grid:list', kwargs={'view_id': grid.id})
+    response = api_client.get(url, {'layout': 'unknown'},
+                              HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 400
+    assert response.json()['error'] == 'ERROR_REQUEST_BODY_VALIDATION'
+    assert response.json()['detail']['layout'][0]['code'] == 'invalid_choice'
+
+    response = api_client.get(url, {'layout': 'columns', 'include': 'field_options'},
+                              HTTP_AUTHORIZATION=f'JWT {token}')
+    response_json = response.json()
+    assert response.status_code == 200
+    assert response_json['count'] == 3
+    assert response_json['results'] == {
+        'ids': [row.id for row in rows],
+        'versions': [1, 1, 1],
+        'field_ids': [text_field.id, number_field.id],
+        'columns': [['Row 0', 'Row 1', 'Row 2'], ['0.00', '1.00', '2.00']]
+    }
+    assert str(boolean_field.id) in response_json['field_options']
+
+    # The columns contain the same values as the rows.
+    rows_response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    results = response_json['results']
+    assert rows_response.json()['results'] == [
+        {
+            'id': row_id,
+            'version': results['versions'][index],
+            **{
+                f'field_{field_id}': column[index]
+                for field_id, column in zip(results['field_ids'], results['columns'])
+            }
+        }
+        for index, row_id in enumerate(results['ids'])
+    ]
+
+    response = api_client.get(
+        url,
+        {'layout': 'columns', 'limit': 1, 'offset': 1,
+         'include_fields': f'field_{number_field.id}'},
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    response_json = response.json()
+    assert response.status_code == 200
+    assert response_json['count'] == 3
+    assert response_json['results'] == {
+        'ids': [rows[1].id],
+        'versions': [1],
+        'field_ids': [number_field.id],
+        'columns': [['1.00']]
+    }
+
+    response = api_client.get(url, {'layout': 'columns', 'offset': 10, 'limit': 1},
+                              HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.json()['results'] == {
+        'ids': [],
+        'versions': [],
+        'field_ids': [text_field.id, number_field.id],
+        'columns': [[], []]
+    }
+
+
+@pytest.mark.django_db
+def test_list_rows_by_ids(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    grid_2 = data_fixture.create_grid_view()
+    data_fixture.create_grid_view_field_options(grid, number_field, hidden=True)
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{
+            f'field_{text_field.id}': f'Row {index}',
+            f'field_{number_field.id}': index
+        })
+        for index in range(5)
+    ]
+
+    url = reverse('api_v0:database:views:grid:rows', kwargs={'view_id': grid_2.id})
+    response = api_client.get(url, {'ids': [1]}, HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 400
+    assert response.json()['error'] == 'ERROR_USER_NOT_IN_GROUP'
+
+    url = reverse('api_v0:database:views:grid:rows', kwargs={'view_id': grid.id})
+    response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 400
+    assert response.json()['error'] == 'ERROR_REQUEST_BODY_VALIDATION'
+
+    response = api_client.get(url, {'ids': ['a']}, HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 400
+    assert response.json()['error'] == 'ERROR_REQUEST_BODY_VALIDATION'
+
+    response = api_client.get(
+        url,
+        {'ids': [rows[3].id, rows[0].id, 9999]},
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    assert response.status_code == 200
+    assert response.json() == [
+        {'id': rows[0].id, 'version': 1, f'field_{text_field.id}': 'Row 0'},
+        {'id': rows[3].id, 'version': 1, f'field_{text_field.id}': 'Row 3'}
+    ]
+
+    response = api_client.get(
+        url,
+        {'ids': [rows[1].id], 'include_fields': ''},
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    assert response.json() == [{'id': rows[1].id, 'version': 1}]
+
+
+@pytest.mark.django_db
+def test_list_row_ids(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, primary=True)
+    grid = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    rows = [model.objects.create() for index in range(5)]
+    rows[1].delete()
+
+    url = reverse('api_v0:database:views:grid:row_ids', kwargs={'view_id': 999})
+    response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 404
+    assert response.json()['error'] == 'ERROR_GRID_DOES_NOT_EXIST'
+
+    url = reverse('api_v0:database:views:grid:row_ids', kwargs={'view_id': grid.id})
+    response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 200
+    assert response.json() == {
+        'count': 4,
+        'ids': [rows[0].id, rows[2].id, rows[3].id, rows[4].id]
+    }
+
+    response = api_client.get(url, {'offset': 1, 'limit': 2},
+                              HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.json() == {'count': 4, 'ids': [rows[2].id, rows[3].id]}
+
+    response = api_client.get(url, {'limit': 0}, HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 400
+    assert response.json()['error'] == 'ERROR_REQUEST_BODY_VALIDATION'
+
+
+@pytest.mark.django_db
+def test_list_rows_etag(api_client, data_fixture, capture_on_commit_callbacks):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    grid = data_fixture.create_grid_view(table=table)
+    RowHandler().create_row(user, table, {text_field.id: 'Green'})
+
+    url = reverse('api_v0:database:views:grid:list', kwargs={'view_id': grid.id})
+    response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 200
+    etag = response['ETag']
+
+    with CaptureQueriesContext(connection) as captured:
+        response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}',
+                                  HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response['ETag'] == etag
+    assert not response.content
+    assert not any(table.get_database_table_name() in query['sql']
+                   for query in captured.captured_queries)
+
+    with capture_on_commit_callbacks(execute=True):
+        RowHandler().create_row(user, table, {text_field.id: 'Orange'})
+    response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}',
+                              HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.json()['count'] == 2
+    assert response['ETag'] != etag
+    etag = response['ETag']
+
+    ViewHandler().update_grid_view_field_options(user, grid, {
+        text_field.id: {'width': 100}
+    })
+    response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}',
+                              HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response['ETag'] != etag
+
+    # If the rows are read from a replica no entity tag is set, because the replica
+    # could not yet have the rows of the current version.
+    with patch('baserow.contrib.database.api.v0.views.grid.views.'
+               'is_reading_from_replica', return_value=True):
+        response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 200
+    assert 'ETag' not in response
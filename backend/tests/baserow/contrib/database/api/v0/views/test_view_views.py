@@ -2,6 +2,7 @@ import pytest
 
 from django.shortcuts import reverse
 
+from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import GridView
 
 
@@ -226,3 +227,26 @@ def test_delete_view(api_client, data_fixture):
     assert response.status_code == 204
 
     assert GridView.objects.all().count() == 1
+
+
+@pytest.mark.django_db
+def test_list_views_etag(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_grid_view(table=table)
+
+    url = reverse('api_v0:database:views:list', kwargs={'table_id': table.id})
+    response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 200
+    etag = response['ETag']
+
+    response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}',
+                              HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+    ViewHandler().create_view(user, table, 'grid', name='Grid')
+    response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}',
+                              HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    assert response['ETag'] != etag
@@ -0,0 +1,111 @@
+import pytest
+
+from django.core.cache import cache
+from django.db import connections
+from django.test.utils import override_settings, CaptureQueriesContext
+from django.shortcuts import reverse
+
+from baserow.contrib.database.db.replicas import (
+    read_from_replica, get_replica_lag, get_replica, is_reading_from_replica
+)
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.rows.exceptions import RowVersionConflict
+
+
+DATABASES = ['default', 'default_replica']
+REPLICAS = {'default': ['default_replica']}
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db(databases=DATABASES)
+@override_settings(USER_TABLE_DATABASE_REPLICAS=REPLICAS)
+def test_read_from_replica(data_fixture):
+    user = data_fixture.create_user()
+    user_2 = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    cache.clear()
+    model = table.get_model()
+
+    assert model.objects.db == 'default'
+    assert not is_reading_from_replica('default')
+    with read_from_replica(user, table):
+        assert model.objects.db == 'default_replica'
+        assert is_reading_from_replica('default')
+    assert model.objects.db == 'default'
+    assert not is_reading_from_replica('default')
+
+    # After changing a row the user reads from the primary so that the change is
+    # visible, other users can still read from the replica.
+    RowHandler().create_row(user, table, {})
+    with read_from_replica(user, table):
+        assert model.objects.db == 'default'
+        assert not is_reading_from_replica('default')
+    with read_from_replica(user_2, table):
+        assert model.objects.db == 'default_replica'
+
+    # After changing the schema everyone reads from the primary.
+    FieldHandler().create_field(user, table, 'text', name='Text')
+    with read_from_replica(user_2, table):
+        assert model.objects.db == 'default'
+
+    with override_settings(USER_TABLE_DATABASE_REPLICAS={}):
+        cache.clear()
+        with read_from_replica(user_2, table):
+            assert model.objects.db == 'default'
+
+
+@pytest.mark.django_db(databases=DATABASES)
+@override_settings(USER_TABLE_DATABASE_REPLICAS=REPLICAS)
+def test_update_row_version_conflict_on_primary(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    row = RowHandler().create_row(user, table, {})
+    cache.clear()
+
+    # The replica doesn't have the uncommitted row of the test, like a lagging
+    # replica, so the existence of the row must be checked on the primary.
+    with read_from_replica(user, table):
+        with CaptureQueriesContext(connections['default_replica']) as captured:
+            with pytest.raises(RowVersionConflict):
+                RowHandler().update_row(user, table, row.id, {}, version=2)
+    assert len(captured) == 0
+
+
+@pytest.mark.django_db(databases=DATABASES)
+@override_settings(USER_TABLE_DATABASE_REPLICAS=REPLICAS, USER_TABLE_REPLICA_MAX_LAG=5)
+def test_lagging_replica_is_skipped():
+    assert get_replica_lag('default_replica') == 0
+    assert get_replica('default') == 'default_replica'
+
+    cache.set('baserow_replica_lag_default_replica', 10)
+    assert get_replica('default') is None
+
+    cache.set('baserow_replica_lag_default_replica', -1)
+    assert get_replica_lag('default_replica') is None
+    assert get_replica('default') is None
+
+
+@pytest.mark.django_db(transaction=True, databases=DATABASES)
+@override_settings(USER_TABLE_DATABASE_REPLICAS=REPLICAS)
+def test_list_rows_from_replica(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    model.objects.create(**{f'field_{field.id}': 'Value'})
+
+    url = reverse('api_v0:database:views:grid:list', kwargs={'view_id': grid.id})
+    with CaptureQueriesContext(connections['default_replica']) as replica_queries:
+        response = api_client.get(url, HTTP_AUTHORIZATION=f'JWT {token}')
+    assert response.status_code == 200
+    assert response.json()['results'][0][f'field_{field.id}'] == 'Value'
+    # The lag measurement, the count and the selection of the rows.
+    assert len(replica_queries) == 3
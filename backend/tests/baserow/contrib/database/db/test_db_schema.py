@@ -0,0 +1,170 @@
+import pytest
+
+from django.db import connection, transaction
+from django.test.utils import override_settings
+
+from prometheus_client import REGISTRY
+
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.models import PendingTableDrop
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.db.exceptions import TableSchemaLocked
+from baserow.contrib.database.db.schema import (
+    alter_table_schema, hold_table_schema_lock, TABLE_SCHEMA_ADVISORY_LOCK_NAMESPACE
+)
+
+
+def get_lock_timeout():
+    with connection.cursor() as cursor:
+        cursor.execute('SHOW lock_timeout')
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.django_db
+def test_alter_table_schema(data_fixture):
+    table = data_fixture.create_database_table()
+    lock_timeout = get_lock_timeout()
+    executed = []
+
+    def operation(schema_editor):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                '''
+                SELECT count(*) FROM pg_locks
+                WHERE locktype = 'advisory' AND classid = %s AND objid = %s
+                ''',
+                [TABLE_SCHEMA_ADVISORY_LOCK_NAMESPACE, table.id]
+            )
+            executed.append((cursor.fetchone()[0], get_lock_timeout()))
+        return 'result'
+
+    with override_settings(TABLE_SCHEMA_LOCK_TIMEOUT=100):
+        assert alter_table_schema(table, operation) == 'result'
+
+    # The advisory lock must be held and the lock timeout must be set while the
+    # operation is executed, the lock timeout must be restored afterwards.
+    assert executed == [(1, '100ms')]
+    assert get_lock_timeout() == lock_timeout
+
+
+@pytest.mark.django_db(transaction=True)
+def test_alter_table_schema_locked(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = TableHandler().create_table(user, database, name='Test')
+    model = table.get_model()
+    timeouts = REGISTRY.get_sample_value('baserow_table_schema_lock_timeouts_total')
+    other_connection = connection.copy()
+
+    try:
+        # Another connection that has read from the table in a long running
+        # transaction prevents the schema from being changed.
+        other_connection.set_autocommit(False)
+        with other_connection.cursor() as cursor:
+            cursor.execute(f'SELECT * FROM {model._meta.db_table}')
+
+        with override_settings(TABLE_SCHEMA_LOCK_TIMEOUT=10,
+                               TABLE_SCHEMA_LOCK_RETRIES=2,
+                               TABLE_SCHEMA_LOCK_RETRY_BACKOFF=0):
+            with pytest.raises(TableSchemaLocked):
+                alter_table_schema(
+                    table,
+                    lambda schema_editor: schema_editor.delete_model(model)
+                )
+
+            assert REGISTRY.get_sample_value(
+                'baserow_table_schema_lock_timeouts_total'
+            ) == timeouts + 3
+
+            # A pending drop of a locked table is skipped and retried later.
+            TableHandler().delete_table(user, table)
+            assert TableHandler().drop_pending_tables() == 0
+            assert PendingTableDrop.objects.all().count() == 1
+
+        other_connection.rollback()
+    finally:
+        other_connection.close()
+
+    assert TableHandler().drop_pending_tables() == 1
+    assert model._meta.db_table not in connection.introspection.table_names()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_hold_table_schema_lock(data_fixture):
+    table = data_fixture.create_database_table()
+    other_connection = connection.copy()
+
+    def try_lock():
+        with other_connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT pg_try_advisory_xact_lock(%s, %s)',
+                [TABLE_SCHEMA_ADVISORY_LOCK_NAMESPACE, table.id]
+            )
+            return cursor.fetchone()[0]
+
+    try:
+        with hold_table_schema_lock(table, connection):
+            # The lock is kept after a transaction has been committed and the
+            # transaction level lock of alter_table_schema is granted right away.
+            with transaction.atomic():
+                assert not try_lock()
+            assert not try_lock()
+            assert alter_table_schema(table, lambda schema_editor: 'result') == 'result'
+            assert not try_lock()
+
+        assert try_lock()
+    finally:
+        other_connection.close()
+
+
+def get_column_default(table_name, column):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            '''
+            SELECT column_default FROM information_schema.columns
+            WHERE table_name = %s AND column_name = %s
+            ''',
+            [table_name, column]
+        )
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.django_db
+def test_column_defaults(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = TableHandler().create_table(user, database, name='Test')
+    table_name = f'database_table_{table.id}'
+    primary_field = table.field_set.get(primary=True)
+    handler = FieldHandler()
+
+    assert get_column_default(table_name, primary_field.db_column) is None
+
+    text_field = handler.create_field(user, table, 'text', name='Text',
+                                      text_default='Default')
+    boolean_field = handler.create_field(user, table, 'boolean', name='Boolean')
+    number_field = handler.create_field(user, table, 'number', name='Number',
+                                        number_type='INTEGER')
+
+    assert get_column_default(table_name, text_field.db_column) == "'Default'::text"
+    assert get_column_default(table_name, boolean_field.db_column) == 'false'
+    assert get_column_default(table_name, number_field.db_column) is None
+
+    # A row that is inserted without going through the ORM must get the defaults.
+    with connection.cursor() as cursor:
+        cursor.execute(f'INSERT INTO {table_name} DEFAULT VALUES')
+
+    row = table.get_model().objects.get()
+    assert getattr(row, text_field.db_column) == 'Default'
+    assert getattr(row, boolean_field.db_column) is False
+    assert getattr(row, number_field.db_column) is None
+
+    text_field = handler.update_field(user, text_field, text_default='Other')
+    assert get_column_default(table_name, text_field.db_column) == "'Other'::text"
+
+    text_field = handler.update_field(user, text_field, new_type_name='number',
+                                      number_type='INTEGER')
+    assert get_column_default(table_name, text_field.db_column) is None
+
+    number_field = handler.update_field(user, number_field, new_type_name='boolean')
+    assert get_column_default(table_name, number_field.db_column) == 'false'
@@ -0,0 +1,140 @@
+import pytest
+
+from django.db import connections
+from django.test.utils import override_settings
+
+from baserow.core.utils import Progress
+from baserow.contrib.database.db.schema import TABLE_SCHEMA_ADVISORY_LOCK_NAMESPACE
+from baserow.contrib.database.db.shards import (
+    LeastTablesPlacementPolicy, DatabaseAffinityPlacementPolicy, get_placement_policy
+)
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
+
+
+SHARDS = ['default', 'user_tables']
+
+
+def get_schema_lock_count(connection, table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            '''
+            SELECT count(*) FROM pg_locks
+            WHERE locktype = 'advisory' AND classid = %s AND objid = %s
+            AND pid = pg_backend_pid()
+            ''',
+            [TABLE_SCHEMA_ADVISORY_LOCK_NAMESPACE, table.id]
+        )
+        return cursor.fetchone()[0]
+
+
+def table_exists(shard, table):
+    return (
+        table.get_database_table_name() in
+        connections[shard].introspection.table_names()
+    )
+
+
+@pytest.mark.django_db
+@override_settings(USER_TABLE_DATABASES=SHARDS)
+def test_placement_policies(data_fixture):
+    database = data_fixture.create_database_application()
+    database_2 = data_fixture.create_database_application()
+
+    assert LeastTablesPlacementPolicy().get_shard(database) == 'default'
+    data_fixture.create_database_table(database=database, shard='default')
+    assert LeastTablesPlacementPolicy().get_shard(database) == 'user_tables'
+    data_fixture.create_database_table(database=database_2, shard='user_tables')
+    data_fixture.create_database_table(database=database_2, shard='user_tables')
+    assert LeastTablesPlacementPolicy().get_shard(database) == 'default'
+
+    # The tables of the same database are kept together.
+    assert DatabaseAffinityPlacementPolicy().get_shard(database_2) == 'user_tables'
+    database_3 = data_fixture.create_database_application()
+    assert DatabaseAffinityPlacementPolicy().get_shard(database_3) == 'default'
+
+    assert isinstance(get_placement_policy(), DatabaseAffinityPlacementPolicy)
+
+
+@pytest.mark.django_db(databases=SHARDS)
+@override_settings(USER_TABLE_DATABASES=SHARDS,
+                   USER_TABLE_PLACEMENT_POLICY='baserow.contrib.database.db.shards.'
+                                               'LeastTablesPlacementPolicy')
+def test_table_in_other_shard(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    data_fixture.create_database_table(database=database, shard='default')
+    table = TableHandler().create_table(user, database, name='Test')
+
+    assert table.shard == 'user_tables'
+    assert table_exists('user_tables', table)
+    assert not table_exists('default', table)
+
+    field = FieldHandler().create_field(user, table, 'text', name='Text')
+    row_handler = RowHandler()
+    row = row_handler.create_row(user, table, {field.id: 'Value'})
+    row = row_handler.update_row(user, table, row.id, {field.id: 'Other'})
+
+    model = table.get_model()
+    assert model.objects.db == 'user_tables'
+    assert getattr(model.objects.get(id=row.id), field.db_column) == 'Other'
+
+    field = FieldHandler().update_field(user, field, 'number', number_type='INTEGER')
+    FieldHandler().delete_field(user, field)
+    row_handler.delete_row(user, table, row.id)
+    assert table.get_model().objects.count() == 0
+
+    TableHandler().delete_table(user, table)
+    assert TableHandler().drop_pending_tables() == 1
+    assert not table_exists('user_tables', table)
+
+
+@pytest.mark.django_db(databases=SHARDS)
+@override_settings(USER_TABLE_DATABASES=SHARDS)
+def test_move_table(data_fixture, monkeypatch):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = TableHandler().create_table(user, database, name='Test')
+    field = FieldHandler().create_field(user, table, 'text', name='Text',
+                                        text_default='Default')
+    model = table.get_model()
+    for index in range(5):
+        model.objects.create(**{field.db_column: f'Row {index}'})
+
+    handler = TableHandler()
+
+    with pytest.raises(ValueError):
+        handler.move_table(table, 'not_existing')
+
+    # The model must be generated while holding the schema lock of the table, so
+    # that the fields can't change while the rows are copied.
+    schema_locks = []
+    get_model = Table.get_model
+
+    def record_get_model(self, *args, **kwargs):
+        schema_locks.append(get_schema_lock_count(connections[self.shard], self))
+        return get_model(self, *args, **kwargs)
+
+    monkeypatch.setattr(Table, 'get_model', record_get_model)
+    progress = Progress(100)
+    table = handler.move_table(table, 'user_tables', batch_size=2, progress=progress)
+    monkeypatch.undo()
+    assert schema_locks == [1]
+
+    assert progress.percentage == 100
+    assert table.shard == 'user_tables'
+    assert Table.objects.get(id=table.id).shard == 'user_tables'
+    assert table_exists('user_tables', table)
+    assert not table_exists('default', table)
+
+    model = table.get_model()
+    assert [getattr(row, field.db_column) for row in model.objects.order_by('id')] == [
+        f'Row {index}' for index in range(5)
+    ]
+
+    # The sequence and defaults must have been moved with the rows.
+    row = model.objects.create()
+    assert row.id == 6
+    assert getattr(row, field.db_column) == 'Default'
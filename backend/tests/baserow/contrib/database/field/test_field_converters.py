@@ -0,0 +1,156 @@
+import pytest
+from decimal import Decimal
+
+from django.db import connection
+
+from baserow.core.utils import Progress
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.models import NumberField
+from baserow.contrib.database.fields.field_converters import TextToNumberFieldConverter
+from baserow.contrib.database.fields.registries import field_converter_registry
+
+
+class InterruptedConversion(Exception):
+    pass
+
+
+def get_column_names(table):
+    with connection.cursor() as cursor:
+        return [
+            column.name
+            for column in connection.introspection.get_table_description(
+                cursor, f'database_table_{table.id}'
+            )
+        ]
+
+
+@pytest.mark.django_db
+def test_text_to_number_convert_value():
+    converter = TextToNumberFieldConverter()
+    decimal_field = NumberField(number_type='DECIMAL', number_decimal_places=2,
+                                number_negative=False)
+    integer_field = NumberField(number_type='INTEGER', number_negative=True)
+
+    assert converter.convert_value(None, decimal_field, '1') == Decimal('1.00')
+    assert converter.convert_value(None, decimal_field, ' 2.555 ') == Decimal('2.56')
+    assert converter.convert_value(None, decimal_field, '1e3') == Decimal('1000.00')
+    assert converter.convert_value(None, integer_field, '-2.5') == -3
+    assert converter.convert_value(None, integer_field, '10.4') == 10
+
+    for value in ['', 'Test', '1,5', 'NaN', 'Infinity', '-1', '1' * 51]:
+        with pytest.raises(ValueError):
+            converter.convert_value(None, decimal_field, value)
+
+    with pytest.raises(ValueError):
+        converter.convert_value(None, integer_field, '2147483648')
+
+
+@pytest.mark.django_db
+def test_text_to_number_field_converter(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    field_name = f'field_{field.id}'
+    model = table.get_model()
+    values = ['1', ' 2.555 ', 'Test', None, '-3', '', '12']
+    rows = [model.objects.create(**{field_name: value}) for value in values]
+
+    converter = field_converter_registry.get('text_to_number')
+    converter.batch_size = 3
+    percentages = []
+    progress = Progress(100, callback=percentages.append)
+
+    try:
+        field = FieldHandler().update_field(user, field, 'number',
+                                            progress=progress, number_type='DECIMAL',
+                                            number_decimal_places=2)
+    finally:
+        del converter.batch_size
+
+    assert isinstance(field, NumberField)
+    assert progress.failed == 3
+    assert percentages[-1] == 100
+
+    model = table.get_model()
+    converted = [
+        getattr(model.objects.get(id=row.id), field_name)
+        for row in rows
+    ]
+    assert converted == [Decimal('1.00'), Decimal('2.56'), None, None, None, None,
+                         Decimal('12.00')]
+    assert get_column_names(table) == ['id', 'version', field_name]
+
+
+@pytest.mark.django_db
+def test_text_to_number_field_converter_resume(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    field_name = f'field_{field.id}'
+    model = table.get_model()
+    rows = [model.objects.create(**{field_name: str(index)}) for index in range(5)]
+
+    def interrupt(percentage):
+        raise InterruptedConversion()
+
+    converter = field_converter_registry.get('text_to_number')
+    converter.batch_size = 2
+    handler = FieldHandler()
+
+    try:
+        with pytest.raises(InterruptedConversion):
+            handler.update_field(user, field, 'number',
+                                 progress=Progress(100, callback=interrupt),
+                                 number_type='INTEGER')
+    finally:
+        del converter.batch_size
+
+    # The first batch has been converted, but the field itself is not changed yet.
+    field = handler.get_field(user, field.id)
+    assert field.__class__.__name__ == 'TextField'
+    assert get_column_names(table) == [
+        'id', 'version', field_name, f'{field_name}_conversion',
+        f'{field_name}_converted'
+    ]
+
+    # A row that has already been converted changes in the meantime, it must be
+    # converted again when the conversion resumes.
+    rows[0].__dict__[field_name] = '10'
+    rows[0].save()
+
+    progress = Progress(100)
+    field = handler.update_field(user, field, 'number', progress=progress,
+                                 number_type='INTEGER')
+    assert get_column_names(table) == ['id', 'version', field_name]
+    assert progress.failed == 0
+
+    model = table.get_model()
+    assert [getattr(row, field_name) for row in model.objects.order_by('id')] == [
+        10, 1, 2, 3, 4
+    ]
+
+
+@pytest.mark.django_db
+def test_incomplete_conversion_is_cleaned_up(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    field_2 = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    model.objects.create(**{f'field_{field.id}': '1', f'field_{field_2.id}': '2'})
+    handler = FieldHandler()
+
+    def interrupt(percentage):
+        raise InterruptedConversion()
+
+    for text_field in [field, field_2]:
+        with pytest.raises(InterruptedConversion):
+            handler.update_field(user, text_field, 'number',
+                                 progress=Progress(100, callback=interrupt),
+                                 number_type='INTEGER')
+
+    # Changing the type without the converter removes the shadow columns.
+    handler.update_field(user, handler.get_field(user, field.id), 'boolean')
+    handler.delete_field(user, handler.get_field(user, field_2.id))
+
+    assert get_column_names(table) == ['id', 'version', f'field_{field.id}']
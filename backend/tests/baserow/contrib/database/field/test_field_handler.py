@@ -140,18 +140,16 @@ def test_update_field(data_fixture):
     table_model = table.get_model()
     field_name = f'field_{text_field_2.id}'
     instance = table_model.objects.create(**{field_name: 'Test'})
-
-    with pytest.raises(CannotChangeFieldType):
-        handler.update_field(user=user, field=text_field_2, new_type_name='number',
-                             number_type='DECIMAL')
-
-    setattr(instance, field_name, '1')
-    instance.save()
+    instance_2 = table_model.objects.create(**{field_name: '1'})
 
     number_field_2 = handler.update_field(user=user, field=text_field_2,
                                           new_type_name='number', number_type='DECIMAL')
 
+    # The value that is not a number could not be converted and becomes empty.
     table_model = table.get_model()
+    assert getattr(table_model.objects.get(id=instance.id), field_name) is None
+    assert getattr(table_model.objects.get(id=instance_2.id), field_name) == 1
+
     with pytest.raises(ValidationError):
         with transaction.atomic():
             table_model.objects.create(**{field_name: 'Test 1'})
@@ -168,6 +166,10 @@ def test_update_field(data_fixture):
                          number_type='DECIMAL', number_decimal_places=2,
                          number_negative=True)
 
+    # A number cannot be cast to a boolean without a field converter.
+    with pytest.raises(CannotChangeFieldType):
+        handler.update_field(user=user, field=number_field_2, new_type_name='boolean')
+
     assert Field.objects.all().count() == 2
     assert TextField.objects.all().count() == 1
     assert NumberField.objects.all().count() == 1
@@ -208,6 +210,25 @@ def test_update_field(data_fixture):
         handler.update_field(user=user, field=number_field, new_type_name='boolean')
 
 
+@pytest.mark.django_db
+def test_update_field_stale_instance(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name='Text')
+    stale_field = Field.objects.get(id=text_field.id).specific
+
+    handler = FieldHandler()
+    handler.update_field(user=user, field=text_field, name='Renamed')
+
+    # The field is fetched again after the schema of the table has been locked, so
+    # the changes that have been made in the meantime are not overwritten by the
+    # values of the stale instance.
+    field = handler.update_field(user=user, field=stale_field, new_type_name='number')
+    assert isinstance(field, NumberField)
+    assert field.name == 'Renamed'
+    assert Field.objects.get(id=text_field.id).name == 'Renamed'
+
+
 @pytest.mark.django_db
 def test_delete_field(data_fixture):
     user = data_fixture.create_user()
@@ -0,0 +1,51 @@
+import pytest
+
+from rest_framework.exceptions import APIException
+
+from baserow.core.exceptions import UserNotInGroupError
+from baserow.core.jobs.handler import JobHandler
+from baserow.contrib.database.fields.models import NumberField
+from baserow.contrib.database.fields.exceptions import FieldDoesNotExist
+
+
+@pytest.mark.django_db
+def test_update_field_job_type(data_fixture):
+    user = data_fixture.create_user()
+    user_2 = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    handler = JobHandler()
+
+    with pytest.raises(UserNotInGroupError):
+        handler.create_job(user_2, 'update_field', field_id=field.id, values={})
+
+    with pytest.raises(FieldDoesNotExist):
+        handler.create_job(user, 'update_field', field_id=99999, values={})
+
+    with pytest.raises(APIException):
+        handler.create_job(user, 'update_field', field_id=field.id, values={
+            'type': 'number',
+            'number_type': 'NOT_EXISTING'
+        })
+
+    job = handler.create_job(user, 'update_field', field_id=field.id, values={
+        'type': 'number',
+        'name': 'Price',
+        'number_type': 'DECIMAL',
+        'number_decimal_places': 2
+    })
+    assert job.arguments['type_name'] == 'number'
+
+    model = table.get_model()
+    model.objects.create(**{f'field_{field.id}': '10'})
+    model.objects.create(**{f'field_{field.id}': 'Not a number'})
+
+    job = handler.run_job(handler.claim_next_job())
+    assert job.state == 'finished'
+    assert job.result == {'failed_conversions': 1}
+
+    number_field = NumberField.objects.get(id=field.id)
+    assert number_field.name == 'Price'
+    assert number_field.number_decimal_places == 2
+    model = table.get_model()
+    model.objects.create(**{f'field_{field.id}': '10.22'})
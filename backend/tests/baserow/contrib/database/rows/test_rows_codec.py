@@ -0,0 +1,103 @@
+import pytest
+
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+
+from baserow.contrib.database.rows.codec import get_row_codec
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('storage', ['columns', 'jsonb'])
+def test_row_codec(data_fixture, storage):
+    table = data_fixture.create_database_table(storage=storage)
+    text_field = data_fixture.create_text_field(table=table, name='Name', order=1)
+    number_field = data_fixture.create_number_field(
+        table=table, name='Price', number_type='DECIMAL', number_decimal_places=2,
+        order=2
+    )
+    boolean_field = data_fixture.create_boolean_field(table=table, name='Sold',
+                                                      order=3)
+    model = table.get_model()
+    codec = get_row_codec(model)
+
+    assert get_row_codec(model) is codec
+    assert get_row_codec(table.get_model()) is not codec
+
+    text_name = f'field_{text_field.id}'
+    number_name = f'field_{number_field.id}'
+    boolean_name = f'field_{boolean_field.id}'
+
+    assert codec.decode({
+        text_field.id: 'Tesla',
+        str(number_field.id): '10.5',
+        boolean_name: 'true',
+        'unknown': 'Ignored',
+        9999: 'Ignored'
+    }) == {
+        text_name: 'Tesla',
+        number_name: Decimal('10.50'),
+        boolean_name: True
+    }
+    assert codec.decode({}) == {}
+
+    with pytest.raises(ValidationError) as e:
+        codec.decode({
+            text_field.id: 'Tesla',
+            number_field.id: '-1',
+            boolean_field.id: None
+        })
+    assert e.value.message_dict.keys() == {number_name, boolean_name}
+    assert [error.code for error in e.value.error_dict[number_name]] == ['min_value']
+    assert [error.code for error in e.value.error_dict[boolean_name]] == ['null']
+
+    row = model.objects.create(**codec.decode({
+        text_field.id: 'Tesla',
+        number_field.id: 10.5
+    }))
+    assert codec.encode(row) == {
+        'id': row.id,
+        'version': 1,
+        text_name: 'Tesla',
+        number_name: '10.50',
+        boolean_name: False
+    }
+    assert codec.encode_values(row, [number_name]) == {number_name: '10.50'}
+
+    rows = model.objects.order_by('id').values_list(*codec.get_column_names())
+    if storage == 'columns':
+        assert codec.get_column_names() == [
+            'id', 'version', text_name, number_name, boolean_name
+        ]
+    else:
+        assert codec.get_column_names() == ['id', 'version', 'data']
+    assert codec.encode_columns(rows) == {
+        'ids': [row.id],
+        'versions': [1],
+        'field_ids': [text_field.id, number_field.id, boolean_field.id],
+        'columns': [['Tesla'], ['10.50'], [False]]
+    }
+    assert codec.encode_columns([]) == {
+        'ids': [],
+        'versions': [],
+        'field_ids': [text_field.id, number_field.id, boolean_field.id],
+        'columns': [[], [], []]
+    }
+
+    # The values can also be provided by attribute name.
+    codec = get_row_codec(table.get_model(attribute_names=True))
+    assert codec.decode({'name': 'Audi'}) == {'name': 'Audi'}
+    assert codec.decode({text_name: 'Audi'}) == {'name': 'Audi'}
+
+    # The rows that existed before a field was created contain its default.
+    new_field = data_fixture.create_boolean_field(table=table, name='New')
+    model = table.get_model()
+    codec = get_row_codec(model)
+    rows = model.objects.order_by('id').values_list(*codec.get_column_names())
+    encoded = codec.encode_columns(rows)
+    assert dict(zip(encoded['field_ids'], encoded['columns'])) == {
+        text_field.id: ['Tesla'],
+        number_field.id: ['10.50'],
+        boolean_field.id: [False],
+        new_field.id: [False]
+    }
@@ -2,11 +2,15 @@ import pytest
 
 from decimal import Decimal
 
+from django.db import connection
 from django.core.exceptions import ValidationError
+from django.test.utils import CaptureQueriesContext
 
 from baserow.core.exceptions import UserNotInGroupError
 from baserow.contrib.database.rows.handler import RowHandler
-from baserow.contrib.database.rows.exceptions import RowDoesNotExist
+from baserow.contrib.database.rows.exceptions import (
+    RowDoesNotExist, RowVersionConflict
+)
 
 
 def test_get_field_ids_from_dict():
@@ -20,6 +24,12 @@ def test_get_field_ids_from_dict():
     }) == [1, 2, 3]
 
 
+def test_get_field_ids_from_string():
+    handler = RowHandler()
+    assert handler.extract_field_ids_from_string('') == []
+    assert handler.extract_field_ids_from_string('field_1, 2,abc,fieldd_3') == [1, 2]
+
+
 @pytest.mark.django_db
 def test_create_row(data_fixture):
     user = data_fixture.create_user()
@@ -49,7 +59,8 @@ def test_create_row(data_fixture):
     })
     assert getattr(row, f'field_{name_field.id}') == 'Tesla'
     assert getattr(row, f'field_{speed_field.id}') == 240
-    assert getattr(row, f'field_{price_field.id}') == 59999.99
+    # The values are coerced by the row codec.
+    assert getattr(row, f'field_{price_field.id}') == Decimal('59999.99')
     assert not getattr(row, f'field_9999', None)
     row.refresh_from_db()
     assert getattr(row, f'field_{name_field.id}') == 'Tesla'
@@ -111,6 +122,62 @@ def test_update_row(data_fixture):
     assert getattr(row, f'field_{name_field.id}') == 'Tesla'
     assert getattr(row, f'field_{speed_field.id}') == 240
     assert getattr(row, f'field_{price_field.id}') == Decimal('59999.99')
+    assert row.version == 2
+
+    with pytest.raises(RowVersionConflict):
+        handler.update_row(user=user, table=table, row_id=row.id, values={
+            name_field.id: 'Audi'
+        }, version=1)
+
+    with pytest.raises(RowDoesNotExist):
+        handler.update_row(user=user, table=table, row_id=99999, values={},
+                           version=1)
+
+    updated_row = handler.update_row(user=user, table=table, row_id=row.id, values={
+        name_field.id: 'Audi'
+    }, version=2)
+    assert updated_row.id == row.id
+    assert updated_row.version == 3
+    assert getattr(updated_row, f'field_{name_field.id}') == 'Audi'
+
+    row.refresh_from_db()
+    assert getattr(row, f'field_{name_field.id}') == 'Audi'
+    assert getattr(row, f'field_{price_field.id}') == Decimal('59999.99')
+    assert row.version == 3
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('storage', ['columns', 'jsonb'])
+def test_update_row_single_query(data_fixture, storage):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user, storage=storage)
+    name_field = data_fixture.create_text_field(table=table, name='Name')
+    speed_field = data_fixture.create_number_field(table=table, name='Speed')
+    model = table.get_model()
+    row = model.objects.create(**{
+        f'field_{name_field.id}': 'Tesla',
+        f'field_{speed_field.id}': 240
+    })
+    table_name = connection.ops.quote_name(table.get_database_table_name())
+
+    with CaptureQueriesContext(connection) as captured:
+        updated_row = RowHandler().update_row(user, table, row.id, {
+            name_field.id: 'Audi'
+        }, model=model)
+
+    table_queries = [
+        query['sql'] for query in captured.captured_queries
+        if table_name in query['sql']
+    ]
+    assert len(table_queries) == 1
+    assert table_queries[0].startswith(f'UPDATE {table_name}')
+
+    assert updated_row.version == 2
+    assert getattr(updated_row, f'field_{name_field.id}') == 'Audi'
+    if storage == 'columns':
+        assert updated_row.get_deferred_fields() == {f'field_{speed_field.id}'}
+        assert f'"field_{speed_field.id}"' not in table_queries[0]
+    assert getattr(updated_row, f'field_{speed_field.id}') == 240
 
 
 @pytest.mark.django_db
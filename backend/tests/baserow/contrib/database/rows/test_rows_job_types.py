@@ -0,0 +1,41 @@
+import pytest
+
+from decimal import Decimal
+
+from baserow.core.jobs.handler import JobHandler
+
+
+@pytest.mark.django_db
+def test_import_rows_job_type(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(
+        table=table, number_type='DECIMAL', number_decimal_places=2
+    )
+    handler = JobHandler()
+
+    job = handler.create_job(user, 'import_rows', table_id=table.id, rows=[
+        {f'field_{text_field.id}': 'Row 1', f'field_{number_field.id}': '1.10'},
+        {f'field_{text_field.id}': 'Row 2', f'field_{number_field.id}': -1},
+    ])
+    job = handler.run_job(handler.claim_next_job())
+    assert job.state == 'failed'
+    assert job.error.startswith('Row 1 is invalid')
+
+    model = table.get_model()
+    assert model.objects.all().count() == 0
+
+    rows = [
+        {f'field_{text_field.id}': f'Row {index}', f'field_{number_field.id}': index}
+        for index in range(0, 2500)
+    ]
+    job = handler.create_job(user, 'import_rows', table_id=table.id, rows=rows)
+    job = handler.run_job(handler.claim_next_job())
+    assert job.state == 'finished'
+    assert job.result == {'imported_rows': 2500}
+
+    assert model.objects.all().count() == 2500
+    row = model.objects.all().order_by('id').last()
+    assert getattr(row, f'field_{text_field.id}') == 'Row 2499'
+    assert getattr(row, f'field_{number_field.id}') == Decimal('2499.00')
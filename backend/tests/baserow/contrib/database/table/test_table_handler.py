@@ -3,7 +3,7 @@ import pytest
 from django.db import connection
 
 from baserow.core.exceptions import UserNotInGroupError
-from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.table.models import Table, PendingTableDrop
 from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.table.exceptions import TableDoesNotExist
 from baserow.contrib.database.fields.models import TextField
@@ -101,7 +101,15 @@ def test_delete_database_table(data_fixture):
     assert Table.objects.all().count() == 1
     assert f'database_table_{table.id}' in connection.introspection.table_names()
 
+    table_id = table.id
     handler.delete_table(user=user, table=table)
 
+    # The table is deleted right away, but the database table is dropped later.
     assert Table.objects.all().count() == 0
-    assert f'database_table_{table.id}' not in connection.introspection.table_names()
+    assert f'database_table_{table_id}' in connection.introspection.table_names()
+    assert PendingTableDrop.objects.get().db_table == f'database_table_{table_id}'
+
+    assert handler.drop_pending_tables() == 1
+    assert f'database_table_{table_id}' not in connection.introspection.table_names()
+    assert PendingTableDrop.objects.all().count() == 0
+    assert handler.drop_pending_tables() == 0
@@ -0,0 +1,23 @@
+import pytest
+
+from django.db import connection
+
+from baserow.core.jobs.handler import JobHandler
+from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.table.handler import TableHandler
+
+
+@pytest.mark.django_db
+def test_delete_table_job_type(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    handler = JobHandler()
+
+    job = handler.create_job(user, 'delete_table', table_id=table.id)
+    assert Table.objects.all().count() == 1
+
+    job = handler.run_job(handler.claim_next_job())
+    assert job.state == 'finished'
+    assert Table.objects.all().count() == 0
+    assert TableHandler().drop_pending_tables() == 1
+    assert f'database_table_{table.id}' not in connection.introspection.table_names()
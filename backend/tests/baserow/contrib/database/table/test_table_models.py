@@ -1,8 +1,13 @@
 import pytest
 
-from django.db import models
+from django.db import models, connection
+from django.test.utils import CaptureQueriesContext
 
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.views.handler import ViewHandler
 
 
 @pytest.mark.django_db
@@ -39,7 +44,7 @@ def test_get_table_model(data_fixture):
     model = table.get_model(attribute_names=True)
     assert model._generated_table_model
     assert model._meta.db_table == f'database_table_{table.id}'
-    assert len(model._meta.get_fields()) == 4
+    assert len(model._meta.get_fields()) == 5
 
     color_field = model._meta.get_field('color')
     horsepower_field = model._meta.get_field('horsepower')
@@ -77,7 +82,7 @@ def test_get_table_model(data_fixture):
 
     model_2 = table.get_model(fields=[number_field], field_ids=[text_field.id],
                               attribute_names=True)
-    assert len(model_2._meta.get_fields()) == 3
+    assert len(model_2._meta.get_fields()) == 4
 
     color_field = model_2._meta.get_field('color')
     assert color_field
@@ -89,7 +94,7 @@ def test_get_table_model(data_fixture):
 
     model_3 = table.get_model()
     assert model_3._meta.db_table == f'database_table_{table.id}'
-    assert len(model_3._meta.get_fields()) == 4
+    assert len(model_3._meta.get_fields()) == 5
 
     field_1 = model_3._meta.get_field(f'field_{text_field.id}')
     assert isinstance(field_1, models.TextField)
@@ -107,7 +112,7 @@ def test_get_table_model(data_fixture):
                                                   text_default='orange')
     model = table.get_model(attribute_names=True)
     field_names = [f.name for f in model._meta.get_fields()]
-    assert len(field_names) == 5
+    assert len(field_names) == 6
     assert f'{text_field.model_attribute_name}_field_{text_field.id}' in field_names
     assert f'{text_field_2.model_attribute_name}_field_{text_field.id}' in field_names
 
@@ -131,3 +136,71 @@ def test_get_table_model(data_fixture):
     assert fields[text_field_2.id]['field'].id == text_field_2.id
     assert fields[text_field_2.id]['type'].type == 'text'
     assert fields[text_field_2.id]['name'] == f'field_{text_field_2.id}'
+
+
+@pytest.mark.django_db
+def test_get_table_model_queries(data_fixture):
+    table = data_fixture.create_database_table()
+    for index in range(5):
+        data_fixture.create_text_field(table=table)
+        data_fixture.create_number_field(table=table)
+
+    # The fields are fetched with one query and the specific fields with one query per
+    # field type.
+    table = Table.objects.get(pk=table.id)
+    with CaptureQueriesContext(connection) as captured:
+        model = table.get_model()
+    assert len(captured) == 3
+    assert len(model._field_objects) == 10
+
+
+@pytest.mark.django_db
+def test_table_versions(data_fixture, capture_on_commit_callbacks):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    grid = data_fixture.create_grid_view(table=table)
+    text_field = data_fixture.create_text_field(table=table)
+
+    def get_versions():
+        table.refresh_from_db()
+        return table.data_version, table.schema_version
+
+    assert get_versions() == (1, 1)
+
+    # The data version is only incremented when the changes of the rows have been
+    # committed.
+    row_handler = RowHandler()
+    with capture_on_commit_callbacks() as callbacks:
+        row = row_handler.create_row(user, table, {text_field.id: 'Green'})
+    assert get_versions() == (1, 1)
+    callbacks[0]()
+    assert get_versions() == (2, 1)
+
+    with capture_on_commit_callbacks(execute=True) as callbacks:
+        row_handler.create_rows(user, table, [{}, {}])
+        row_handler.update_row(user, table, row.id, {text_field.id: 'Orange'})
+        row_handler.delete_row(user, table, row.id)
+    assert callbacks.count(table.increment_data_version) == 3
+    assert get_versions() == (5, 1)
+
+    field_handler = FieldHandler()
+    field = field_handler.create_field(user, table, 'text', name='Text')
+    field = field_handler.update_field(user, field, name='Renamed')
+    field_handler.delete_field(user, field)
+    assert get_versions() == (5, 4)
+
+    view_handler = ViewHandler()
+    view = view_handler.create_view(user, table, 'grid', name='Grid')
+    view_handler.update_view(user, view, name='Renamed')
+    view_handler.update_grid_view_field_options(user, grid, {
+        text_field.id: {'hidden': True}
+    })
+    view_handler.delete_view(user, view)
+    assert get_versions() == (5, 8)
+
+    # Saving an outdated instance doesn't overwrite the versions.
+    outdated_table = Table.objects.get(pk=table.id)
+    with capture_on_commit_callbacks(execute=True):
+        row_handler.create_row(user, table)
+    TableHandler().update_table(user, outdated_table, name='Renamed')
+    assert get_versions() == (6, 9)
@@ -0,0 +1,231 @@
+import pytest
+from decimal import Decimal
+
+from django.db import connection
+from django.shortcuts import reverse
+from django.test.utils import override_settings
+
+from baserow.core.utils import Progress
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.db.schema import TABLE_SCHEMA_ADVISORY_LOCK_NAMESPACE
+from baserow.contrib.database.rows.handler import RowHandler
+
+
+def get_schema_lock_count(connection, table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            '''
+            SELECT count(*) FROM pg_locks
+            WHERE locktype = 'advisory' AND classid = %s AND objid = %s
+            AND pid = pg_backend_pid()
+            ''',
+            [TABLE_SCHEMA_ADVISORY_LOCK_NAMESPACE, table.id]
+        )
+        return cursor.fetchone()[0]
+
+
+def get_column_names(table):
+    with connection.cursor() as cursor:
+        return [
+            column.name
+            for column in connection.introspection.get_table_description(
+                cursor, table.get_database_table_name()
+            )
+        ]
+
+
+@pytest.mark.django_db
+@override_settings(USER_TABLE_STORAGE='jsonb')
+def test_jsonb_storage(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = TableHandler().create_table(user, database, name='Test')
+    primary_field = table.field_set.get(primary=True)
+    field_handler = FieldHandler()
+    row_handler = RowHandler()
+
+    assert table.storage == 'jsonb'
+    assert get_column_names(table) == ['id', 'version', 'data']
+
+    row_1 = row_handler.create_row(user, table, {primary_field.id: 'Row 1'})
+
+    # Adding fields only changes the metadata.
+    text_field = field_handler.create_field(user, table, 'text', name='Text',
+                                            text_default='Default')
+    number_field = field_handler.create_field(user, table, 'number', name='Number',
+                                              number_type='DECIMAL',
+                                              number_decimal_places=2)
+    boolean_field = field_handler.create_field(user, table, 'boolean', name='Bool')
+    assert get_column_names(table) == ['id', 'version', 'data']
+
+    row_2 = row_handler.create_row(user, table, {
+        primary_field.id: 'Row 2',
+        number_field.id: '1.56',
+        boolean_field.id: True
+    })
+    row_2 = row_handler.update_row(user, table, row_2.id, {text_field.id: 'Changed'})
+
+    model = table.get_model()
+    row_1 = model.objects.get(id=row_1.id)
+    row_2 = model.objects.get(id=row_2.id)
+    text_name = f'field_{text_field.id}'
+    number_name = f'field_{number_field.id}'
+    boolean_name = f'field_{boolean_field.id}'
+
+    # The rows that existed before the field was created get the default.
+    assert getattr(row_1, text_name) == 'Default'
+    assert getattr(row_1, number_name) is None
+    assert getattr(row_1, boolean_name) is False
+    assert getattr(row_2, text_name) == 'Changed'
+    assert getattr(row_2, number_name) == Decimal('1.56')
+    assert getattr(row_2, boolean_name) is True
+    assert row_2.data == {
+        str(primary_field.id): 'Row 2',
+        str(text_field.id): 'Changed',
+        str(number_field.id): '1.56',
+        str(boolean_field.id): True
+    }
+
+    # Rows keep the default that they had when the default changes. Only the
+    # metadata of the field changes, the rows are not updated.
+    text_field = field_handler.update_field(user, text_field, text_default='Other')
+    assert text_field.jsonb_missing_default == {'value': 'Default'}
+    row_3 = row_handler.create_row(user, table, {})
+    text_field = field_handler.update_field(user, text_field, text_default='Third')
+    assert text_field.jsonb_missing_default == {'value': 'Default'}
+    model = table.get_model()
+    assert str(text_field.id) not in model.objects.get(id=row_1.id).data
+    assert getattr(model.objects.get(id=row_1.id), text_name) == 'Default'
+    assert getattr(model.objects.get(id=row_3.id), text_name) == 'Other'
+    assert getattr(model(), text_name) == 'Third'
+
+    # Changing the type converts the values when they are read.
+    field_handler.update_field(user, number_field, 'text')
+    field_handler.update_field(user, text_field, 'number', number_type='INTEGER')
+    model = table.get_model()
+    assert getattr(model.objects.get(id=row_1.id), number_name) is None
+    assert getattr(model.objects.get(id=row_2.id), number_name) == '1.56'
+    assert getattr(model.objects.get(id=row_2.id), text_name) is None
+
+    field_handler.delete_field(user, boolean_field)
+    assert get_column_names(table) == ['id', 'version', 'data']
+    assert boolean_name not in [
+        field_object['name']
+        for field_object in table.get_model()._field_objects.values()
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('storage', ['columns', 'jsonb'])
+def test_row_api_with_storage(api_client, data_fixture, storage):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user, storage=storage)
+    text_field = data_fixture.create_text_field(table=table, text_default='white')
+    number_field = data_fixture.create_number_field(table=table,
+                                                    number_type='DECIMAL',
+                                                    number_decimal_places=2)
+    grid = data_fixture.create_grid_view(table=table)
+
+    response = api_client.post(
+        reverse('api_v0:database:rows:list', kwargs={'table_id': table.id}),
+        {f'field_{number_field.id}': '10.5'},
+        format='json',
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    assert response.status_code == 200
+    row_id = response.json()['id']
+    assert response.json() == {
+        'id': row_id,
+        'version': 1,
+        f'field_{text_field.id}': 'white',
+        f'field_{number_field.id}': '10.50'
+    }
+
+    response = api_client.patch(
+        reverse('api_v0:database:rows:item', kwargs={
+            'table_id': table.id, 'row_id': row_id
+        }),
+        {f'field_{text_field.id}': 'Green'},
+        format='json',
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        'id': row_id,
+        'version': 2,
+        f'field_{text_field.id}': 'Green'
+    }
+
+    response = api_client.get(
+        reverse('api_v0:database:views:grid:list', kwargs={'view_id': grid.id}),
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    assert response.json()['results'] == [{
+        'id': row_id,
+        'version': 2,
+        f'field_{text_field.id}': 'Green',
+        f'field_{number_field.id}': '10.50'
+    }]
+
+
+@pytest.mark.django_db
+def test_change_table_storage(data_fixture, monkeypatch):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table, number_type='DECIMAL',
+                                                    number_decimal_places=2)
+    model = table.get_model()
+    for index in range(5):
+        model.objects.create(**{
+            f'field_{text_field.id}': f'Row {index}',
+            f'field_{number_field.id}': Decimal(f'{index}.25')
+        })
+    RowHandler().update_row(user, table, 2, {text_field.id: 'Row 1'})
+    handler = TableHandler()
+
+    def get_values(table):
+        return [
+            (
+                row.id,
+                row.version,
+                getattr(row, f'field_{text_field.id}'),
+                getattr(row, f'field_{number_field.id}')
+            )
+            for row in table.get_model().objects.order_by('id')
+        ]
+
+    values = get_values(table)
+
+    with pytest.raises(ValueError):
+        handler.change_table_storage(table, 'not_existing')
+
+    # The models must be generated while holding the schema lock of the table, so
+    # that the fields can't change while the rows are copied.
+    schema_locks = []
+    get_model = Table.get_model
+
+    def record_get_model(self, *args, **kwargs):
+        schema_locks.append(get_schema_lock_count(connection, self))
+        return get_model(self, *args, **kwargs)
+
+    monkeypatch.setattr(Table, 'get_model', record_get_model)
+    progress = Progress(100)
+    table = handler.change_table_storage(table, 'jsonb', batch_size=2,
+                                         progress=progress)
+    monkeypatch.undo()
+    assert schema_locks == [1, 1]
+    assert progress.percentage == 100
+    assert Table.objects.get(id=table.id).storage == 'jsonb'
+    assert get_column_names(table) == ['id', 'version', 'data']
+    assert get_values(table) == values
+    assert table.get_model().objects.create().id == 6
+
+    table = handler.change_table_storage(table, 'columns')
+    assert Table.objects.get(id=table.id).storage == 'columns'
+    assert get_column_names(table) == [
+        'id', 'version', f'field_{text_field.id}', f'field_{number_field.id}'
+    ]
+    assert get_values(table)[:5] == values
@@ -2,9 +2,11 @@ import pytest
 
 from baserow.core.exceptions import UserNotInGroupError
 from baserow.contrib.database.views.handler import ViewHandler
-from baserow.contrib.database.views.models import View, GridView
+from baserow.contrib.database.views.models import (
+    View, GridView, GridViewFieldOptions
+)
 from baserow.contrib.database.views.exceptions import (
-    ViewTypeDoesNotExist, ViewDoesNotExist
+    ViewTypeDoesNotExist, ViewDoesNotExist, UnrelatedFieldError
 )
 
 
@@ -98,3 +100,66 @@ def test_delete_view(data_fixture):
     assert View.objects.all().count() == 1
     handler.delete_view(user=user, view=grid)
     assert View.objects.all().count() == 0
+
+
+@pytest.mark.django_db
+def test_update_grid_view_field_options(data_fixture):
+    user = data_fixture.create_user()
+    user_2 = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    grid_view = data_fixture.create_grid_view(table=table)
+    field_1 = data_fixture.create_text_field(table=table, primary=True)
+    field_2 = data_fixture.create_text_field(table=table)
+    field_3 = data_fixture.create_text_field(table=table)
+    field_4 = data_fixture.create_text_field()
+
+    handler = ViewHandler()
+
+    with pytest.raises(UserNotInGroupError):
+        handler.update_grid_view_field_options(user_2, grid_view, {
+            field_2.id: {'hidden': True}
+        })
+
+    with pytest.raises(UnrelatedFieldError):
+        handler.update_grid_view_field_options(user, grid_view, {
+            field_2.id: {'hidden': True},
+            field_4.id: {'hidden': True}
+        })
+    assert GridViewFieldOptions.objects.all().count() == 0
+
+    field_options = handler.update_grid_view_field_options(user, grid_view, {
+        str(field_2.id): {'hidden': True, 'width': 100}
+    })
+    assert [options.field_id for options in field_options] == [
+        field_1.id, field_2.id, field_3.id
+    ]
+    assert field_options[0].id is None
+    assert field_options[0].width == 200
+    assert not field_options[0].hidden
+    assert field_options[1].width == 100
+    assert field_options[1].hidden
+
+    field_options = handler.update_grid_view_field_options(user, grid_view, {
+        field_1.id: {'hidden': True},
+        field_2.id: {'width': 150},
+        field_3.id: {'order': 1}
+    })
+    assert GridViewFieldOptions.objects.all().count() == 3
+    assert field_options[1].width == 150
+    assert field_options[1].hidden
+    assert field_options[2].order == 1
+
+    # The primary field can't be hidden.
+    visible_fields = grid_view.get_visible_fields().order_by('id')
+    assert [field.id for field in visible_fields] == [field_1.id, field_3.id]
+    visible_fields = grid_view.get_visible_fields([field_2.id, field_3.id])
+    assert [field.id for field in visible_fields] == [field_3.id]
+
+    # The fields that have already been fetched are filtered in the same way.
+    fields = [field_1, field_2, field_3]
+    visible_fields = grid_view.get_visible_fields(fields=fields)
+    assert [field.id for field in visible_fields] == [field_1.id, field_3.id]
+    visible_fields = grid_view.get_visible_fields(
+        [field_2.id, field_3.id], fields, grid_view.get_field_options(fields)
+    )
+    assert [field.id for field in visible_fields] == [field_3.id]
@@ -0,0 +1,126 @@
+import pytest
+
+from asgiref.sync import async_to_sync
+from channels.db import database_sync_to_async
+from channels.testing import WebsocketCommunicator
+
+from django.db import transaction
+
+from baserow.config.routing import application
+from baserow.core.models import GroupUser
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
+
+
+async def connect(table, token):
+    communicator = WebsocketCommunicator(
+        application,
+        f'/ws/database/tables/{table.id}/?jwt_token={token}'
+    )
+    connected, _ = await communicator.connect()
+    return communicator, connected
+
+
+@pytest.mark.django_db(transaction=True)
+def test_table_consumer_authentication(data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    table_2 = data_fixture.create_database_table()
+
+    async def run():
+        communicator, connected = await connect(table, 'invalid')
+        assert not connected
+
+        communicator, connected = await connect(table_2, token)
+        assert not connected
+
+        communicator, connected = await connect(table, token)
+        assert connected
+        await communicator.disconnect()
+
+    async_to_sync(run)()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_table_consumer_receives_events(data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name='Text')
+    number_field = data_fixture.create_number_field(table=table, name='Number',
+                                                    number_type='DECIMAL',
+                                                    number_decimal_places=2)
+    text_name = f'field_{text_field.id}'
+    number_name = f'field_{number_field.id}'
+    row_handler = RowHandler()
+
+    def change_rows():
+        with transaction.atomic():
+            row = row_handler.create_row(user, table, {text_field.id: 'A'})
+            row_handler.update_row(user, table, row.id, {number_field.id: '1.5'})
+            row_handler.delete_row(user, table, row.id)
+        return row.id
+
+    async def run():
+        communicator, connected = await connect(table, token)
+        assert connected
+
+        row_id = await database_sync_to_async(change_rows)()
+        assert await communicator.receive_json_from() == {
+            'type': 'table_events',
+            'table_id': table.id,
+            'events': [
+                {
+                    'type': 'row_created',
+                    'row_id': row_id,
+                    'version': 1,
+                    'values': {text_name: 'A', number_name: None}
+                },
+                {
+                    'type': 'row_updated',
+                    'row_id': row_id,
+                    'version': 2,
+                    'values': {number_name: '1.50'}
+                },
+                {'type': 'row_deleted', 'row_id': row_id}
+            ]
+        }
+
+        field = await database_sync_to_async(FieldHandler().create_field)(
+            user, table, 'boolean', name='Bool'
+        )
+        message = await communicator.receive_json_from()
+        assert message['events'] == [{
+            'type': 'field_created',
+            'field_id': field.id,
+            'name': 'Bool',
+            'field_type': 'boolean'
+        }]
+
+        await communicator.disconnect()
+
+    async_to_sync(run)()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_table_consumer_closes_without_access(data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    user_2 = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_user_group(group=table.database.group, user=user_2)
+    text_field = data_fixture.create_text_field(table=table, name='Text')
+
+    def remove_user_and_create_row():
+        GroupUser.objects.filter(user=user).delete()
+        RowHandler().create_row(user_2, table, {text_field.id: 'A'})
+
+    async def run():
+        communicator, connected = await connect(table, token)
+        assert connected
+
+        # The user is removed from the group after connecting, so the events are
+        # not delivered anymore and the connection is closed instead.
+        await database_sync_to_async(remove_user_and_create_row)()
+        assert await communicator.receive_output() == {'type': 'websocket.close'}
+        await communicator.disconnect()
+
+    async_to_sync(run)()
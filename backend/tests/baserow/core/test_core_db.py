@@ -0,0 +1,54 @@
+import pytest
+
+from baserow.core.db import specific_iterator
+from baserow.contrib.database.fields.models import (
+    Field, TextField, NumberField, BooleanField
+)
+
+
+@pytest.mark.django_db
+def test_specific_iterator(data_fixture, django_assert_num_queries):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, order=1)
+    number_field = data_fixture.create_number_field(table=table, order=2)
+    boolean_field = data_fixture.create_boolean_field(table=table, order=3)
+    text_field_2 = data_fixture.create_text_field(table=table, order=4)
+
+    fields = Field.objects.filter(table=table).order_by('order')
+
+    with django_assert_num_queries(4):
+        specific_fields = specific_iterator(fields)
+
+    assert [field.id for field in specific_fields] == [
+        text_field.id, number_field.id, boolean_field.id, text_field_2.id
+    ]
+    assert isinstance(specific_fields[0], TextField)
+    assert isinstance(specific_fields[1], NumberField)
+    assert isinstance(specific_fields[2], BooleanField)
+    assert isinstance(specific_fields[3], TextField)
+
+    hooked_models = []
+
+    def hook(model, queryset):
+        hooked_models.append(model)
+        return queryset.select_related('table')
+
+    specific_fields = specific_iterator(fields, per_content_type_queryset_hook=hook)
+    assert set(hooked_models) == {TextField, NumberField, BooleanField}
+
+    with django_assert_num_queries(0):
+        assert specific_fields[0].table.id == table.id
+
+
+@pytest.mark.django_db
+def test_any_lookup(data_fixture):
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+    row_1 = model.objects.create()
+    row_2 = model.objects.create()
+    model.objects.create()
+
+    queryset = model.objects.filter(id__any=[row_1.id, row_2.id, 9999])
+    assert '= ANY(' in str(queryset.query)
+    assert [row.id for row in queryset.order_by('id')] == [row_1.id, row_2.id]
+    assert model.objects.filter(id__any=[]).count() == 0
@@ -0,0 +1,112 @@
+import pytest
+import threading
+
+from django.db import connection
+
+from baserow.core.db_backends.postgresql_pool.base import Database
+from baserow.core.db_backends.postgresql_pool.pool import ConnectionPool, PoolTimeout
+
+
+def create_pool(**kwargs):
+    conn_params = connection.get_connection_params()
+    return ConnectionPool('test', lambda: Database.connect(**conn_params), **kwargs)
+
+
+def get_backend_pid(raw_connection):
+    with raw_connection.cursor() as cursor:
+        cursor.execute('SELECT pg_backend_pid()')
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.django_db
+def test_connection_pool_reuses_connections():
+    pool = create_pool(max_size=1, timeout=0.1)
+
+    raw_connection = pool.checkout()
+    assert pool.size == 1
+    assert pool.idle == 0
+
+    with pytest.raises(PoolTimeout):
+        pool.checkout()
+
+    with raw_connection.cursor() as cursor:
+        cursor.execute("SET lock_timeout = '1s'")
+        cursor.execute('SELECT 1')
+    pool.release(raw_connection)
+    assert pool.idle == 1
+
+    # The same connection is handed out again, but the transaction and the session
+    # settings have been reset.
+    assert pool.checkout() is raw_connection
+    assert raw_connection.get_transaction_status() == 0
+    with raw_connection.cursor() as cursor:
+        cursor.execute("SELECT current_setting('lock_timeout')")
+        assert cursor.fetchone()[0] == '0'
+
+    pool.release(raw_connection)
+    pool.close()
+    assert pool.size == 0
+    assert raw_connection.closed
+
+
+@pytest.mark.django_db
+def test_connection_pool_waits_for_released_connection():
+    pool = create_pool(max_size=1, timeout=5)
+    raw_connection = pool.checkout()
+    checked_out = []
+
+    thread = threading.Thread(target=lambda: checked_out.append(pool.checkout()))
+    thread.start()
+    pool.release(raw_connection)
+    thread.join()
+
+    assert checked_out == [raw_connection]
+    pool.release(raw_connection)
+    pool.close()
+
+
+@pytest.mark.django_db
+def test_connection_pool_discards_broken_connections():
+    pool = create_pool(max_size=2, health_check_interval=0)
+
+    raw_connection = pool.checkout()
+    raw_connection.close()
+    pool.release(raw_connection)
+    assert pool.size == 0
+
+    raw_connection = pool.checkout()
+    other_connection = pool.checkout()
+    pid = get_backend_pid(raw_connection)
+    pool.release(raw_connection)
+
+    with other_connection.cursor() as cursor:
+        cursor.execute('SELECT pg_terminate_backend(%s)', [pid])
+    pool.release(other_connection)
+
+    # The health check detects that the terminated connection is broken.
+    new_connection = pool.checkout()
+    assert new_connection is other_connection
+    new_connection_2 = pool.checkout()
+    assert new_connection_2 is not raw_connection
+    assert get_backend_pid(new_connection_2) != pid
+    assert pool.size == 2
+
+    pool.release(new_connection)
+    pool.release(new_connection_2)
+    pool.close()
+
+
+@pytest.mark.django_db
+def test_database_wrapper_releases_connection_to_pool():
+    wrapper = connection.copy()
+    wrapper.ensure_connection()
+    raw_connection = wrapper.connection
+    idle = wrapper.pool.idle
+
+    wrapper.close()
+    assert not raw_connection.closed
+    assert wrapper.pool.idle == idle + 1
+
+    wrapper.ensure_connection()
+    assert wrapper.connection is raw_connection
+    wrapper.close()
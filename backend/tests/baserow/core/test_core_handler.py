@@ -5,7 +5,8 @@ from django.db import connection
 from baserow.core.handler import CoreHandler
 from baserow.core.models import Group, GroupUser, Application
 from baserow.core.exceptions import UserNotInGroupError, ApplicationTypeDoesNotExist
-from baserow.contrib.database.models import Database, Table
+from baserow.contrib.database.models import Database, Table, PendingTableDrop
+from baserow.contrib.database.table.handler import TableHandler
 
 
 @pytest.mark.django_db
@@ -64,6 +65,8 @@ def test_delete_group(data_fixture):
 
     assert Database.objects.all().count() == 0
     assert Table.objects.all().count() == 0
+    assert PendingTableDrop.objects.get().db_table == f'database_table_{table.id}'
+    TableHandler().drop_pending_tables()
     assert f'database_table_{table.id}' not in connection.introspection.table_names()
     assert Group.objects.all().count() == 2
     assert GroupUser.objects.all().count() == 2
@@ -176,4 +179,6 @@ def test_delete_database_application(data_fixture):
 
     assert Database.objects.all().count() == 0
     assert Table.objects.all().count() == 0
+    assert PendingTableDrop.objects.get().db_table == f'database_table_{table.id}'
+    TableHandler().drop_pending_tables()
     assert f'database_table_{table.id}' not in connection.introspection.table_names()
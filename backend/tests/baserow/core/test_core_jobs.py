@@ -0,0 +1,222 @@
+import pytest
+import time
+
+from datetime import timedelta
+
+from django.utils import timezone
+
+from rest_framework import serializers
+
+from baserow.core.jobs.models import Job
+from baserow.core.jobs.handler import JobHandler, JobHeartbeat
+from baserow.core.jobs.registries import JobType, job_type_registry
+from baserow.core.jobs.exceptions import (
+    JobDoesNotExist, JobAlreadyFinished, JobTypeDoesNotExist
+)
+
+
+class TemporaryJobSerializer(serializers.Serializer):
+    steps = serializers.IntegerField()
+
+
+class TemporaryJobType(JobType):
+    type = 'temporary_job'
+    serializer_class = TemporaryJobSerializer
+
+    def prepare_arguments(self, user, values):
+        if values['steps'] < 0:
+            raise ValueError('The steps cannot be negative.')
+        return {'steps': values['steps']}
+
+    def run(self, job, progress):
+        steps = job.arguments['steps']
+        child = progress.create_child(100, steps)
+        for step in range(0, steps):
+            if step == 13:
+                raise Exception('Unlucky step.')
+            child.increment()
+        return {'steps': steps}
+
+
+@pytest.fixture
+def temporary_job_type():
+    job_type = TemporaryJobType()
+    job_type_registry.register(job_type)
+    yield job_type
+    job_type_registry.unregister(job_type)
+
+
+@pytest.mark.django_db
+def test_create_and_get_job(data_fixture, temporary_job_type):
+    user = data_fixture.create_user()
+    user_2 = data_fixture.create_user()
+    handler = JobHandler()
+
+    with pytest.raises(JobTypeDoesNotExist):
+        handler.create_job(user, 'NOT_EXISTING')
+
+    with pytest.raises(ValueError):
+        handler.create_job(user, 'temporary_job', steps=-1)
+
+    job = handler.create_job(user, 'temporary_job', steps=2)
+    assert job.user_id == user.id
+    assert job.type == 'temporary_job'
+    assert job.state == 'pending'
+    assert job.progress_percentage == 0
+    assert job.arguments == {'steps': 2}
+
+    assert handler.get_job(user, job.id).id == job.id
+
+    with pytest.raises(JobDoesNotExist):
+        handler.get_job(user_2, job.id)
+
+    with pytest.raises(JobDoesNotExist):
+        handler.get_job(user, 99999)
+
+
+@pytest.mark.django_db
+def test_claim_and_run_job(data_fixture, temporary_job_type):
+    user = data_fixture.create_user()
+    handler = JobHandler()
+
+    assert handler.claim_next_job() is None
+
+    job_1 = handler.create_job(user, 'temporary_job', steps=4)
+    job_2 = handler.create_job(user, 'temporary_job', steps=20)
+
+    job = handler.claim_next_job()
+    assert job.id == job_1.id
+    assert job.state == 'running'
+    assert job.started_on
+
+    job = handler.run_job(job)
+    job.refresh_from_db()
+    assert job.state == 'finished'
+    assert job.progress_percentage == 100
+    assert job.result == {'steps': 4}
+    assert job.finished_on
+
+    job = handler.claim_next_job()
+    assert job.id == job_2.id
+    handler.run_job(job)
+    job.refresh_from_db()
+    assert job.state == 'failed'
+    assert job.error == 'Unlucky step.'
+    assert job.progress_percentage == 65
+
+    assert handler.claim_next_job() is None
+
+
+@pytest.mark.django_db
+def test_cancel_job(data_fixture, temporary_job_type):
+    user = data_fixture.create_user()
+    user_2 = data_fixture.create_user()
+    handler = JobHandler()
+
+    job = handler.create_job(user, 'temporary_job', steps=4)
+
+    with pytest.raises(JobDoesNotExist):
+        handler.cancel_job(user_2, job)
+
+    job = handler.cancel_job(user, job)
+    assert job.state == 'cancelled'
+    assert job.finished_on
+    assert handler.claim_next_job() is None
+
+    with pytest.raises(JobAlreadyFinished):
+        handler.cancel_job(user, job)
+
+    job = handler.create_job(user, 'temporary_job', steps=4)
+    job = handler.claim_next_job()
+    job = handler.cancel_job(user, job)
+    assert job.state == 'running'
+    assert job.cancel_requested
+
+    handler.run_job(Job.objects.get(id=job.id))
+    job.refresh_from_db()
+    assert job.state == 'cancelled'
+    assert job.progress_percentage == 0
+    assert job.result == {}
+
+
+@pytest.mark.django_db
+def test_fail_stale_jobs(data_fixture, temporary_job_type, settings):
+    user = data_fixture.create_user()
+    handler = JobHandler()
+
+    pending_job = handler.create_job(user, 'temporary_job', steps=1)
+    stale_job = handler.create_job(user, 'temporary_job', steps=1)
+    running_job = handler.create_job(user, 'temporary_job', steps=1)
+    Job.objects.filter(id__in=[stale_job.id, running_job.id]).update(state='running')
+    Job.objects.filter(id__in=[pending_job.id, stale_job.id]).update(
+        updated_on=timezone.now() - timedelta(seconds=100)
+    )
+
+    assert handler.fail_stale_jobs(timeout=200) == 0
+
+    settings.JOB_HEARTBEAT_TIMEOUT = 50
+    assert handler.fail_stale_jobs() == 1
+
+    stale_job.refresh_from_db()
+    assert stale_job.state == 'failed'
+    assert stale_job.error == 'The worker running the job stopped responding.'
+    assert stale_job.finished_on
+
+    pending_job.refresh_from_db()
+    running_job.refresh_from_db()
+    assert pending_job.state == 'pending'
+    assert running_job.state == 'running'
+
+
+class SleepingJobType(JobType):
+    type = 'sleeping_job'
+
+    def run(self, job, progress):
+        # Doesn't report any progress, only the heartbeat keeps the job alive.
+        time.sleep(0.3)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_job_heartbeat(data_fixture, settings):
+    job_type = SleepingJobType()
+    job_type_registry.register(job_type)
+    settings.JOB_HEARTBEAT_INTERVAL = 0.05
+    user = data_fixture.create_user()
+    handler = JobHandler()
+
+    try:
+        job = handler.create_job(user, 'sleeping_job')
+        job = handler.claim_next_job()
+        Job.objects.filter(id=job.id).update(
+            updated_on=timezone.now() - timedelta(seconds=100)
+        )
+
+        with JobHeartbeat(job):
+            time.sleep(0.3)
+            assert handler.fail_stale_jobs(timeout=50) == 0
+
+        job.refresh_from_db()
+        assert job.state == 'running'
+        assert job.updated_on > timezone.now() - timedelta(seconds=50)
+
+        job = handler.run_job(job)
+        assert job.state == 'finished'
+    finally:
+        job_type_registry.unregister(job_type)
+
+
+@pytest.mark.django_db
+def test_run_job_does_not_overwrite_stale_state(data_fixture, temporary_job_type):
+    user = data_fixture.create_user()
+    handler = JobHandler()
+
+    handler.create_job(user, 'temporary_job', steps=1)
+    job = handler.claim_next_job()
+
+    # Another worker considered the job stale while it was still running.
+    handler.fail_stale_jobs(timeout=-1)
+
+    job = handler.run_job(job)
+    assert job.state == 'failed'
+    assert job.error == 'The worker running the job stopped responding.'
+    assert job.result == {}
@@ -0,0 +1,79 @@
+import pytest
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.shortcuts import reverse
+
+from prometheus_client import REGISTRY
+
+from baserow.core.metrics import MetricsMiddleware, record_timing
+
+
+def get_sample(name, view, method='GET'):
+    return REGISTRY.get_sample_value(name, {'view': view, 'method': method}) or 0
+
+
+@pytest.mark.django_db
+def test_metrics_middleware(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    view_name = 'api_v0:database:views:grid:list'
+
+    # Outside of a request the timings are not recorded.
+    with record_timing('get_model'):
+        table.get_model()
+
+    requests = get_sample('baserow_http_request_duration_seconds_count', view_name)
+    queries = get_sample('baserow_http_request_queries_sum', view_name)
+    sql_seconds = get_sample('baserow_http_request_sql_seconds_sum', view_name)
+    get_model_seconds = get_sample('baserow_http_request_get_model_seconds_sum',
+                                   view_name)
+    serialization = get_sample('baserow_http_request_row_serialization_seconds_count',
+                               view_name)
+
+    response = api_client.get(
+        reverse('api_v0:database:views:grid:list', kwargs={'view_id': grid.id}),
+        HTTP_AUTHORIZATION=f'JWT {token}'
+    )
+    assert response.status_code == 200
+
+    assert get_sample('baserow_http_request_duration_seconds_count',
+                      view_name) == requests + 1
+    assert get_sample('baserow_http_request_queries_sum', view_name) > queries
+    assert get_sample('baserow_http_request_sql_seconds_sum', view_name) > sql_seconds
+    assert get_sample('baserow_http_request_get_model_seconds_sum',
+                      view_name) > get_model_seconds
+    assert get_sample('baserow_http_request_row_serialization_seconds_count',
+                      view_name) == serialization + 1
+    assert REGISTRY.get_sample_value('baserow_http_requests_total', {
+        'view': view_name, 'method': 'GET', 'status': '200'
+    }) >= 1
+
+    response = api_client.get('/metrics')
+    assert response.status_code == 200
+    assert response['Content-Type'].startswith('text/plain')
+    content = response.content.decode()
+    assert 'baserow_http_request_duration_seconds_bucket{' in content
+    assert f'view="{view_name}"' in content
+    assert 'baserow_db_pool_connections' in content
+
+
+def test_metrics_view(api_client, settings):
+    settings.METRICS_TOKEN = 'secret'
+    response = api_client.get('/metrics')
+    assert response.status_code == 403
+
+    response = api_client.get('/metrics', HTTP_AUTHORIZATION='Bearer wrong')
+    assert response.status_code == 403
+
+    response = api_client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret')
+    assert response.status_code == 200
+    assert 'baserow_http_requests_total' in response.content.decode()
+
+    settings.METRICS_ENABLED = False
+    response = api_client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret')
+    assert response.status_code == 404
+
+    with pytest.raises(MiddlewareNotUsed):
+        MetricsMiddleware(lambda request: None)
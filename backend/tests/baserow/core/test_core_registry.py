@@ -4,6 +4,7 @@ from django.core.exceptions import ImproperlyConfigured
 
 from rest_framework.serializers import IntegerField, ModelSerializer
 
+from baserow.core.models import Application
 from baserow.contrib.database.models import Database
 from baserow.core.registry import (
     Instance, ModelInstanceMixin, Registry, ModelRegistryMixin,
@@ -125,3 +126,40 @@ def test_get_serializer(data_fixture):
 
     serializer = registry.get_serializer(database, base_class=TemporarySerializer)
     assert 'id' in serializer.data
+
+
+@pytest.mark.django_db
+def test_serialize_many(data_fixture, django_assert_num_queries):
+    database_1 = data_fixture.create_database_application(name='1')
+    database_2 = data_fixture.create_database_application(name='2')
+    registry = CustomFieldsTemporaryRegistry()
+    registry.register(TemporaryGroupInstanceType())
+
+    applications = Application.objects.filter(
+        id__in=[database_2.id, database_1.id]
+    ).order_by('-id')
+
+    with django_assert_num_queries(2):
+        data = registry.serialize_many(applications, base_class=TemporarySerializer)
+
+    assert data == [
+        {'id': database_2.id, 'name': 2},
+        {'id': database_1.id, 'name': 1}
+    ]
+
+
+def test_get_serializer_class_is_cached():
+    instance_type = TemporaryGroupInstanceType()
+
+    serializer_class = instance_type.get_serializer_class()
+    assert instance_type.get_serializer_class() is serializer_class
+
+    serializer_class_2 = instance_type.get_serializer_class(
+        base_class=TemporarySerializer)
+    assert serializer_class_2 is not serializer_class
+    assert issubclass(serializer_class_2, TemporarySerializer)
+    assert instance_type.get_serializer_class(
+        base_class=TemporarySerializer) is serializer_class_2
+
+    # The cache must be per instance type.
+    assert TemporaryGroupInstanceType().get_serializer_class() is not serializer_class
@@ -1,6 +1,6 @@
 from baserow.core.utils import (
     extract_allowed, set_allowed_attrs, to_pascal_case, to_snake_case,
-    remove_special_characters
+    remove_special_characters, Progress
 )
 
 
@@ -45,3 +45,30 @@ def test_to_snake_case():
 def test_remove_special_characters():
     assert remove_special_characters('Test @#$% .. ;;') == 'Test'
     assert remove_special_characters('Test @#$% ..', remove_spaces=False) == 'Test  '
+
+
+def test_progress():
+    percentages = []
+    progress = Progress(200, callback=lambda percentage: percentages.append(percentage))
+
+    progress.increment(1)
+    assert progress.percentage == 0
+    assert percentages == []
+
+    progress.increment(9)
+    assert progress.percentage == 5
+    assert percentages == [5]
+
+    child = progress.create_child(represents_progress=100, total=4)
+    child.increment()
+    assert child.percentage == 25
+    assert progress.percentage == 17
+    child.increment(3, failed=2)
+    assert child.percentage == 100
+    assert child.failed == 2
+    assert progress.percentage == 55
+    assert progress.failed == 2
+    assert percentages == [5, 17, 55]
+
+    progress.increment(200)
+    assert progress.percentage == 100
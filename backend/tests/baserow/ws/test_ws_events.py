@@ -0,0 +1,100 @@
+import pytest
+from unittest.mock import patch
+
+from django.db import transaction
+
+from baserow.ws.events import publish_event
+
+
+class Rollback(Exception):
+    pass
+
+
+def collect_sent_messages():
+    messages = []
+
+    def group_send(group, message):
+        messages.append((group, message['events']))
+
+    return messages, patch('baserow.ws.events.async_to_sync',
+                           lambda function: group_send)
+
+
+@pytest.mark.django_db(transaction=True, databases=['default', 'user_tables'])
+def test_publish_event():
+    messages, async_to_sync = collect_sent_messages()
+
+    with async_to_sync:
+        publish_event('group_1', {'id': 1})
+        assert messages == [('group_1', [{'id': 1}])]
+        messages.clear()
+
+        # The events of a transaction are sent in one message per group after commit.
+        with transaction.atomic():
+            publish_event('group_1', {'id': 2})
+            publish_event('group_2', {'id': 3})
+            publish_event('group_1', {'id': 4})
+            assert messages == []
+        assert messages == [
+            ('group_1', [{'id': 2}, {'id': 4}]),
+            ('group_2', [{'id': 3}])
+        ]
+        messages.clear()
+
+        # Nothing is sent if the transaction rolls back.
+        with pytest.raises(Rollback):
+            with transaction.atomic():
+                publish_event('group_1', {'id': 5})
+                raise Rollback()
+
+        with transaction.atomic():
+            publish_event('group_1', {'id': 6})
+        assert messages == [('group_1', [{'id': 6}])]
+        messages.clear()
+
+        # The events published in a savepoint that is rolled back are not sent.
+        with transaction.atomic():
+            with pytest.raises(Rollback):
+                with transaction.atomic():
+                    publish_event('group_1', {'id': 7})
+                    raise Rollback()
+            publish_event('group_1', {'id': 8})
+        assert messages == [('group_1', [{'id': 8}])]
+        messages.clear()
+
+        # The events published in a savepoint are not sent if that savepoint is
+        # rolled back, even if the transaction already had events before it.
+        with transaction.atomic():
+            publish_event('group_1', {'id': 9})
+            with pytest.raises(Rollback):
+                with transaction.atomic():
+                    publish_event('group_1', {'id': 10})
+                    raise Rollback()
+            with transaction.atomic():
+                publish_event('group_1', {'id': 11})
+            publish_event('group_1', {'id': 12})
+        assert messages == [('group_1', [{'id': 9}, {'id': 11}, {'id': 12}])]
+        messages.clear()
+
+        # The batch is replaced if the savepoint in which it was created rolls back.
+        with transaction.atomic():
+            with pytest.raises(Rollback):
+                with transaction.atomic():
+                    publish_event('group_1', {'id': 13})
+                    publish_event('group_2', {'id': 14})
+                    raise Rollback()
+            publish_event('group_2', {'id': 15})
+        assert messages == [('group_2', [{'id': 15}])]
+        messages.clear()
+
+        # The events that are published on another database are sent when the
+        # transaction of that database commits.
+        with transaction.atomic(using='user_tables'):
+            with transaction.atomic():
+                publish_event('group_1', {'id': 16})
+                publish_event('group_1', {'id': 17}, using='user_tables')
+            assert messages == [('group_1', [{'id': 16}])]
+        assert messages == [
+            ('group_1', [{'id': 16}]),
+            ('group_1', [{'id': 17}])
+        ]
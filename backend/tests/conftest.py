@@ -1,4 +1,5 @@
 import pytest
+from contextlib import contextmanager
 
 
 @pytest.fixture
@@ -11,3 +12,35 @@ def data_fixture():
 def api_client():
     from rest_framework.test import APIClient
     return APIClient()
+
+
+@pytest.fixture
+def capture_on_commit_callbacks():
+    """
+    Because the tests run inside a transaction that is never committed, the
+    transaction.on_commit callbacks are never called. Within this context manager the
+    callbacks that are registered on the provided connection are captured and, if
+    execute is True, called when the context exits.
+
+    Example:
+        with capture_on_commit_callbacks(execute=True) as callbacks:
+            RowHandler().create_row(user, table)
+    """
+
+    from django.db import connections, DEFAULT_DB_ALIAS
+
+    @contextmanager
+    def capture(using=DEFAULT_DB_ALIAS, execute=False):
+        connection = connections[using]
+        start = len(connection.run_on_commit)
+        callbacks = []
+
+        try:
+            yield callbacks
+        finally:
+            for sids, callback in connection.run_on_commit[start:]:
+                callbacks.append(callback)
+                if execute:
+                    callback()
+
+    return capture
@@ -1,10 +1,15 @@
 from django.db import connection
 
 from baserow.contrib.database.fields.models import TextField, NumberField, BooleanField
+from baserow.contrib.database.table.models import TABLE_STORAGE_JSONB
 
 
 class FieldFixtures:
     def create_model_field(self, table, field):
+        # The values of a table with the JSONB storage are stored in one column.
+        if table.storage == TABLE_STORAGE_JSONB:
+            return
+
         with connection.schema_editor() as schema_editor:
             to_model = table.get_model(field_ids=[field.id])
             model_field = to_model._meta.get_field(field.db_column)
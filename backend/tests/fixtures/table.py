@@ -1,5 +1,6 @@
 from django.db import connection
 
+from baserow.contrib.database.db.schema import create_model
 from baserow.contrib.database.table.models import Table
 
 
@@ -18,6 +19,6 @@ class TableFixtures:
 
         if create_table:
             with connection.schema_editor() as schema_editor:
-                schema_editor.create_model(table.get_model())
+                create_model(schema_editor, table.get_model())
 
         return table
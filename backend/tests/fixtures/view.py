@@ -1,4 +1,4 @@
-from baserow.contrib.database.views.models import GridView
+from baserow.contrib.database.views.models import GridView, GridViewFieldOptions
 
 
 class ViewFixtures:
@@ -13,3 +13,7 @@ class ViewFixtures:
             kwargs['order'] = 0
 
         return GridView.objects.create(**kwargs)
+
+    def create_grid_view_field_options(self, grid_view, field, **kwargs):
+        return GridViewFieldOptions.objects.create(grid_view=grid_view, field=field,
+                                                   **kwargs)
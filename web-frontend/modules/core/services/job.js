@@ -0,0 +1,7 @@
+import { client } from './client'
+
+export default {
+  get(id) {
+    return client.get(`/jobs/${id}/`)
+  }
+}
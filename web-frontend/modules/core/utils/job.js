@@ -0,0 +1,22 @@
+import JobService from '@baserow/modules/core/services/job'
+
+/**
+ * Polls the job with the provided id until it has ended. The promise is resolved
+ * with the job if it has finished successfully and rejected if it has failed or
+ * has been cancelled.
+ */
+export async function waitForJob(jobId, interval = 1000) {
+  while (true) {
+    const { data } = await JobService.get(jobId)
+
+    if (data.state === 'finished') {
+      return data
+    }
+
+    if (data.state === 'failed' || data.state === 'cancelled') {
+      throw new Error(data.error || `The job has been ${data.state}.`)
+    }
+
+    await new Promise(resolve => setTimeout(resolve, interval))
+  }
+}
@@ -1,6 +1,7 @@
 import { FieldType } from '@baserow/modules/database/fieldTypes'
 import FieldService from '@baserow/modules/database/services/field'
 import { clone } from '@baserow/modules/core/utils/object'
+import { waitForJob } from '@baserow/modules/core/utils/job'
 
 export function populateField(field, getters) {
   const type = getters.getType(field.type)
@@ -160,6 +161,12 @@ export const actions = {
     postData.type = type
 
     let { data } = await FieldService.update(field.id, postData)
+    // Changing the type of a field is done by a background job, the field is
+    // fetched again when that job has finished.
+    if (data.job_id !== undefined) {
+      await waitForJob(data.job_id)
+      data = (await FieldService.get(field.id)).data
+    }
     data = populateField(data, getters)
     if (field.primary) {
       commit('SET_PRIMARY', data)
@@ -2,6 +2,7 @@ import axios from 'axios'
 
 import TableService from '@baserow/modules/database/services/table'
 import { DatabaseApplicationType } from '@baserow/modules/database/applicationTypes'
+import { waitForJob } from '@baserow/modules/core/utils/job'
 
 export function populateTable(table) {
   table._ = {
@@ -72,7 +73,11 @@ export const actions = {
    */
   async delete({ commit, dispatch }, { database, table }) {
     try {
-      await TableService.delete(table.id)
+      const { data } = await TableService.delete(table.id)
+      // The table is deleted by a background job.
+      if (data && data.job_id !== undefined) {
+        await waitForJob(data.job_id)
+      }
       return dispatch('forceDelete', { database, table })
     } catch (error) {
       if (error.response && error.response.status === 404) {